@@ -2,17 +2,34 @@
 # { "Depends": "py-genlayer:latest" }
 
 import json
+from dataclasses import dataclass
 
 from genlayer import *
 
+MAX_EVENTS_PAGE = 100  # Maximum number of events returned by get_events
+
+
+@allow_storage
+@dataclass
+class BalanceEvent:
+    kind: str  # "mint" or "transfer"
+    account: Address
+    balance: u256  # Balance of the account after the change
+
 
 class LlmErc20(gl.Contract):
     balances: TreeMap[Address, u256]
     owner: Address
+    events: DynArray[BalanceEvent]  # Append-only feed of balance changes; seq = index + 1
+    total_supply: u256  # Sum of all balances
+    holder_count: u256  # Number of addresses with a non-zero balance
 
     def __init__(self, total_supply: int) -> None:
         self.owner = gl.message.sender_address
-        self.balances[gl.message.sender_address] = u256(total_supply)
+        self.total_supply = u256(0)
+        self.holder_count = u256(0)
+        self._set_balance(gl.message.sender_address, total_supply, "mint")
+        self.total_supply = u256(total_supply)
 
     @gl.public.write
     def transfer(self, amount: int, to_address: str) -> None:
@@ -60,8 +77,52 @@ The total sum of all balances should remain the same before and after the transa
         )
         print("final_result: ", final_result)
         result_json = json.loads(final_result)
+        supply_change = 0
         for k, v in result_json["updated_balances"].items():
-            self.balances[Address(k)] = v
+            supply_change += self._set_balance(Address(k), int(v), "transfer")
+
+        # Conservation check: a transfer only moves coins, so the running supply must not change
+        if supply_change != 0:
+            raise Exception(f"Transfer would change the total supply by {supply_change}")
+
+    @gl.public.write
+    def transfer_batch(self, amounts: DynArray[int], to_addresses: DynArray[str]) -> None:
+        """
+        Transfer coins from the sender to several recipients in a single transaction.
+        Unlike transfer, the balances are updated deterministically without an LLM round:
+        the sender's balance is checked once against the total, and every affected
+        balance is written once.
+
+        Args:
+            amounts: The amount of coins to send to each recipient
+            to_addresses: The addresses that will receive the coins, in the same order as amounts
+        """
+        if len(amounts) != len(to_addresses):
+            raise Exception(
+                f"amounts length ({len(amounts)}) must match to_addresses length ({len(to_addresses)})"
+            )
+
+        sender = gl.message.sender_address
+        total_amount = 0
+        changes = {}  # address -> net balance change
+        for i in range(len(amounts)):
+            amount = int(amounts[i])
+            if amount <= 0:
+                raise Exception("Transfer amount must be greater than zero")
+            recipient = Address(to_addresses[i])
+            changes[recipient] = changes.get(recipient, 0) + amount
+            total_amount += amount
+
+        sender_balance = int(self.balances.get(sender, u256(0)))
+        if sender_balance < total_amount:
+            raise Exception(
+                f"Sender has insufficient balance ({sender_balance}) for transfers ({total_amount})"
+            )
+        changes[sender] = changes.get(sender, 0) - total_amount
+
+        for account, change in changes.items():
+            if change != 0:
+                self._set_balance(account, int(self.balances.get(account, u256(0))) + change, "transfer")
 
     @gl.public.write
     def mint(self, amount: int, to_address: str) -> None:
@@ -78,7 +139,28 @@ The total sum of all balances should remain the same before and after the transa
 
         recipient = Address(to_address)
         current_balance = self.balances.get(recipient, u256(0))
-        self.balances[recipient] = current_balance + u256(amount)
+        self._set_balance(recipient, int(current_balance) + amount, "mint")
+        self.total_supply = self.total_supply + u256(amount)
+
+    def _set_balance(self, account: Address, new_balance: int, kind: str) -> int:
+        """
+        Write an account's balance, keeping holder_count and the event feed up to date.
+
+        Returns:
+            The change in the account's balance
+        """
+        old_balance = int(self.balances.get(account, u256(0)))
+        if new_balance == old_balance:
+            return 0
+
+        self.balances[account] = u256(new_balance)
+        if old_balance == 0:
+            self.holder_count = self.holder_count + u256(1)
+        elif new_balance == 0:
+            self.holder_count = self.holder_count - u256(1)
+
+        self.events.append(BalanceEvent(kind=kind, account=account, balance=u256(new_balance)))
+        return new_balance - old_balance
 
     @gl.public.view
     def get_balances(self) -> dict[str, int]:
@@ -87,3 +169,45 @@ The total sum of all balances should remain the same before and after the transa
     @gl.public.view
     def get_balance_of(self, address: str) -> int:
         return self.balances.get(Address(address), 0)
+
+    @gl.public.view
+    def get_total_supply(self) -> int:
+        return int(self.total_supply)
+
+    @gl.public.view
+    def get_holder_count(self) -> int:
+        return int(self.holder_count)
+
+    @gl.public.view
+    def get_events(self, from_seq: int, limit: int) -> dict:
+        """
+        Returns a page of the balance change feed, starting at sequence number from_seq (1-based).
+        Indexers can follow balances by polling from the last seen sequence number + 1.
+
+        Args:
+            from_seq: Sequence number of the first event to return
+            limit: Maximum number of events to return (capped at MAX_EVENTS_PAGE)
+        """
+        if from_seq < 1:
+            raise Exception("from_seq must be at least 1")
+        if limit < 0:
+            raise Exception("limit cannot be negative")
+
+        end_seq = min(from_seq + min(limit, MAX_EVENTS_PAGE), len(self.events) + 1)
+
+        events = []
+        for seq in range(from_seq, end_seq):
+            event = self.events[seq - 1]
+            events.append(
+                {
+                    "seq": seq,
+                    "kind": event.kind,
+                    "account": event.account.as_hex,
+                    "balance": int(event.balance),
+                }
+            )
+
+        return {
+            "events": events,
+            "event_count": len(self.events),
+        }
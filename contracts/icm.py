@@ -0,0 +1,185 @@
+"""
+Independent Chip Model (ICM) payout engine for PokerTournament stacks.
+
+ICM turns chip stacks into expected shares of the prize pool using the
+Malmuth-Harville model: a player finishes first with probability
+stack / total_chips, and the remaining places are filled the same way
+among the remaining players.
+
+This is a plain Python module (not a GenLayer contract). Feed it the
+player_balances of a PokerTournament, e.g. from get_state, to price a deal
+at a final table or to value an insurance position mid-tournament.
+
+- Up to EXACT_ICM_MAX_PLAYERS players with chips, equities are exact.
+  A bitmask DP is memoized over the set of players already placed.
+- Larger fields use a Monte Carlo estimator. It is vectorized with numpy
+  when numpy is installed and falls back to pure Python otherwise.
+"""
+
+import random
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional, the Monte Carlo estimator falls back to pure Python
+    np = None
+
+EXACT_ICM_MAX_PLAYERS = 20  # Largest field solved exactly by the bitmask DP
+DEFAULT_ICM_TRIALS = 20000  # Simulated finishing orders for the Monte Carlo estimator
+
+
+def icm_equities(
+    stacks: list[int],
+    payouts: list[int],
+    trials: int = DEFAULT_ICM_TRIALS,
+    seed: int = 0,
+) -> list[float]:
+    """
+    Compute the ICM equity of each stack.
+
+    Players with an empty stack have already busted and get 0 equity. The
+    remaining players compete for the first len(alive players) payouts.
+
+    Args:
+        stacks: Chip stack of each player (e.g. PokerTournament player_balances)
+        payouts: Prize for each finishing place, first place first
+        trials: Number of simulated finishing orders when the field is too large to solve exactly
+        seed: Seed of the Monte Carlo estimator, so estimates are reproducible
+
+    Returns:
+        Expected prize of each player, in the same order as stacks
+    """
+    _validate(stacks, payouts)
+
+    alive = [i for i, stack in enumerate(stacks) if stack > 0]
+    equities = [0.0] * len(stacks)
+    if len(alive) == 0:
+        return equities
+
+    alive_stacks = [stacks[i] for i in alive]
+    alive_payouts = list(payouts[: len(alive)])
+
+    if len(alive) <= EXACT_ICM_MAX_PLAYERS:
+        alive_equities = icm_exact(alive_stacks, alive_payouts)
+    else:
+        alive_equities = icm_monte_carlo(alive_stacks, alive_payouts, trials, seed)
+
+    for position, i in enumerate(alive):
+        equities[i] = alive_equities[position]
+    return equities
+
+
+def icm_exact(stacks: list[int], payouts: list[int]) -> list[float]:
+    """
+    Exact ICM equities via a DP over bitmasks of players already placed.
+
+    The probability of reaching a set of placed players does not depend on
+    the order they were placed in, so each set is computed once and shared.
+    Only sets smaller than the number of paid places are expanded, which
+    gives O(n * sum(C(n, k) for k < paid places)) work instead of O(n!).
+
+    Args:
+        stacks: Chip stack of each player (all > 0)
+        payouts: Prize for each finishing place, first place first
+
+    Returns:
+        Expected prize of each player, in the same order as stacks
+    """
+    _validate(stacks, payouts)
+
+    player_count = len(stacks)
+    paid_places = min(len(payouts), player_count)
+    total_chips = sum(stacks)
+    equities = [0.0] * player_count
+
+    # Probability that exactly the players in the mask took the first places
+    layer = {0: 1.0}
+    placed_chips = {0: 0}
+
+    for place in range(paid_places):
+        payout = payouts[place]
+        next_layer = {}
+        next_placed_chips = {}
+
+        for mask, probability in layer.items():
+            remaining_chips = total_chips - placed_chips[mask]
+            for i in range(player_count):
+                bit = 1 << i
+                if mask & bit:
+                    continue
+
+                # Probability that player i takes this place, given the mask is placed
+                step = probability * stacks[i] / remaining_chips
+                equities[i] += step * payout
+
+                next_mask = mask | bit
+                if next_mask in next_layer:
+                    next_layer[next_mask] += step
+                else:
+                    next_layer[next_mask] = step
+                    next_placed_chips[next_mask] = placed_chips[mask] + stacks[i]
+
+        layer = next_layer
+        placed_chips = next_placed_chips
+
+    return equities
+
+
+def icm_monte_carlo(
+    stacks: list[int],
+    payouts: list[int],
+    trials: int = DEFAULT_ICM_TRIALS,
+    seed: int = 0,
+) -> list[float]:
+    """
+    Estimate ICM equities by sampling finishing orders.
+
+    Sorting players by Exp(1) / stack draws a finishing order with exactly
+    the Malmuth-Harville probabilities. This lets a whole batch of trials
+    be drawn with one sort per trial.
+
+    Args:
+        stacks: Chip stack of each player (all > 0)
+        payouts: Prize for each finishing place, first place first
+        trials: Number of simulated finishing orders
+        seed: Seed of the random generator, so estimates are reproducible
+
+    Returns:
+        Estimated expected prize of each player, in the same order as stacks
+    """
+    _validate(stacks, payouts)
+    if trials <= 0:
+        raise ValueError("trials must be greater than zero")
+
+    player_count = len(stacks)
+    place_payouts = list(payouts[:player_count]) + [0] * max(player_count - len(payouts), 0)
+
+    if np is not None:
+        generator = np.random.default_rng(seed)
+        stack_array = np.asarray(stacks, dtype=float)
+        payout_array = np.asarray(place_payouts, dtype=float)
+
+        keys = generator.exponential(size=(trials, player_count)) / stack_array
+        # Finishing place of each player in each trial
+        places = np.argsort(np.argsort(keys, axis=1), axis=1)
+        return (payout_array[places].sum(axis=0) / trials).tolist()
+
+    generator = random.Random(seed)
+    totals = [0.0] * player_count
+    for _ in range(trials):
+        keys = [generator.expovariate(1.0) / stack for stack in stacks]
+        order = sorted(range(player_count), key=keys.__getitem__)
+        for place, i in enumerate(order):
+            totals[i] += place_payouts[place]
+    return [total / trials for total in totals]
+
+
+def _validate(stacks: list[int], payouts: list[int]) -> None:
+    """
+    Reject negative stacks and payouts.
+    """
+    for stack in stacks:
+        if stack < 0:
+            raise ValueError("Stacks cannot be negative")
+    for payout in payouts:
+        if payout < 0:
+            raise ValueError("Payouts cannot be negative")
@@ -1,11 +1,49 @@
 # v0.1.0
 # { "Depends": "py-genlayer:latest" }
 
+import bisect
+import hashlib
+import itertools
 import json
 import typing
 from dataclasses import dataclass
 from genlayer import *
 
+# Layout of NFTMetadata.scores, from the low bits up:
+# lucky, skill, value_extraction, hand_strength (SCORE_BITS each), bluff_success (1 bit),
+# then opponents_count in all remaining bits
+SCORE_FIELDS = ["lucky", "skill", "value_extraction", "hand_strength"]
+SCORE_BITS = 4  # Wide enough for a 0-10 score
+SCORE_MASK = (1 << SCORE_BITS) - 1
+BLUFF_SUCCESS_SHIFT = len(SCORE_FIELDS) * SCORE_BITS
+OPPONENTS_COUNT_SHIFT = BLUFF_SUCCESS_SHIFT + 1
+MAX_OPPONENTS_COUNT = (1 << (256 - OPPONENTS_COUNT_SHIFT)) - 1  # Largest opponents_count the u256 scores can hold
+MAX_QUERY_PAGE = 100  # Maximum number of token IDs returned by query_tokens
+LEADERBOARD_ATTRIBUTES = ["skill", "lucky", "pot_size"]  # Attributes with a maintained leaderboard
+LEADERBOARD_SIZE = 100  # Number of tokens kept on each leaderboard
+LEADERBOARD_ID_BITS = 64  # Low bits of a leaderboard entry, holding the inverted token ID
+LEADERBOARD_ID_MASK = (1 << LEADERBOARD_ID_BITS) - 1
+MAX_POT_SIZE = (1 << (256 - LEADERBOARD_ID_BITS)) - 1  # Largest pot_size that fits above the ID in a u256 leaderboard entry
+MAX_EVENTS_PAGE = 100  # Maximum number of events returned by get_events
+TROPHY_HANDS_PAGE = 100  # Hands read per mint_tournament_trophies call (PokerTournament MAX_HANDS_PAGE)
+
+# Card notation shared with PokerTournament: suit symbol followed by rank, e.g. "♠A♥10"
+SUIT_SYMBOLS = ["♠", "♥", "♦", "♣"]
+CARD_RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+UNKNOWN_CARD = 255  # Card code used when a card could not be parsed
+HAND_CATEGORIES = [
+    "High Card",
+    "Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+]  # Hand category names, indexed by category strength
+TROPHY_HAND_STRENGTH = [1, 2, 3, 4, 5, 6, 7, 8, 9]  # hand_strength per category; a royal flush scores 10
+TROPHY_LUCK = [0, 0, 1, 2, 3, 4, 5, 7, 9]  # Base lucky score per category; a royal flush scores 10
 
 @allow_storage
 @dataclass
@@ -15,18 +53,30 @@ class NFTMetadata:
     name: str
     description: str
     block_number: u256
-    attributes: str  # JSON string for additional attributes
+    attributes_hash: str  # SHA-256 of the JSON attributes string, stored once in attribute_blobs
     creator: Address
     mint_date: str
 
-    # Poker-specific metadata attributes
-    lucky: u256  # How lucky the winner was (0-10, 10 = royal flush level)
-    skill: u256  # Player skill level (0-10, based on hand reading, strategic decisions)
-    value_extraction: u256  # How well the player extracted value from strong hand (0-10, slow play/trapping)
-    hand_strength: u256  # Objective hand strength (0-10)
-    bluff_success: bool  # Whether the player won with a successful bluff
+    # Poker-specific metadata attributes, packed into one integer (see _pack_scores):
+    # - lucky: How lucky the winner was (0-10, 10 = royal flush level)
+    # - skill: Player skill level (0-10, based on hand reading, strategic decisions)
+    # - value_extraction: How well the player extracted value from strong hand (0-10, slow play/trapping)
+    # - hand_strength: Objective hand strength (0-10)
+    # - bluff_success: Whether the player won with a successful bluff
+    # - opponents_count: Number of opponents in the hand
+    scores: u256
     pot_size: u256  # Size of the pot won
-    opponents_count: u256  # Number of opponents in the hand
+
+
+@allow_storage
+@dataclass
+class TokenEvent:
+    """A mint or transfer, as recorded in the event feed."""
+
+    kind: str  # "mint" or "transfer"
+    token_id: u256
+    from_address: Address  # Minter for "mint", previous owner for "transfer"
+    to_address: Address
 
 
 class NFTContract(gl.Contract):
@@ -46,8 +96,30 @@ class NFTContract(gl.Contract):
     # Mapping from token ID to metadata
     token_metadata: TreeMap[u256, NFTMetadata]
 
-    # Mapping from address to number of tokens owned (for quick balance queries)
-    balances: TreeMap[Address, u256]
+    # Mapping from address to the IDs of the tokens it owns (unordered; balance is its length)
+    owner_tokens: TreeMap[Address, DynArray[u256]]
+
+    # Mapping from token ID to its index in the owner's owner_tokens array
+    token_owner_index: TreeMap[u256, u256]
+
+    # Mapping from "<attribute>:<value>" (e.g. "lucky:10", "bluff_success:1") to the
+    # IDs of the tokens with that value, in ascending order
+    attribute_buckets: TreeMap[str, DynArray[u256]]
+
+    # Mapping from leaderboard attribute to a min-heap of its top LEADERBOARD_SIZE
+    # entries. An entry is (value << LEADERBOARD_ID_BITS) | (LEADERBOARD_ID_MASK - token_id),
+    # so entries compare by value and then by earlier mint, and the root is the weakest entry.
+    leaderboards: TreeMap[str, DynArray[u256]]
+
+    # Mapping from SHA-256 hex digest to a distinct attributes JSON string, shared by every
+    # token minted with the same attributes
+    attribute_blobs: TreeMap[str, str]
+
+    # Append-only feed of mints and transfers; the sequence number of an event is its index + 1
+    events: DynArray[TokenEvent]
+
+    # Mapping from "<tournament address>:<hand number>" to the trophy minted for that hand
+    trophy_hands: TreeMap[str, u256]
 
     # Total number of tokens minted (also serves as next token ID)
     total_supply: u256
@@ -96,67 +168,544 @@ class NFTContract(gl.Contract):
         Returns:
             Dictionary with token_id and owner information
         """
+        self._validate_mint_fields(
+            name,
+            description,
+            block_number,
+            lucky,
+            skill,
+            value_extraction,
+            hand_strength,
+            pot_size,
+            opponents_count,
+        )
+
+        recipient = Address(to_address)
+        token_id = self.total_supply
+
+        # Assign ownership
+        metadata = self._new_metadata(
+            name,
+            description,
+            block_number,
+            lucky,
+            skill,
+            value_extraction,
+            hand_strength,
+            bluff_success,
+            pot_size,
+            opponents_count,
+            attributes,
+        )
+        self.token_owners[token_id] = recipient
+        self.token_metadata[token_id] = metadata
+
+        # Update owner and attribute indexes
+        self._add_token_to_owner(recipient, token_id)
+        self._index_token_attributes(token_id, metadata)
+        self.events.append(
+            TokenEvent(
+                kind="mint",
+                token_id=token_id,
+                from_address=gl.message.sender_address,
+                to_address=recipient,
+            )
+        )
+
+        # Increment total supply
+        self.total_supply = self.total_supply + u256(1)
+
+        return {
+            "token_id": int(token_id),
+            "owner": recipient.as_hex,
+            "name": name,
+        }
+
+    @gl.public.write
+    def mint_batch(self, entries: list[typing.Any]) -> dict:
+        """
+        Mint several NFTs in a single transaction.
+        All entries are validated before anything is written, the tokens get a
+        contiguous range of IDs, each recipient's token list is updated once and
+        total_supply is bumped once.
+
+        Args:
+            entries: Array of mints, each a dict with the arguments of mint:
+                - to_address, name, description, block_number, lucky, skill, value_extraction
+                - hand_strength, bluff_success, pot_size, opponents_count, attributes (optional)
+
+        Returns:
+            Dictionary with the first token ID and the number of tokens minted
+        """
+        if len(entries) == 0:
+            raise Exception("At least one entry is required")
+
+        for entry_index, entry in enumerate(entries):
+            for key in ["to_address", "name", "description", "block_number", "lucky", "skill", "value_extraction"]:
+                if key not in entry:
+                    raise Exception(f"Entry {entry_index}: missing {key}")
+
+            self._validate_mint_fields(
+                entry["name"],
+                entry["description"],
+                int(entry["block_number"]),
+                int(entry["lucky"]),
+                int(entry["skill"]),
+                int(entry["value_extraction"]),
+                int(entry.get("hand_strength", 0)),
+                int(entry.get("pot_size", 0)),
+                int(entry.get("opponents_count", 0)),
+                f"Entry {entry_index}: ",
+            )
+
+        first_token_id = self._mint_entries(entries)
+
+        return {
+            "first_token_id": first_token_id,
+            "count": len(entries),
+        }
+
+    def _mint_entries(self, entries: list[typing.Any]) -> int:
+        """
+        Mint already validated mint_batch entries to a contiguous range of token IDs.
+
+        Returns:
+            The token ID of the first entry
+        """
+        first_token_id = int(self.total_supply)
+        recipient_tokens = {}  # recipient -> token IDs minted to it, in order
+
+        for entry_index, entry in enumerate(entries):
+            token_id = u256(first_token_id + entry_index)
+            recipient = Address(entry["to_address"])
+
+            metadata = self._new_metadata(
+                entry["name"],
+                entry["description"],
+                int(entry["block_number"]),
+                int(entry["lucky"]),
+                int(entry["skill"]),
+                int(entry["value_extraction"]),
+                int(entry.get("hand_strength", 0)),
+                bool(entry.get("bluff_success", False)),
+                int(entry.get("pot_size", 0)),
+                int(entry.get("opponents_count", 0)),
+                entry.get("attributes", "{}"),
+            )
+            self.token_owners[token_id] = recipient
+            self.token_metadata[token_id] = metadata
+            self._index_token_attributes(token_id, metadata)
+            self.events.append(
+                TokenEvent(
+                    kind="mint",
+                    token_id=token_id,
+                    from_address=gl.message.sender_address,
+                    to_address=recipient,
+                )
+            )
+
+            if recipient not in recipient_tokens:
+                recipient_tokens[recipient] = []
+            recipient_tokens[recipient].append(token_id)
+
+        # Update owner index once per recipient
+        for recipient, token_ids in recipient_tokens.items():
+            owned = self.owner_tokens.get_or_insert_default(recipient)
+            for token_id in token_ids:
+                self.token_owner_index[token_id] = u256(len(owned))
+                owned.append(token_id)
+
+        # Increment total supply
+        self.total_supply = u256(first_token_id + len(entries))
+
+        return first_token_id
+
+    @gl.public.write
+    def mint_tournament_trophies(
+        self,
+        tournament_address: str,
+        from_hand: int,
+        to_hand: int,
+        min_pot_size: int = 0,
+    ) -> dict:
+        """
+        Mint a trophy to the winner of every qualifying hand of a PokerTournament.
+        The hands are read with one batched get_hands call and scored
+        deterministically from the cards, pot and chip changes (see _score_trophy),
+        so no LLM round or client round-trip is needed per hand. A hand qualifies
+        if it had a single winner, its pot is at least min_pot_size and at most
+        MAX_POT_SIZE, and no trophy was minted for it before.
+
+        Args:
+            tournament_address: Address of the PokerTournament contract
+            from_hand: Hand number of the first hand (1-based)
+            to_hand: Hand number of the last hand (inclusive, at most TROPHY_HANDS_PAGE hands)
+            min_pot_size: Smallest pot that earns a trophy
+
+        Returns:
+            Dictionary with the number of hands read, trophies minted and the first token ID (-1 if none)
+        """
+        if from_hand < 1:
+            raise Exception("from_hand must be at least 1")
+
+        if to_hand < from_hand or to_hand - from_hand + 1 > TROPHY_HANDS_PAGE:
+            raise Exception(f"Hand range must contain between 1 and {TROPHY_HANDS_PAGE} hands")
+
+        tournament = Address(tournament_address)
+        tournament_contract = gl.get_contract_at(tournament)
+        page = tournament_contract.view().get_hands(from_hand, to_hand - from_hand + 1)
+
+        # Every trophy of a tournament shares one interned attributes blob
+        attributes = json.dumps({"tournament": tournament.as_hex})
+
+        entries = []
+        hand_keys = []
+        for hand in page["hands"]:
+            hand_key = f"{tournament.as_hex}:{hand['hand_number']}"
+            if hand_key in self.trophy_hands:
+                continue
+
+            if len(hand["winner_positions"]) != 1 or int(hand["pot"]) < min_pot_size:
+                continue
+
+            # A pot too large for the pot_size leaderboard cannot earn a trophy
+            if int(hand["pot"]) > MAX_POT_SIZE:
+                continue
+
+            # The address seated when the hand was played, not the current one
+            winner_position = hand["winner_positions"][0]
+            winner_address = hand["player_addresses"][winner_position]
+            if not winner_address:
+                continue
+
+            scores = self._score_trophy(hand, winner_position)
+            if scores is None:
+                continue
+
+            entries.append(
+                {
+                    "to_address": winner_address,
+                    "name": f"Hand #{hand['hand_number']} Trophy",
+                    "description": f"Won a pot of {hand['pot']} with {scores['category']}",
+                    "block_number": hand["hand_number"],
+                    "lucky": scores["lucky"],
+                    "skill": scores["skill"],
+                    "value_extraction": scores["value_extraction"],
+                    "hand_strength": scores["hand_strength"],
+                    "bluff_success": scores["bluff_success"],
+                    "pot_size": int(hand["pot"]),
+                    "opponents_count": scores["opponents_count"],
+                    "attributes": attributes,
+                }
+            )
+            hand_keys.append(hand_key)
+
+        first_token_id = -1
+        if len(entries) > 0:
+            first_token_id = self._mint_entries(entries)
+            for i, hand_key in enumerate(hand_keys):
+                self.trophy_hands[hand_key] = u256(first_token_id + i)
+
+        return {
+            "hands_read": len(page["hands"]),
+            "minted": len(entries),
+            "first_token_id": first_token_id,
+        }
+
+    def _score_trophy(self, hand: dict, winner_position: int) -> typing.Any:
+        """
+        Score a hand won by winner_position, as returned by PokerTournament.get_hands.
+
+        - hand_strength: category of the winning hand (1-9), 10 for a royal flush
+        - lucky: rarity of the winning hand, +3 if the winner's hole cards were behind
+          another player's before the board came (10 for a royal flush)
+        - value_extraction: share of the pot that was profit for the winner (0-10)
+        - skill: 5 when the winner was ahead with the hole cards, 2 when behind,
+          plus half the value_extraction
+        - bluff_success: the pot was won with no more than high card and every
+          other player folded, so the weak hand was never shown down
+        - opponents_count: players other than the winner who did not fold
+
+        Returns:
+            Dictionary of scores and the winning category name, or None if the cards could not be parsed
+        """
+        board_codes = self._parse_cards(hand["board_cards"])
+        hole_codes = [self._parse_cards(player_hand) for player_hand in hand["player_hands"]]
+        if UNKNOWN_CARD in board_codes or any(UNKNOWN_CARD in codes for codes in hole_codes):
+            return None
+
+        winner_score = self._score_hand(hole_codes[winner_position] + board_codes)
+        category = winner_score[0]
+        is_royal_flush = category == 8 and winner_score[1] == 12
+
+        winner_hole_score = self._score_hand(hole_codes[winner_position])
+        came_from_behind = False
+        opponents_count = 0
+        for position in range(len(hole_codes)):
+            if position == winner_position or not hole_codes[position]:
+                continue  # Folded and busted players have no cards to compare
+            opponents_count += 1
+            if self._score_hand(hole_codes[position]) > winner_hole_score:
+                came_from_behind = True
+
+        pot = int(hand["pot"])
+        profit = int(hand["deltas"][winner_position])
+        value_extraction = min(10, max(0, 10 * profit // pot)) if pot > 0 else 0
+
+        return {
+            "category": "Royal Flush" if is_royal_flush else HAND_CATEGORIES[category],
+            "hand_strength": 10 if is_royal_flush else TROPHY_HAND_STRENGTH[category],
+            "lucky": 10 if is_royal_flush else min(10, TROPHY_LUCK[category] + (3 if came_from_behind else 0)),
+            "value_extraction": value_extraction,
+            "skill": min(10, (2 if came_from_behind else 5) + value_extraction // 2),
+            "bluff_success": category == 0 and opponents_count == 0,
+            "opponents_count": opponents_count,
+        }
+
+    def _parse_cards(self, cards_str: str) -> list[int]:
+        """
+        Parse a card string (suit symbol followed by rank, e.g. "♠A♥10") into card codes.
+        A card code is suit_index * 13 + rank_index; unparseable ranks map to UNKNOWN_CARD.
+        """
+        codes = []
+        if not cards_str:
+            return codes
+
+        suit_index = -1
+        rank = ""
+        for char in cards_str + SUIT_SYMBOLS[0]:
+            if char in SUIT_SYMBOLS:
+                if suit_index >= 0:
+                    rank = "10" if rank == "T" else rank
+                    if rank in CARD_RANKS:
+                        codes.append(suit_index * 13 + CARD_RANKS.index(rank))
+                    else:
+                        codes.append(UNKNOWN_CARD)
+                suit_index = SUIT_SYMBOLS.index(char)
+                rank = ""
+            elif not char.isspace():
+                rank += char.upper()
+        return codes
+
+    def _score_hand(self, codes: list[int]) -> tuple:
+        """
+        Score the best 5-card hand that can be made from the given card codes.
+        Scores compare as tuples: (category, tiebreak ranks...). With fewer than
+        5 cards (pre-flop) only pairs, trips and quads are considered.
+        """
+        if len(codes) <= 5:
+            return self._score_cards(codes)
+
+        best_score = None
+        for combination in itertools.combinations(codes, 5):
+            score = self._score_cards(list(combination))
+            if best_score is None or score > best_score:
+                best_score = score
+        return best_score
+
+    def _score_cards(self, codes: list[int]) -> tuple:
+        """
+        Score a hand of at most 5 card codes. See _score_hand.
+        """
+        ranks = sorted([code % 13 for code in codes], reverse=True)
+        rank_counts = {}
+        for rank in ranks:
+            rank_counts[rank] = rank_counts.get(rank, 0) + 1
+        # Groups ordered by size, then by rank: e.g. full house -> [(3, r1), (2, r2)]
+        groups = sorted([(count, rank) for rank, count in rank_counts.items()], reverse=True)
+        grouped_ranks = [rank for _, rank in groups]
+
+        straight_high = -1
+        is_flush = False
+        if len(codes) == 5:
+            is_flush = len(set(code // 13 for code in codes)) == 1
+            if len(rank_counts) == 5:
+                if ranks[0] - ranks[4] == 4:
+                    straight_high = ranks[0]
+                elif ranks == [12, 3, 2, 1, 0]:
+                    straight_high = 3  # Wheel: A-2-3-4-5
+
+        if straight_high >= 0 and is_flush:
+            return (8, straight_high)
+        if groups[0][0] == 4:
+            return (7, *grouped_ranks)
+        if groups[0][0] == 3 and len(groups) > 1 and groups[1][0] == 2:
+            return (6, *grouped_ranks)
+        if is_flush:
+            return (5, *ranks)
+        if straight_high >= 0:
+            return (4, straight_high)
+        if groups[0][0] == 3:
+            return (3, *grouped_ranks)
+        if groups[0][0] == 2 and len(groups) > 1 and groups[1][0] == 2:
+            return (2, *grouped_ranks)
+        if groups[0][0] == 2:
+            return (1, *grouped_ranks)
+        return (0, *ranks)
+
+    def _validate_mint_fields(
+        self,
+        name: str,
+        description: str,
+        block_number: int,
+        lucky: int,
+        skill: int,
+        value_extraction: int,
+        hand_strength: int,
+        pot_size: int,
+        opponents_count: int,
+        error_prefix: str = "",
+    ) -> None:
+        """
+        Validate the fields of a mint, raising on the first invalid one.
+        """
         if not name or not description:
-            raise Exception("Name and description are required")
+            raise Exception(f"{error_prefix}Name and description are required")
 
         if block_number < 0:
-            raise Exception("Block number must be non-negative")
+            raise Exception(f"{error_prefix}Block number must be non-negative")
 
         # Validate scores are in range 0-10
         if lucky < 0 or lucky > 10:
-            raise Exception("Lucky score must be between 0 and 10")
+            raise Exception(f"{error_prefix}Lucky score must be between 0 and 10")
 
         if skill < 0 or skill > 10:
-            raise Exception("Skill score must be between 0 and 10")
+            raise Exception(f"{error_prefix}Skill score must be between 0 and 10")
 
         if value_extraction < 0 or value_extraction > 10:
-            raise Exception("Value extraction score must be between 0 and 10")
+            raise Exception(f"{error_prefix}Value extraction score must be between 0 and 10")
 
         if hand_strength < 0 or hand_strength > 10:
-            raise Exception("Hand strength must be between 0 and 10")
-
-        if pot_size < 0:
-            raise Exception("Pot size must be non-negative")
+            raise Exception(f"{error_prefix}Hand strength must be between 0 and 10")
 
-        if opponents_count < 0:
-            raise Exception("Opponents count must be non-negative")
+        if pot_size < 0 or pot_size > MAX_POT_SIZE:
+            raise Exception(f"{error_prefix}Pot size must be between 0 and {MAX_POT_SIZE}")
 
-        recipient = Address(to_address)
-        token_id = self.total_supply
+        if opponents_count < 0 or opponents_count > MAX_OPPONENTS_COUNT:
+            raise Exception(f"{error_prefix}Opponents count must be between 0 and {MAX_OPPONENTS_COUNT}")
 
-        # Create metadata
-        metadata = NFTMetadata(
+    def _new_metadata(
+        self,
+        name: str,
+        description: str,
+        block_number: int,
+        lucky: int,
+        skill: int,
+        value_extraction: int,
+        hand_strength: int,
+        bluff_success: bool,
+        pot_size: int,
+        opponents_count: int,
+        attributes: str,
+    ) -> NFTMetadata:
+        """
+        Build the metadata of a newly minted token.
+        """
+        return NFTMetadata(
             name=name,
             description=description,
             block_number=u256(block_number),
-            attributes=attributes,
+            attributes_hash=self._intern_attributes(attributes),
             creator=gl.message.sender_address,
             mint_date=str(gl.block.timestamp),
-            lucky=u256(lucky),
-            skill=u256(skill),
-            value_extraction=u256(value_extraction),
-            hand_strength=u256(hand_strength),
-            bluff_success=bluff_success,
+            scores=self._pack_scores(
+                lucky, skill, value_extraction, hand_strength, bluff_success, opponents_count
+            ),
             pot_size=u256(pot_size),
-            opponents_count=u256(opponents_count),
         )
 
-        # Assign ownership
-        self.token_owners[token_id] = recipient
-        self.token_metadata[token_id] = metadata
+    def _intern_attributes(self, attributes: str) -> str:
+        """
+        Store an attributes JSON string once, keyed by its SHA-256, and return the key.
+        """
+        attributes_hash = hashlib.sha256(attributes.encode("utf-8")).hexdigest()
+        if attributes_hash not in self.attribute_blobs:
+            self.attribute_blobs[attributes_hash] = attributes
+        return attributes_hash
 
-        # Update balances
-        current_balance = self.balances.get(recipient, u256(0))
-        self.balances[recipient] = current_balance + u256(1)
+    def _pack_scores(
+        self,
+        lucky: int,
+        skill: int,
+        value_extraction: int,
+        hand_strength: int,
+        bluff_success: bool,
+        opponents_count: int,
+    ) -> u256:
+        """
+        Pack the poker scores of a token into one integer (layout in SCORE_FIELDS and the shifts above).
+        """
+        packed = 0
+        for position, score in enumerate([lucky, skill, value_extraction, hand_strength]):
+            packed |= score << (position * SCORE_BITS)
+        packed |= (1 if bluff_success else 0) << BLUFF_SUCCESS_SHIFT
+        packed |= opponents_count << OPPONENTS_COUNT_SHIFT
+        return u256(packed)
 
-        # Increment total supply
-        self.total_supply = self.total_supply + u256(1)
+    def _unpack_scores(self, scores: u256) -> dict:
+        """
+        Unpack the poker scores of a token into a dict keyed by attribute name.
+        """
+        packed = int(scores)
+        result = {}
+        for position, field in enumerate(SCORE_FIELDS):
+            result[field] = (packed >> (position * SCORE_BITS)) & SCORE_MASK
+        result["bluff_success"] = bool((packed >> BLUFF_SUCCESS_SHIFT) & 1)
+        result["opponents_count"] = packed >> OPPONENTS_COUNT_SHIFT
+        return result
 
-        return {
-            "token_id": int(token_id),
-            "owner": recipient.as_hex,
-            "name": name,
-        }
+    def _index_token_attributes(self, token_id: u256, metadata: NFTMetadata) -> None:
+        """
+        Add a newly minted token to the bucket of each of its score and bluff_success values.
+        Token IDs are minted in ascending order, so appending keeps every bucket sorted.
+        """
+        scores = self._unpack_scores(metadata.scores)
+        for field in SCORE_FIELDS:
+            self.attribute_buckets.get_or_insert_default(f"{field}:{scores[field]}").append(token_id)
+        bluff_key = f"bluff_success:{1 if scores['bluff_success'] else 0}"
+        self.attribute_buckets.get_or_insert_default(bluff_key).append(token_id)
+
+        scores["pot_size"] = int(metadata.pot_size)
+        for attribute in LEADERBOARD_ATTRIBUTES:
+            entry = (scores[attribute] << LEADERBOARD_ID_BITS) | (LEADERBOARD_ID_MASK - int(token_id))
+            self._push_leaderboard_entry(self.leaderboards.get_or_insert_default(attribute), entry)
+
+    def _push_leaderboard_entry(self, heap: typing.Any, entry: int) -> None:
+        """
+        Offer an entry to a bounded leaderboard min-heap in O(log LEADERBOARD_SIZE).
+        While the heap is not full the entry is added; afterwards it replaces the
+        root (the weakest entry) only if it is stronger.
+        """
+        if len(heap) < LEADERBOARD_SIZE:
+            # Sift up from the new leaf
+            position = len(heap)
+            heap.append(u256(entry))
+            while position > 0:
+                parent = (position - 1) // 2
+                if int(heap[parent]) <= entry:
+                    break
+                heap[position] = heap[parent]
+                position = parent
+            heap[position] = u256(entry)
+            return
+
+        if entry <= int(heap[0]):
+            return
+
+        # Sift down from the root
+        position = 0
+        size = len(heap)
+        while True:
+            child = 2 * position + 1
+            if child >= size:
+                break
+            if child + 1 < size and int(heap[child + 1]) < int(heap[child]):
+                child += 1
+            if entry <= int(heap[child]):
+                break
+            heap[position] = heap[child]
+            position = child
+        heap[position] = u256(entry)
 
     @gl.public.write
     def transfer(self, to_address: str, token_id: int) -> None:
@@ -183,13 +732,82 @@ class NFTContract(gl.Contract):
         # Transfer ownership
         self.token_owners[token_id_u256] = recipient
 
-        # Update balances
-        sender_balance = self.balances.get(sender, u256(0))
-        if sender_balance > 0:
-            self.balances[sender] = sender_balance - u256(1)
+        # Update owner index
+        self._remove_token_from_owner(sender, token_id_u256)
+        self._add_token_to_owner(recipient, token_id_u256)
+        self.events.append(
+            TokenEvent(
+                kind="transfer",
+                token_id=token_id_u256,
+                from_address=sender,
+                to_address=recipient,
+            )
+        )
 
-        recipient_balance = self.balances.get(recipient, u256(0))
-        self.balances[recipient] = recipient_balance + u256(1)
+    @gl.public.write
+    def transfer_batch(self, to_addresses: DynArray[str], token_ids: DynArray[int]) -> None:
+        """
+        Transfer several NFTs from the sender in a single transaction.
+        Ownership of every token is checked before any token moves.
+
+        Args:
+            to_addresses: Addresses that will receive the NFTs
+            token_ids: IDs of the tokens to transfer, in the same order as to_addresses
+        """
+        if len(to_addresses) != len(token_ids):
+            raise Exception(
+                f"to_addresses length ({len(to_addresses)}) must match token_ids length ({len(token_ids)})"
+            )
+
+        sender = gl.message.sender_address
+        seen_token_ids = set()
+        for token_id in token_ids:
+            token_id_u256 = u256(token_id)
+            if token_id_u256 not in self.token_owners:
+                raise Exception(f"Token {token_id} does not exist")
+            if self.token_owners[token_id_u256] != sender:
+                raise Exception(f"Sender does not own token {token_id}")
+            if token_id in seen_token_ids:
+                raise Exception(f"Token {token_id} appears more than once in the batch")
+            seen_token_ids.add(token_id)
+
+        for i in range(len(token_ids)):
+            token_id_u256 = u256(token_ids[i])
+            recipient = Address(to_addresses[i])
+
+            self.token_owners[token_id_u256] = recipient
+            self._remove_token_from_owner(sender, token_id_u256)
+            self._add_token_to_owner(recipient, token_id_u256)
+            self.events.append(
+                TokenEvent(
+                    kind="transfer",
+                    token_id=token_id_u256,
+                    from_address=sender,
+                    to_address=recipient,
+                )
+            )
+
+    def _add_token_to_owner(self, owner: Address, token_id: u256) -> None:
+        """
+        Append a token to its owner's token list and remember its position.
+        """
+        owned = self.owner_tokens.get_or_insert_default(owner)
+        self.token_owner_index[token_id] = u256(len(owned))
+        owned.append(token_id)
+
+    def _remove_token_from_owner(self, owner: Address, token_id: u256) -> None:
+        """
+        Remove a token from its owner's token list by swapping in the last token.
+        """
+        owned = self.owner_tokens.get_or_insert_default(owner)
+        token_index = int(self.token_owner_index[token_id])
+        last_index = len(owned) - 1
+
+        if token_index != last_index:
+            moved_token_id = owned[last_index]
+            owned[token_index] = moved_token_id
+            self.token_owner_index[moved_token_id] = u256(token_index)
+        owned.pop()
 
     @gl.public.view
     def owner_of(self, token_id: int) -> str:
@@ -223,24 +841,42 @@ class NFTContract(gl.Contract):
             raise Exception(f"Token {token_id} does not exist")
 
         metadata = self.token_metadata[token_id_u256]
+        scores = self._unpack_scores(metadata.scores)
         return {
             "token_id": token_id,
             "name": metadata.name,
             "description": metadata.description,
             "block_number": int(metadata.block_number),
-            "attributes": metadata.attributes,
+            "attributes": self.attribute_blobs[metadata.attributes_hash],
+            "attributes_hash": metadata.attributes_hash,
             "creator": metadata.creator.as_hex,
             "mint_date": metadata.mint_date,
             "owner": self.token_owners[token_id_u256].as_hex,
-            "lucky": int(metadata.lucky),
-            "skill": int(metadata.skill),
-            "value_extraction": int(metadata.value_extraction),
-            "hand_strength": int(metadata.hand_strength),
-            "bluff_success": metadata.bluff_success,
+            "lucky": scores["lucky"],
+            "skill": scores["skill"],
+            "value_extraction": scores["value_extraction"],
+            "hand_strength": scores["hand_strength"],
+            "bluff_success": scores["bluff_success"],
             "pot_size": int(metadata.pot_size),
-            "opponents_count": int(metadata.opponents_count),
+            "opponents_count": scores["opponents_count"],
         }
 
+    @gl.public.view
+    def get_attributes(self, attributes_hash: str) -> str:
+        """
+        Get an interned attributes JSON string by its hash, so clients can
+        expand the attributes_hash of many tokens with one call per distinct blob.
+
+        Args:
+            attributes_hash: SHA-256 hex digest returned as attributes_hash by get_metadata
+
+        Returns:
+            The attributes JSON string
+        """
+        if attributes_hash not in self.attribute_blobs:
+            raise Exception(f"Unknown attributes hash: {attributes_hash}")
+        return self.attribute_blobs[attributes_hash]
+
     @gl.public.view
     def balance_of(self, address: str) -> int:
         """
@@ -253,7 +889,9 @@ class NFTContract(gl.Contract):
             Number of tokens owned
         """
         addr = Address(address)
-        return int(self.balances.get(addr, u256(0)))
+        if addr not in self.owner_tokens:
+            return 0
+        return len(self.owner_tokens[addr])
 
     @gl.public.view
     def total_supply_count(self) -> int:
@@ -277,13 +915,162 @@ class NFTContract(gl.Contract):
             List of token IDs owned by the address
         """
         owner = Address(address)
+        if owner not in self.owner_tokens:
+            return []
+
+        token_ids = [int(token_id) for token_id in self.owner_tokens[owner]]
+        token_ids.sort()
+        return token_ids
+
+    @gl.public.view
+    def query_tokens(
+        self, filters: dict, cursor: int = 0, limit: int = MAX_QUERY_PAGE
+    ) -> dict:
+        """
+        Find tokens by attribute value without scanning the whole collection.
+        The bucket of each filtered attribute is looked up, and only the smallest
+        one is walked; every candidate is then checked against the other filters
+        with a single read of its packed scores.
+
+        Args:
+            filters: Attribute values to match, e.g. {"lucky": 10} or
+                {"bluff_success": True, "min_pot_size": 1000}. Supported keys are
+                lucky, skill, value_extraction, hand_strength (0-10),
+                bluff_success (bool) and min_pot_size (minimum pot, inclusive)
+            cursor: Smallest token ID to return (pass next_cursor to get the next page)
+            limit: Maximum number of token IDs to return (at most MAX_QUERY_PAGE)
+
+        Returns:
+            Dictionary with the matching token_ids in ascending order and next_cursor
+            (-1 when there are no more matches)
+        """
+        if cursor < 0:
+            raise Exception("Cursor must be non-negative")
+
+        if limit <= 0 or limit > MAX_QUERY_PAGE:
+            raise Exception(f"Limit must be between 1 and {MAX_QUERY_PAGE}")
+
+        bucket_keys = []
+        min_pot_size = 0
+        for field, value in filters.items():
+            if field in SCORE_FIELDS:
+                if not isinstance(value, int) or value < 0 or value > 10:
+                    raise Exception(f"Filter {field} must be between 0 and 10")
+                bucket_keys.append(f"{field}:{value}")
+            elif field == "bluff_success":
+                bucket_keys.append(f"bluff_success:{1 if value else 0}")
+            elif field == "min_pot_size":
+                min_pot_size = int(value)
+            else:
+                raise Exception(f"Unsupported filter: {field}")
+
+        # Walk the smallest bucket, or every token when only min_pot_size is given
+        candidates = range(int(self.total_supply))
+        for key in bucket_keys:
+            if key not in self.attribute_buckets:
+                return {"token_ids": [], "next_cursor": -1}
+            bucket = self.attribute_buckets[key]
+            if len(bucket) < len(candidates):
+                candidates = bucket
+
         token_ids = []
+        for position in range(bisect.bisect_left(candidates, cursor), len(candidates)):
+            token_id = int(candidates[position])
+            metadata = self.token_metadata[u256(token_id)]
+            if not self._matches_filters(metadata, filters, min_pot_size):
+                continue
 
-        for token_id, token_owner in self.token_owners.items():
-            if token_owner == owner:
-                token_ids.append(int(token_id))
+            if len(token_ids) == limit:
+                return {"token_ids": token_ids, "next_cursor": token_id}
+            token_ids.append(token_id)
 
-        return token_ids
+        return {"token_ids": token_ids, "next_cursor": -1}
+
+    def _matches_filters(self, metadata: NFTMetadata, filters: dict, min_pot_size: int) -> bool:
+        """
+        Check a token's packed scores and pot size against the query_tokens filters.
+        """
+        if int(metadata.pot_size) < min_pot_size:
+            return False
+
+        scores = self._unpack_scores(metadata.scores)
+        for field, value in filters.items():
+            if field in SCORE_FIELDS and scores[field] != value:
+                return False
+            if field == "bluff_success" and scores["bluff_success"] != bool(value):
+                return False
+        return True
+
+    @gl.public.view
+    def get_leaderboard(self, attribute: str, k: int = 10) -> list[dict]:
+        """
+        Get the top tokens by an attribute, served from the maintained leaderboard.
+        Ties are ranked by mint order (earlier token first).
+
+        Args:
+            attribute: One of LEADERBOARD_ATTRIBUTES (skill, lucky, pot_size)
+            k: Number of tokens to return (at most LEADERBOARD_SIZE)
+
+        Returns:
+            List of {rank, token_id, value, owner}, best first
+        """
+        if attribute not in LEADERBOARD_ATTRIBUTES:
+            raise Exception(f"No leaderboard for attribute: {attribute}")
+
+        if k <= 0 or k > LEADERBOARD_SIZE:
+            raise Exception(f"k must be between 1 and {LEADERBOARD_SIZE}")
+
+        if attribute not in self.leaderboards:
+            return []
+
+        entries = sorted((int(entry) for entry in self.leaderboards[attribute]), reverse=True)
+        result = []
+        for rank, entry in enumerate(entries[:k]):
+            token_id = LEADERBOARD_ID_MASK - (entry & LEADERBOARD_ID_MASK)
+            result.append(
+                {
+                    "rank": rank + 1,
+                    "token_id": token_id,
+                    "value": entry >> LEADERBOARD_ID_BITS,
+                    "owner": self.token_owners[u256(token_id)].as_hex,
+                }
+            )
+        return result
+
+    @gl.public.view
+    def get_events(self, from_seq: int, limit: int) -> dict:
+        """
+        Returns a page of the mint and transfer feed, starting at sequence number from_seq (1-based).
+        Indexers can follow the collection by polling from the last seen sequence number + 1.
+
+        Args:
+            from_seq: Sequence number of the first event to return
+            limit: Maximum number of events to return (capped at MAX_EVENTS_PAGE)
+        """
+        if from_seq < 1:
+            raise Exception("from_seq must be at least 1")
+        if limit < 0:
+            raise Exception("limit cannot be negative")
+
+        end_seq = min(from_seq + min(limit, MAX_EVENTS_PAGE), len(self.events) + 1)
+
+        events = []
+        for seq in range(from_seq, end_seq):
+            event = self.events[seq - 1]
+            events.append(
+                {
+                    "seq": seq,
+                    "kind": event.kind,
+                    "token_id": int(event.token_id),
+                    "from": event.from_address.as_hex,
+                    "to": event.to_address.as_hex,
+                }
+            )
+
+        return {
+            "events": events,
+            "event_count": len(self.events),
+        }
 
     @gl.public.view
     def get_all_tokens(self) -> dict:
@@ -298,6 +1085,7 @@ class NFTContract(gl.Contract):
             token_id_u256 = u256(token_id)
             if token_id_u256 in self.token_metadata:
                 metadata = self.token_metadata[token_id_u256]
+                scores = self._unpack_scores(metadata.scores)
                 result[str(token_id)] = {
                     "token_id": token_id,
                     "name": metadata.name,
@@ -305,12 +1093,12 @@ class NFTContract(gl.Contract):
                     "block_number": int(metadata.block_number),
                     "owner": self.token_owners[token_id_u256].as_hex,
                     "creator": metadata.creator.as_hex,
-                    "lucky": int(metadata.lucky),
-                    "skill": int(metadata.skill),
-                    "value_extraction": int(metadata.value_extraction),
-                    "hand_strength": int(metadata.hand_strength),
-                    "bluff_success": metadata.bluff_success,
+                    "lucky": scores["lucky"],
+                    "skill": scores["skill"],
+                    "value_extraction": scores["value_extraction"],
+                    "hand_strength": scores["hand_strength"],
+                    "bluff_success": scores["bluff_success"],
                     "pot_size": int(metadata.pot_size),
-                    "opponents_count": int(metadata.opponents_count),
+                    "opponents_count": scores["opponents_count"],
                 }
         return result
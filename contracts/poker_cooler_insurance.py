@@ -22,6 +22,19 @@ class InsurancePolicy:
     registration_date: str
 
 
+@allow_storage
+@dataclass
+class ArchivedPolicy:
+    player_address: Address
+    tournament_address: Address
+    packed: u256  # buy_in | premium_paid << 80 | payout_amount << 160 | is_valid_cooler << 240
+
+
+# Width of each amount field in ArchivedPolicy.packed
+ARCHIVE_FIELD_BITS = 80
+ARCHIVE_FIELD_MASK = (1 << ARCHIVE_FIELD_BITS) - 1
+
+
 class PokerCoolerInsurance(gl.Contract):
     """
     Insurance contract for poker coolers.
@@ -36,6 +49,19 @@ class PokerCoolerInsurance(gl.Contract):
     total_payouts: u256  # Total payouts made
     insurance_premium_rate: u256  # Premium rate (e.g., 100 = 1%, 1000 = 10%)
     payout_rate: u256  # Payout rate (e.g., 5000 = 50% of buy-in)
+    tournament_buy_ins: TreeMap[
+        Address, u256
+    ]  # Map of tournament_address -> buy-in snapshot taken on first pricing
+    open_policy_count: u256  # Policies purchased and not yet claimed
+    claimed_policy_count: u256  # Policies with a resolved claim (paid or not)
+    paid_policy_count: u256  # Policies whose claim resolved as a valid cooler
+    total_exposure: u256  # Sum of potential payouts over all open policies
+    tournament_exposure: TreeMap[
+        Address, u256
+    ]  # Map of tournament_address -> potential payouts over its open policies
+    archived_policies: TreeMap[
+        str, ArchivedPolicy
+    ]  # Map of policy_id -> compact record of a resolved policy moved out of player_policies
 
     def __init__(self):
         """
@@ -43,6 +69,10 @@ class PokerCoolerInsurance(gl.Contract):
         """
         self.total_premiums = u256(0)
         self.total_payouts = u256(0)
+        self.open_policy_count = u256(0)
+        self.claimed_policy_count = u256(0)
+        self.paid_policy_count = u256(0)
+        self.total_exposure = u256(0)
         # Default: 5% premium rate (500 = 5%)
         self.insurance_premium_rate = u256(500)
         # Default: 50% of buy-in payout (5000 = 50%)
@@ -131,21 +161,127 @@ This result should be perfectly parsable by a JSON parser without errors.
         policy_id = f"{tournament_addr.as_hex}_{player_addr.as_hex}_{registration_date}"
 
         # Check if policy already exists
-        if policy_id in self.player_policies:
+        if policy_id in self.player_policies or policy_id in self.archived_policies:
             raise Exception(f"Insurance policy {policy_id} already exists")
 
-        # Get tournament info to calculate premium using contract-to-contract interaction
-        tournament_info = self._get_tournament_info(tournament_address)
-        buy_in = tournament_info.get("tournament_buy_in", 0)
+        # Use the cached buy-in snapshot, taking it on the first purchase for this tournament
+        buy_in = self._get_cached_buy_in(tournament_addr)
 
         if buy_in <= 0:
             raise Exception("Invalid tournament buy-in amount")
 
+        # Create insurance policy
+        policy = self._new_policy(
+            policy_id, tournament_addr, player_addr, registration_date, buy_in
+        )
+        premium = int(policy.premium_paid)
+
+        self.player_policies[policy_id] = policy
+        self.total_premiums += u256(premium)
+
+        # Update book statistics: the new policy is open and adds its potential payout
+        liability = self._policy_liability(policy)
+        self.open_policy_count += u256(1)
+        self.total_exposure += u256(liability)
+        current_exposure = self.tournament_exposure.get(tournament_addr, u256(0))
+        self.tournament_exposure[tournament_addr] = current_exposure + u256(liability)
+
+        return {
+            "policy_id": policy_id,
+            "premium_paid": premium,
+            "tournament_buy_in": buy_in,
+        }
+
+    @gl.public.write
+    def purchase_insurance_batch(
+        self,
+        tournament_address: str,
+        registration_date: str,
+        player_addresses: DynArray[str],
+    ) -> typing.Any:
+        """
+        Purchase insurance for several players of the same tournament in one transaction.
+        The buy-in is looked up once and the book statistics are updated once for the whole batch.
+
+        Args:
+            tournament_address: Address of the poker tournament contract
+            registration_date: Date of registration
+            player_addresses: Addresses of the players to insure
+        Returns:
+            dict with the created policy IDs and batch totals
+        """
+        if not tournament_address:
+            raise Exception("tournament_address is required")
+
+        if len(player_addresses) == 0:
+            raise Exception("At least one player address is required")
+
+        tournament_addr = Address(tournament_address)
+        policy_prefix = f"{tournament_addr.as_hex}_"
+        policy_suffix = f"_{registration_date}"
+
+        # Validate every entry before writing anything
+        player_addrs = []
+        policy_ids = []
+        seen_players = set()
+        for player_address in player_addresses:
+            player_addr = Address(player_address)
+            if player_addr.as_hex in seen_players:
+                raise Exception(f"Duplicate player address {player_addr.as_hex} in batch")
+            seen_players.add(player_addr.as_hex)
+
+            policy_id = policy_prefix + player_addr.as_hex + policy_suffix
+            if policy_id in self.player_policies or policy_id in self.archived_policies:
+                raise Exception(f"Insurance policy {policy_id} already exists")
+
+            player_addrs.append(player_addr)
+            policy_ids.append(policy_id)
+
+        buy_in = self._get_cached_buy_in(tournament_addr)
+
+        if buy_in <= 0:
+            raise Exception("Invalid tournament buy-in amount")
+
+        total_premium = 0
+        total_liability = 0
+        for i in range(len(policy_ids)):
+            policy = self._new_policy(
+                policy_ids[i], tournament_addr, player_addrs[i], registration_date, buy_in
+            )
+            self.player_policies[policy_ids[i]] = policy
+            total_premium += int(policy.premium_paid)
+            total_liability += self._policy_liability(policy)
+
+        # Update totals and book statistics once for the whole batch
+        self.total_premiums += u256(total_premium)
+        self.open_policy_count += u256(len(policy_ids))
+        self.total_exposure += u256(total_liability)
+        current_exposure = self.tournament_exposure.get(tournament_addr, u256(0))
+        self.tournament_exposure[tournament_addr] = current_exposure + u256(
+            total_liability
+        )
+
+        return {
+            "policy_ids": policy_ids,
+            "premium_paid": total_premium,
+            "tournament_buy_in": buy_in,
+        }
+
+    def _new_policy(
+        self,
+        policy_id: str,
+        tournament_addr: Address,
+        player_addr: Address,
+        registration_date: str,
+        buy_in: int,
+    ) -> InsurancePolicy:
+        """
+        Build a new open insurance policy priced from the given buy-in.
+        """
         # Calculate premium (premium_rate is in basis points, e.g., 500 = 5%)
         premium = (buy_in * int(self.insurance_premium_rate)) // 10000
 
-        # Create insurance policy
-        policy = InsurancePolicy(
+        return InsurancePolicy(
             id=policy_id,
             player_address=player_addr,  # Use Address object, not string
             tournament_address=tournament_addr,
@@ -158,46 +294,34 @@ This result should be perfectly parsable by a JSON parser without errors.
             registration_date=registration_date,
         )
 
-        self.player_policies[policy_id] = policy
-        self.total_premiums += u256(premium)
-
-        return {
-            "policy_id": policy_id,
-            "premium_paid": premium,
-            "tournament_buy_in": buy_in,
-        }
-
     def _get_tournament_info(self, tournament_address: str) -> dict:
         """
         Get tournament information from the tournament contract using contract-to-contract interaction.
-        This queries the tournament contract to get the buy-in amount from player balances.
+        This queries the tournament contract's stack summary to estimate the buy-in amount.
 
         Args:
             tournament_address: Address of the poker tournament contract
 
         Returns:
-            dict with tournament information
+            dict with tournament information; is_default is True when the buy-in is
+            the 10000 fallback rather than an estimate from registered players
         """
         tournament_addr = Address(tournament_address)
+        is_default = True
 
-        # Query tournament contract to get state and calculate buy-in from player balances
-        # We'll use the tournament contract's get_state method to get player balances
+        # Query the tournament's aggregate view instead of its full state;
+        # chips are conserved, so the average stack equals the average buy-in
         try:
             tournament_contract = gl.get_contract_at(tournament_addr)
-            tournament_state = tournament_contract.view().get_state()
+            stack_summary = tournament_contract.view().get_stack_summary()
 
-            # Calculate buy-in as the sum of all player balances divided by number of players
-            # This gives us an estimate of the buy-in amount
-            player_balances = tournament_state.get("player_balances", [])
+            player_count = stack_summary.get("player_count", 0)
+            total_chips = stack_summary.get("total_chips", 0)
 
-            if len(player_balances) > 0:
-                total_balance = sum(player_balances)
+            if player_count > 0 and total_chips > 0:
                 # Estimate buy-in as average balance (assuming all players started with same buy-in)
-                buy_in = (
-                    total_balance // len(player_balances)
-                    if total_balance > 0
-                    else 10000
-                )
+                buy_in = total_chips // player_count
+                is_default = False
             else:
                 # Default buy-in if no players registered yet
                 buy_in = 10000
@@ -207,8 +331,89 @@ This result should be perfectly parsable by a JSON parser without errors.
 
         return {
             "tournament_buy_in": buy_in,
+            "is_default": is_default,
         }
 
+    def _get_cached_buy_in(self, tournament_addr: Address) -> int:
+        """
+        Get the buy-in snapshot for a tournament, querying the tournament contract
+        and storing the result only the first time the tournament is priced.
+        The default buy-in (no players registered yet, or the query failed) is
+        never stored, so the tournament is queried again on the next purchase.
+
+        Args:
+            tournament_addr: Address of the poker tournament contract
+
+        Returns:
+            Buy-in amount for the tournament
+        """
+        if tournament_addr in self.tournament_buy_ins:
+            return int(self.tournament_buy_ins[tournament_addr])
+
+        tournament_info = self._get_tournament_info(tournament_addr.as_hex)
+        buy_in = tournament_info.get("tournament_buy_in", 0)
+        if buy_in > 0 and not tournament_info.get("is_default", True):
+            self.tournament_buy_ins[tournament_addr] = u256(buy_in)
+        return buy_in
+
+    @gl.public.write
+    def refresh_tournament_buy_in(self, tournament_address: str) -> typing.Any:
+        """
+        Refresh the cached buy-in snapshot for a tournament from the tournament contract.
+        Policies already purchased keep the buy-in they were priced with.
+
+        Args:
+            tournament_address: Address of the poker tournament contract
+
+        Returns:
+            dict with the refreshed buy-in
+        """
+        if not tournament_address:
+            raise Exception("tournament_address is required")
+
+        tournament_addr = Address(tournament_address)
+        tournament_info = self._get_tournament_info(tournament_address)
+        buy_in = tournament_info.get("tournament_buy_in", 0)
+
+        if tournament_info.get("is_default", True):
+            raise Exception("Tournament has no registered chips to estimate the buy-in from")
+
+        if buy_in <= 0:
+            raise Exception("Invalid tournament buy-in amount")
+
+        self.tournament_buy_ins[tournament_addr] = u256(buy_in)
+
+        return {
+            "tournament_address": tournament_addr.as_hex,
+            "tournament_buy_in": buy_in,
+        }
+
+    def _policy_liability(self, policy: InsurancePolicy) -> int:
+        """
+        Potential payout of a policy if its claim resolves as a valid cooler.
+        """
+        return (int(policy.tournament_buy_in) * int(self.payout_rate)) // 10000
+
+    def _record_claim_resolution(self, policy: InsurancePolicy) -> None:
+        """
+        Update book statistics when a policy's claim is resolved.
+        The policy stops being open and its potential payout leaves the exposure sums.
+        """
+        liability = self._policy_liability(policy)
+
+        self.open_policy_count = u256(int(self.open_policy_count) - 1)
+        self.claimed_policy_count += u256(1)
+        if policy.is_valid_cooler:
+            self.paid_policy_count += u256(1)
+
+        self.total_exposure = u256(max(int(self.total_exposure) - liability, 0))
+        current_exposure = int(
+            self.tournament_exposure.get(policy.tournament_address, u256(0))
+        )
+        self.tournament_exposure[policy.tournament_address] = u256(
+            max(current_exposure - liability, 0)
+        )
+
     def _process_claim(self, policy: InsurancePolicy, policy_id: str) -> typing.Any:
         """
         Internal method to process a claim for an insurance policy.
@@ -242,6 +447,7 @@ This result should be perfectly parsable by a JSON parser without errors.
             policy.is_valid_cooler = False
             policy.payout_amount = u256(0)
             self.player_policies[policy_id] = policy
+            self._record_claim_resolution(policy)
 
             return {
                 "policy_id": policy_id,
@@ -263,6 +469,7 @@ This result should be perfectly parsable by a JSON parser without errors.
             policy.is_valid_cooler = False
             policy.payout_amount = u256(0)
             self.player_policies[policy_id] = policy
+            self._record_claim_resolution(policy)
 
             return {
                 "policy_id": policy_id,
@@ -291,6 +498,7 @@ This result should be perfectly parsable by a JSON parser without errors.
         policy.is_valid_cooler = is_cooler
         policy.payout_amount = payout_amount
         self.player_policies[policy_id] = policy
+        self._record_claim_resolution(policy)
 
         return {
             "policy_id": policy_id,
@@ -301,6 +509,97 @@ This result should be perfectly parsable by a JSON parser without errors.
             "opponent_hand_rank": cooler_result.get("opponent_hand_rank", ""),
         }
 
+    @gl.public.write
+    def archive_resolved_policies(self, cutoff_date: str) -> typing.Any:
+        """
+        Move resolved policies registered before a cutoff date into the compact archive.
+        Only the fields needed for audits are kept; views fall back to the archive.
+
+        Args:
+            cutoff_date: Policies with a registration_date strictly before this date are archived
+                (dates compare as strings, e.g. "2024-01-15")
+
+        Returns:
+            dict with the number of archived policies, and of resolved policies left in
+            the hot map because an amount does not fit in ARCHIVE_FIELD_BITS
+        """
+        if not cutoff_date:
+            raise Exception("cutoff_date is required")
+
+        # Collect first, the hot map cannot be modified while iterating it
+        policy_ids = []
+        skipped_count = 0
+        for policy_id, policy in self.player_policies.items():
+            if not policy.claim_resolved or policy.registration_date >= cutoff_date:
+                continue
+
+            # A policy too large to pack stays hot instead of blocking the whole sweep
+            amounts = (policy.tournament_buy_in, policy.premium_paid, policy.payout_amount)
+            if any(int(amount) > ARCHIVE_FIELD_MASK for amount in amounts):
+                skipped_count += 1
+                continue
+
+            policy_ids.append(policy_id)
+
+        for policy_id in policy_ids:
+            policy = self.player_policies[policy_id]
+            self.archived_policies[policy_id] = ArchivedPolicy(
+                player_address=policy.player_address,
+                tournament_address=policy.tournament_address,
+                packed=u256(
+                    self._pack_archive_fields(
+                        int(policy.tournament_buy_in),
+                        int(policy.premium_paid),
+                        int(policy.payout_amount),
+                        policy.is_valid_cooler,
+                    )
+                ),
+            )
+            del self.player_policies[policy_id]
+
+        return {
+            "archived_count": len(policy_ids),
+            "skipped_count": skipped_count,
+        }
+
+    def _pack_archive_fields(
+        self, buy_in: int, premium: int, payout: int, is_valid_cooler: bool
+    ) -> int:
+        """
+        Pack the audit fields of a resolved policy into one fixed-width integer.
+        """
+        for value in (buy_in, premium, payout):
+            if value > ARCHIVE_FIELD_MASK:
+                raise Exception("Policy amount too large to archive")
+
+        return (
+            buy_in
+            | (premium << ARCHIVE_FIELD_BITS)
+            | (payout << (2 * ARCHIVE_FIELD_BITS))
+            | ((1 if is_valid_cooler else 0) << (3 * ARCHIVE_FIELD_BITS))
+        )
+
+    def _archived_policy_to_dict(self, policy_id: str, archived: ArchivedPolicy) -> dict:
+        """
+        Expand an archived policy into the same shape as a live policy.
+        """
+        packed = int(archived.packed)
+        # policy_id is "<tournament>_<player>_<registration_date>"
+        registration_date = policy_id.split("_", 2)[2]
+
+        return {
+            "id": policy_id,
+            "player_address": archived.player_address.as_hex,
+            "tournament_address": archived.tournament_address.as_hex,
+            "tournament_buy_in": packed & ARCHIVE_FIELD_MASK,
+            "premium_paid": (packed >> ARCHIVE_FIELD_BITS) & ARCHIVE_FIELD_MASK,
+            "has_claimed": True,
+            "claim_resolved": True,
+            "is_valid_cooler": bool((packed >> (3 * ARCHIVE_FIELD_BITS)) & 1),
+            "payout_amount": (packed >> (2 * ARCHIVE_FIELD_BITS)) & ARCHIVE_FIELD_MASK,
+            "registration_date": registration_date,
+        }
+
     @gl.public.write
     def file_claim(self, policy_id: str) -> typing.Any:
         """
@@ -313,6 +612,9 @@ This result should be perfectly parsable by a JSON parser without errors.
         Returns:
             dict with claim resolution information
         """
+        if policy_id in self.archived_policies:
+            raise Exception(f"Claim already resolved for policy {policy_id}")
+
         if policy_id not in self.player_policies:
             raise Exception(f"Insurance policy {policy_id} not found")
 
@@ -345,6 +647,9 @@ This result should be perfectly parsable by a JSON parser without errors.
         # Generate policy ID (same format as in purchase_insurance)
         policy_id = f"{tournament_addr.as_hex}_{player_addr.as_hex}_{registration_date}"
 
+        if policy_id in self.archived_policies:
+            raise Exception(f"Claim already resolved for policy {policy_id}")
+
         if policy_id not in self.player_policies:
             raise Exception(f"Insurance policy {policy_id} not found")
 
@@ -382,6 +687,12 @@ This result should be perfectly parsable by a JSON parser without errors.
         # Generate policy ID based on tournament address, player address, and registration date
         policy_id = f"{tournament_addr.as_hex}_{player_addr.as_hex}_{registration_date}"
 
+        # Fall back to the archive for resolved policies moved out of the hot map
+        if policy_id in self.archived_policies:
+            return self._archived_policy_to_dict(
+                policy_id, self.archived_policies[policy_id]
+            )
+
         # Check if policy already exists
         if policy_id not in self.player_policies:
             raise Exception(f"Insurance policy {policy_id} not found")
@@ -429,6 +740,10 @@ This result should be perfectly parsable by a JSON parser without errors.
                     "registration_date": policy.registration_date,
                 }
 
+        for policy_id, archived in self.archived_policies.items():
+            if archived.player_address == address:
+                policies[policy_id] = self._archived_policy_to_dict(policy_id, archived)
+
         return policies
 
     @gl.public.view
@@ -442,8 +757,13 @@ This result should be perfectly parsable by a JSON parser without errors.
         Returns:
             dict with tournament information
         """
-        tournament_info = self._get_tournament_info(tournament_address)
-        buy_in = tournament_info.get("tournament_buy_in", 0)
+        tournament_addr = Address(tournament_address)
+        if tournament_addr in self.tournament_buy_ins:
+            # Serve the snapshot taken on first pricing, no cross-contract call needed
+            buy_in = int(self.tournament_buy_ins[tournament_addr])
+        else:
+            tournament_info = self._get_tournament_info(tournament_address)
+            buy_in = tournament_info.get("tournament_buy_in", 0)
 
         # Calculate premium (premium_rate is in basis points)
         premium = (buy_in * int(self.insurance_premium_rate)) // 10000
@@ -477,3 +797,43 @@ This result should be perfectly parsable by a JSON parser without errors.
             Total payouts made
         """
         return int(self.total_payouts)
+
+    @gl.public.view
+    def get_book_stats(self) -> typing.Any:
+        """
+        Get aggregate statistics of the insurance book.
+
+        Returns:
+            dict with policy counts per status, premiums, payouts, loss ratio and exposure
+        """
+        total_premiums = int(self.total_premiums)
+        total_payouts = int(self.total_payouts)
+
+        # Loss ratio in basis points (e.g., 5000 = 50% of premiums paid out)
+        loss_ratio = (
+            (total_payouts * 10000) // total_premiums if total_premiums > 0 else 0
+        )
+
+        return {
+            "open_policies": int(self.open_policy_count),
+            "claimed_policies": int(self.claimed_policy_count),
+            "paid_policies": int(self.paid_policy_count),
+            "total_premiums": total_premiums,
+            "total_payouts": total_payouts,
+            "loss_ratio": loss_ratio,
+            "total_exposure": int(self.total_exposure),
+        }
+
+    @gl.public.view
+    def get_tournament_exposure(self, tournament_address: str) -> int:
+        """
+        Get the potential payouts over all open policies of a tournament.
+
+        Args:
+            tournament_address: Address of the poker tournament contract
+
+        Returns:
+            Outstanding liability for the tournament
+        """
+        tournament_addr = Address(tournament_address)
+        return int(self.tournament_exposure.get(tournament_addr, u256(0)))
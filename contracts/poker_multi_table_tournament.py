@@ -0,0 +1,583 @@
+# v0.1.0
+# { "Depends": "py-genlayer:latest" }
+
+import json
+import typing
+from dataclasses import dataclass
+from genlayer import *
+
+SUIT_SYMBOLS = ["♠", "♥", "♦", "♣"]
+CARD_RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+UNKNOWN_CARD = 255  # Card code used when a card could not be parsed
+
+
+@allow_storage
+@dataclass
+class RegisteredPlayer:
+    table_id: u256  # Table the player is seated at
+    seat_index: u256  # Position of the player in the table's seat array
+    chips: u256  # Current chip count
+    is_active: bool  # False once the player has been eliminated
+    finish_position: u256  # Finishing place once eliminated (0 while still active)
+
+
+@allow_storage
+@dataclass
+class TableHand:
+    board_cards: str  # Board of the last hand played at the table
+    pot: u256  # Pot of the last hand played at the table
+    hand_count: u256  # Number of hands played at the table
+
+
+class PokerMultiTableTournament(gl.Contract):
+    """
+    Multi-table tournament host.
+    A single contract holds every table of the tournament, keyed by table ID,
+    with a shared player registry and chip ledger so that seats can be moved
+    between tables without redeploying anything.
+    """
+
+    players: TreeMap[Address, RegisteredPlayer]  # Shared player registry and chip ledger
+    table_seats: TreeMap[u256, DynArray[Address]]  # Map of table_id -> seated player addresses
+    table_hands: TreeMap[u256, TableHand]  # Map of table_id -> state of the table's last hand
+    table_last_winners: TreeMap[
+        u256, DynArray[Address]
+    ]  # Map of table_id -> winner(s) of the table's last hand
+    table_count: u256  # Number of tables created
+    player_count: u256  # Number of registered players
+    active_players: u256  # Number of players that still have chips
+    total_chips: u256  # Sum of all chips in play
+    tournament_finished: bool  # Whether only one player has chips left
+    tournament_winner: Address  # Winner once the tournament has finished
+
+    def __init__(self):
+        self.table_count = u256(0)
+        self.player_count = u256(0)
+        self.active_players = u256(0)
+        self.total_chips = u256(0)
+        self.tournament_finished = False
+        self.tournament_winner = Address("0x0000000000000000000000000000000000000000")
+
+    @gl.public.write
+    def create_table(self, table_id: int) -> typing.Any:
+        """
+        Create an empty table.
+
+        Args:
+            table_id: ID of the new table
+        """
+        table_key = u256(table_id)
+        if table_key in self.table_hands:
+            raise Exception(f"Table {table_id} already exists")
+
+        self.table_hands[table_key] = TableHand(
+            board_cards="",
+            pot=u256(0),
+            hand_count=u256(0),
+        )
+        self.table_seats.get_or_insert_default(table_key)
+        self.table_count += u256(1)
+
+        return {
+            "table_id": table_id,
+            "table_count": int(self.table_count),
+        }
+
+    @gl.public.write
+    def register_players(
+        self, table_id: int, balances: DynArray[int], addresses: DynArray[str]
+    ) -> typing.Any:
+        """
+        Register new players and seat them at a table.
+
+        Args:
+            table_id: ID of the table to seat the players at
+            balances: Starting chips for each player (must be > 0)
+            addresses: Address of each player
+        """
+        table_key = self._require_table(table_id)
+
+        if self.tournament_finished:
+            raise Exception("Tournament has already finished")
+
+        if len(balances) != len(addresses):
+            raise Exception(
+                f"balances length ({len(balances)}) must match addresses length ({len(addresses)})"
+            )
+
+        player_addrs = [Address(a) for a in addresses]
+        if len(set(player_addrs)) != len(player_addrs):
+            raise Exception("Player addresses must be unique")
+
+        for i, player_addr in enumerate(player_addrs):
+            if player_addr in self.players:
+                raise Exception(f"Player {player_addr.as_hex} is already registered")
+            if int(balances[i]) <= 0:
+                raise Exception(f"Balance for player {i} must be greater than zero")
+
+        seats = self.table_seats.get_or_insert_default(table_key)
+        added_chips = 0
+        for i, player_addr in enumerate(player_addrs):
+            self.players[player_addr] = RegisteredPlayer(
+                table_id=table_key,
+                seat_index=u256(len(seats)),
+                chips=u256(balances[i]),
+                is_active=True,
+                finish_position=u256(0),
+            )
+            seats.append(player_addr)
+            added_chips += int(balances[i])
+
+        self.player_count += u256(len(player_addrs))
+        self.active_players += u256(len(player_addrs))
+        self.total_chips += u256(added_chips)
+
+        return {
+            "table_id": table_id,
+            "table_size": len(seats),
+            "player_count": int(self.player_count),
+        }
+
+    @gl.public.write
+    def balance_tables(
+        self, player_addresses: DynArray[str], to_table_ids: DynArray[int]
+    ) -> typing.Any:
+        """
+        Move players between tables in a single write.
+        Each player is removed from their current table and seated at the target table.
+
+        Args:
+            player_addresses: Addresses of the players to move
+            to_table_ids: Target table ID for each player
+        """
+        if len(player_addresses) != len(to_table_ids):
+            raise Exception(
+                f"player_addresses length ({len(player_addresses)}) must match to_table_ids length ({len(to_table_ids)})"
+            )
+
+        # Validate every move before touching any table
+        moves = []
+        moved = set()
+        for i in range(len(player_addresses)):
+            player_addr = Address(player_addresses[i])
+            to_table = self._require_table(to_table_ids[i])
+            player = self._require_active_player(player_addr)
+            if player_addr in moved:
+                raise Exception(f"Player {player_addr.as_hex} is moved more than once")
+            moved.add(player_addr)
+            if player.table_id != to_table:
+                moves.append((player_addr, to_table))
+
+        for player_addr, to_table in moves:
+            self._unseat(player_addr)
+            seats = self.table_seats.get_or_insert_default(to_table)
+            player = self.players[player_addr]
+            player.table_id = to_table
+            player.seat_index = u256(len(seats))
+            self.players[player_addr] = player
+            seats.append(player_addr)
+
+        return {
+            "moved_players": len(moves),
+        }
+
+    @gl.public.write
+    def calculate_winners(
+        self,
+        table_id: int,
+        player_addresses: DynArray[str],
+        players: DynArray[str],
+        board_cards: str,
+        player_bets: DynArray[int],
+    ) -> typing.Any:
+        """
+        Judge a hand played at one table and settle it against the shared chip ledger.
+
+        Args:
+            table_id: ID of the table the hand was played at
+            player_addresses: Addresses of the players in the hand
+            players: Array of player hands, in the same order as player_addresses
+            board_cards: The 5 community cards (or empty string for pre-flop)
+            player_bets: Array of bets made by each player, in the same order as player_addresses
+        """
+        if board_cards is None:
+            board_cards = ""
+
+        card_count = self._count_cards(board_cards)
+        if card_count != 0 and card_count != 5:
+            raise Exception(
+                f"Board cards must have exactly 5 cards or be empty (pre-flop). Found {card_count} cards."
+            )
+
+        table_key = self._require_table(table_id)
+
+        if self.tournament_finished:
+            raise Exception("Tournament has already finished")
+
+        if len(players) < 2:
+            raise Exception("At least 2 players are required")
+
+        if len(player_addresses) != len(players) or len(player_bets) != len(players):
+            raise Exception(
+                "player_addresses, players and player_bets must all have the same length"
+            )
+
+        # Resolve players against the registry and validate bets
+        player_addrs = []
+        previous_chips = []
+        pot_amount = 0
+        for i in range(len(players)):
+            player_addr = Address(player_addresses[i])
+            player = self._require_active_player(player_addr)
+            if player.table_id != table_key:
+                raise Exception(f"Player {player_addr.as_hex} is not seated at table {table_id}")
+            if player_addr in player_addrs:
+                raise Exception(f"Player {player_addr.as_hex} appears more than once in the hand")
+
+            bet_amount = int(player_bets[i])
+            if bet_amount < 0:
+                raise Exception("Player bet cannot be negative")
+            if int(player.chips) < bet_amount:
+                raise Exception(
+                    f"Player {player_addr.as_hex} has insufficient chips ({int(player.chips)}) for bet ({bet_amount})"
+                )
+
+            player_addrs.append(player_addr)
+            previous_chips.append(int(player.chips))
+            pot_amount += bet_amount
+
+        # Reject duplicate or malformed cards before the judge runs
+        self._validate_cards(players, board_cards, player_bets)
+
+        hands_list = []
+        for i in range(len(players)):
+            hands_list.append(f"Player {i}: {players[i]}")
+        board_cards_str = board_cards if board_cards else "None"
+
+        def determine_winner(hands_list: list[str], board_cards_str: str) -> str:
+            task = f"""
+You are an expert poker judge determining the winner in a Texas Hold'em poker hand with multiple players.
+
+TEXAS HOLD'EM RULES:
+- Each player has 2 private cards (their "hand")
+- There are 5 community cards on the board (shared by all players)
+- Each player makes their best 5-card poker hand using any combination of their 2 private cards and the 5 community cards
+- You can use 0, 1, or 2 of your private cards, and 5, 4, or 3 of the community cards respectively
+- The player with the highest-ranking 5-card hand wins
+
+COMPARING HANDS:
+- If two players have the same hand type, compare the rank values:
+  - Card ranks: 2 < 3 < 4 < 5 < 6 < 7 < 8 < 9 < 10 < J < Q < K < A
+- For pairs/trips/quads: compare the rank of the pair/trip/quad first
+- For full house: compare the three-of-a-kind rank first, then the pair rank
+- For two pair: compare the higher pair first, then the lower pair, then the kicker
+- For one pair: compare the pair rank first, then kickers in descending order
+- For high card: compare cards in descending order
+- If all 5 cards are identical in rank (but different suits), it's a tie
+
+TIE RULES:
+- If multiple players have identical 5-card hands (same ranks, regardless of suits), they tie
+- Example: Player 1 has K♠K♥ and Player 2 has K♦K♣ with board K♠Q♠J♠10♠9♠ - both have King-high flush, it's a tie
+
+
+CARD NOTATION:
+- Suit symbols: ♠ (spades), ♥ (hearts), ♦ (diamonds), ♣ (clubs)
+- Ranks: A (Ace), K (King), Q (Queen), J (Jack), 10, 9, 8, 7, 6, 5, 4, 3, 2
+- Example: "♠A♥K" means Ace of spades and King of hearts
+
+CURRENT GAME:
+Player hands:
+{chr(10).join(hands_list)}
+Board cards: {board_cards_str}
+
+Analyze each player's best possible 5-card hand by combining their 2 private cards with the 5 community cards.
+Determine which player(s) have the highest-ranking hand.
+
+Respond in JSON with EXACTLY this structure (no extra fields, no missing fields):
+{{
+    "winner_index": int, // Index of winning player (0-based), or -1 if there is a tie
+    "tie_players": [int], // Array of all player indices who tied for the win (empty array [] if no tie, all tied player indices if winner_index is -1)
+}}
+
+CRITICAL REQUIREMENTS:
+- If there is a single winner, set winner_index to that player's index (0-based) and tie_players to []
+- If there is a tie, set winner_index to -1 and tie_players to an array containing ALL tied player indices
+- Your response must be ONLY valid JSON, no markdown, no code blocks, no explanations, nothing else
+- Do not include any text before or after the JSON
+- Ensure all arrays are properly formatted (use [] for empty arrays, not null or undefined)
+            """
+            result = gl.nondet.exec_prompt(task, response_format="json")
+            return json.dumps(result, sort_keys=True)
+
+        result_json = json.loads(
+            gl.eq_principle.strict_eq(lambda: determine_winner(hands_list, board_cards_str))
+        )
+
+        if "winner_index" not in result_json:
+            raise Exception("Missing winner_index in LLM response")
+
+        winner_index = int(result_json.get("winner_index", -1))
+        tie_players = result_json.get("tie_players", [])
+        if not isinstance(tie_players, list):
+            tie_players = []
+
+        winner_positions = [winner_index] if winner_index >= 0 else [int(i) for i in tie_players]
+
+        # Settle the hand locally, then write each player's entry once
+        new_chips = [previous_chips[i] - int(player_bets[i]) for i in range(len(players))]
+        distributed_amount = 0
+        if len(winner_positions) > 0:
+            pot_per_player = pot_amount // len(winner_positions)
+            remainder = pot_amount % len(winner_positions)
+            for i, position in enumerate(winner_positions):
+                amount = pot_per_player + (1 if i < remainder else 0)
+                new_chips[position] += amount
+                distributed_amount += amount
+
+        eliminated_positions = []
+        for i, player_addr in enumerate(player_addrs):
+            if new_chips[i] == previous_chips[i]:
+                continue
+            player = self.players[player_addr]
+            player.chips = u256(new_chips[i])
+            self.players[player_addr] = player
+            if new_chips[i] == 0:
+                eliminated_positions.append(i)
+
+        # Players busting in the same hand: the smaller starting stack finishes worse (as in PokerTournament)
+        eliminated_positions.sort(key=lambda position: previous_chips[position])
+        eliminated = [player_addrs[position] for position in eliminated_positions]
+
+        # Eliminated players leave their table; finish position is the number of players left
+        for player_addr in eliminated:
+            self._unseat(player_addr)
+            player = self.players[player_addr]
+            player.is_active = False
+            player.finish_position = self.active_players
+            self.players[player_addr] = player
+            self.active_players = u256(int(self.active_players) - 1)
+
+        self.total_chips = u256(int(self.total_chips) - pot_amount + distributed_amount)
+
+        table_hand = self.table_hands[table_key]
+        table_hand.board_cards = board_cards
+        table_hand.pot = u256(pot_amount)
+        table_hand.hand_count += u256(1)
+        self.table_hands[table_key] = table_hand
+
+        last_winners = self.table_last_winners.get_or_insert_default(table_key)
+        while len(last_winners) > len(winner_positions):
+            last_winners.pop()
+        for i, position in enumerate(winner_positions):
+            if i < len(last_winners):
+                last_winners[i] = player_addrs[position]
+            else:
+                last_winners.append(player_addrs[position])
+
+        # Tournament ends once a single registered player has chips left
+        if int(self.active_players) == 1 and int(self.player_count) >= 2:
+            survivors = [a for i, a in enumerate(player_addrs) if new_chips[i] > 0]
+            if len(survivors) == 1:
+                self.tournament_finished = True
+                self.tournament_winner = survivors[0]
+
+        return {
+            "table_id": table_id,
+            "winners": [player_addrs[p].as_hex for p in winner_positions],
+            "pot_distributed": distributed_amount,
+            "eliminated": [a.as_hex for a in eliminated],
+            "active_players": int(self.active_players),
+            "tournament_finished": self.tournament_finished,
+        }
+
+    @gl.public.view
+    def get_table(self, table_id: int) -> typing.Any:
+        """
+        Get the seats and last hand of a table.
+        """
+        table_key = self._require_table(table_id)
+        seats = self.table_seats[table_key]
+        table_hand = self.table_hands[table_key]
+        last_winners = self.table_last_winners.get(table_key, [])
+
+        return {
+            "table_id": table_id,
+            "seats": [
+                {
+                    "player_address": player_addr.as_hex,
+                    "chips": int(self.players[player_addr].chips),
+                }
+                for player_addr in seats
+            ],
+            "board_cards": table_hand.board_cards,
+            "pot": int(table_hand.pot),
+            "hand_count": int(table_hand.hand_count),
+            "last_winners": [player_addr.as_hex for player_addr in last_winners],
+        }
+
+    @gl.public.view
+    def get_player(self, player_address: str) -> typing.Any:
+        """
+        Get a player's table, seat, chips and finish position.
+        """
+        player_addr = Address(player_address)
+        if player_addr not in self.players:
+            raise Exception(f"Player {player_address} is not registered")
+
+        player = self.players[player_addr]
+        return {
+            "player_address": player_addr.as_hex,
+            "table_id": int(player.table_id) if player.is_active else -1,
+            "seat_index": int(player.seat_index) if player.is_active else -1,
+            "chips": int(player.chips),
+            "is_active": player.is_active,
+            "finish_position": int(player.finish_position),
+        }
+
+    @gl.public.view
+    def get_tournament_status(self) -> typing.Any:
+        """
+        Get the tournament-wide counters and winner.
+        """
+        return {
+            "table_count": int(self.table_count),
+            "player_count": int(self.player_count),
+            "active_players": int(self.active_players),
+            "total_chips": int(self.total_chips),
+            "tournament_finished": self.tournament_finished,
+            "tournament_winner": (
+                self.tournament_winner.as_hex if self.tournament_finished else ""
+            ),
+        }
+
+    def _require_table(self, table_id: int) -> u256:
+        """
+        Get the storage key of a table, raising if the table does not exist.
+        """
+        table_key = u256(table_id)
+        if table_key not in self.table_hands:
+            raise Exception(f"Table {table_id} does not exist")
+        return table_key
+
+    def _require_active_player(self, player_addr: Address) -> RegisteredPlayer:
+        """
+        Get a registered player that still has chips, raising otherwise.
+        """
+        if player_addr not in self.players:
+            raise Exception(f"Player {player_addr.as_hex} is not registered")
+        player = self.players[player_addr]
+        if not player.is_active:
+            raise Exception(f"Player {player_addr.as_hex} has been eliminated")
+        return player
+
+    def _unseat(self, player_addr: Address) -> None:
+        """
+        Remove a player from their table's seats by swapping in the last seat.
+        """
+        player = self.players[player_addr]
+        seats = self.table_seats.get_or_insert_default(player.table_id)
+        seat_index = int(player.seat_index)
+        last_index = len(seats) - 1
+
+        if seat_index != last_index:
+            moved_addr = seats[last_index]
+            seats[seat_index] = moved_addr
+            moved_player = self.players[moved_addr]
+            moved_player.seat_index = u256(seat_index)
+            self.players[moved_addr] = moved_player
+        seats.pop()
+
+    def _parse_cards(self, cards_str: str) -> list[int]:
+        """
+        Parse a card string (suit symbol followed by rank, e.g. "♠A♥10") into card codes.
+        A card code is suit_index * 13 + rank_index; unparseable ranks map to UNKNOWN_CARD.
+        """
+        codes = []
+        if not cards_str:
+            return codes
+
+        suit_index = -1
+        rank = ""
+        for char in cards_str + SUIT_SYMBOLS[0]:
+            if char in SUIT_SYMBOLS:
+                if suit_index >= 0:
+                    rank = "10" if rank == "T" else rank
+                    if rank in CARD_RANKS:
+                        codes.append(suit_index * 13 + CARD_RANKS.index(rank))
+                    else:
+                        codes.append(UNKNOWN_CARD)
+                suit_index = SUIT_SYMBOLS.index(char)
+                rank = ""
+            elif not char.isspace():
+                rank += char.upper()
+        return codes
+
+    def _is_folded(self, player_hand: str) -> bool:
+        """
+        A player who folded (or is no longer in the game) is sent with an empty hand.
+        """
+        return not player_hand or not player_hand.strip()
+
+    def _validate_cards(
+        self,
+        players: list[str],
+        board_cards: str,
+        player_bets: list[int],
+        error_prefix: str = "",
+    ) -> None:
+        """
+        Reject a hand whose cards could not have been dealt from a single deck.
+        Every player still in the hand must hold exactly 2 known cards, every board
+        card must be known, and no card may appear twice. All hole and board cards
+        are folded into a 52-bit mask in one pass, so a repeated card costs a single
+        bit test. A folded player (empty hand) holds no cards and must bet 0.
+
+        Args:
+            players: Array of player hands (each player has 2 cards, or "" if folded)
+            board_cards: The community cards (or empty string for pre-flop)
+            player_bets: Array of bets made by each player
+            error_prefix: Prepended to error messages (e.g. "Hand 3: " in a batch)
+        """
+        live_players = 0
+        seen_cards = 0
+        for i in range(len(players) + 1):
+            cards_str = players[i] if i < len(players) else board_cards
+            if i < len(players) and self._is_folded(cards_str):
+                if int(player_bets[i]) != 0:
+                    raise Exception(f"{error_prefix}Folded player {i} must have a bet of 0")
+                continue
+            if i < len(players):
+                live_players += 1
+
+            codes = self._parse_cards(cards_str)
+            if i < len(players) and len(codes) != 2:
+                raise Exception(
+                    f"{error_prefix}Player {i} must have exactly 2 cards. Found {len(codes)} cards."
+                )
+
+            for code in codes:
+                if code == UNKNOWN_CARD:
+                    raise Exception(f"{error_prefix}Unrecognized card in '{cards_str}'")
+                card_bit = 1 << code
+                if seen_cards & card_bit:
+                    raise Exception(
+                        f"{error_prefix}Card {SUIT_SYMBOLS[code // 13]}{CARD_RANKS[code % 13]} is dealt more than once"
+                    )
+                seen_cards |= card_bit
+
+        if live_players == 0:
+            raise Exception(f"{error_prefix}At least one player must still be in the hand")
+
+    def _count_cards(self, cards_str: str) -> int:
+        """
+        Count the number of cards in a string representation.
+        Each card is represented by a suit symbol (♠, ♥, ♦, ♣) followed by a rank.
+        """
+        if not cards_str:
+            return 0
+
+        suit_symbols = ["♠", "♥", "♦", "♣"]
+        count = 0
+        for symbol in suit_symbols:
+            count += cards_str.count(symbol)
+        return count
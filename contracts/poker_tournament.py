@@ -76,6 +76,23 @@ class PokerTournament(gl.Contract):
             "tournament_winner_index": int(self.tournament_winner_index),
         }
 
+    def _replace_array(self, array: typing.Any, values: list) -> None:
+        """
+        Replace the contents of a storage array in place.
+        Only slots whose value changed are written, and the length is only
+        adjusted by the difference between the old and new sizes.
+        """
+        common_length = min(len(array), len(values))
+        for i in range(common_length):
+            if array[i] != values[i]:
+                array[i] = values[i]
+
+        for _ in range(len(array) - len(values)):
+            array.pop()
+
+        for i in range(common_length, len(values)):
+            array.append(values[i])
+
     def _count_cards(self, cards_str: str) -> int:
         """
         Count the number of cards in a string representation.
@@ -129,13 +146,8 @@ class PokerTournament(gl.Contract):
             if balance < 0:
                 raise Exception(f"Balance for player {i} cannot be negative")
 
-        # Clear existing balances
-        while len(self.player_balances) > 0:
-            self.player_balances.pop()
-
-        # Set new balances
-        for balance in balances:
-            self.player_balances.append(u256(balance))
+        # Overwrite balances in place, touching only changed slots
+        self._replace_array(self.player_balances, [u256(b) for b in balances])
 
         # Check if tournament has finished after balance update
         self._check_tournament_finished()
@@ -296,31 +308,20 @@ IMPORTANT:
         else:
             self.hand_winner_index = u256(999999)
 
-        # Reset tie_players storage array
-        while len(self.tie_players) > 0:
-            self.tie_players.pop()
-        for idx in tie_players:
-            self.tie_players.append(u256(idx))
-
-        # Replace stored player_hands with provided players
-        # Clear existing player_hands first
-        while len(self.player_hands) > 0:
-            self.player_hands.pop()
-        # Add new player hands - iterate by index to handle DynArray correctly
-        for i in range(len(players)):
-            self.player_hands.append(players[i])
+        # Overwrite tie_players and player_hands in place, touching only changed slots
+        self._replace_array(self.tie_players, [u256(idx) for idx in tie_players])
+        self._replace_array(
+            self.player_hands, [players[i] for i in range(len(players))]
+        )
 
         self.board_cards = board_cards
         self.pot = u256(pot_amount)
 
         # Distribute pot and update balances
-        # Reset last_pot_distribution
-        while len(self.last_pot_distribution) > 0:
-            self.last_pot_distribution.pop()
-
-        # Initialize distribution array to match player count
-        for i in range(len(players)):
-            self.last_pot_distribution.append(u256(0))
+        # Reset last_pot_distribution to zeros for this hand, resizing only if needed
+        self._replace_array(
+            self.last_pot_distribution, [u256(0) for _ in range(len(players))]
+        )
 
         if winner_index >= 0:
             # Single winner gets the entire pot
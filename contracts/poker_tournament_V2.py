@@ -1,6 +1,7 @@
 # v0.1.0
 # { "Depends": "py-genlayer:latest" }
 
+import itertools
 import json
 import typing
 from dataclasses import dataclass
@@ -15,6 +16,55 @@ class PlayerElimination:
     player_hand: str
     opponent_hand: str
     board_cards: str
+    is_cooler: bool  # Whether the player busted holding a strong hand to a stronger one
+    hand_rank_player: str  # Category of the eliminated player's best hand (e.g. "Flush")
+    hand_rank_opponent: str  # Category of the winning hand
+    finish_position: u256  # Finishing place in the tournament (1 = winner)
+    hand_number: u256  # Hand in which the player busted out
+
+
+@allow_storage
+@dataclass
+class HandRecord:
+    seats: bytes  # Seat index of each hand position, encoded with _encode_ints
+    cards: bytes  # 2 bytes of hole cards per hand position, then 0 or 5 board cards (1 byte per card code)
+    winners: bytes  # Hand positions that won or tied the pot, encoded with _encode_ints
+    pot: u256
+    deltas: bytes  # Signed chip change (winnings - bet) of each hand position, encoded with _encode_ints
+    addresses: bytes  # 20-byte address seated at each hand position when the hand was played (zeros if none)
+
+
+SUIT_SYMBOLS = ["♠", "♥", "♦", "♣"]
+CARD_RANKS = ["2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A"]
+UNKNOWN_CARD = 255  # Card code used when a card could not be parsed
+ADDRESS_PADDING = bytes(20)  # Recorded in place of the address of a seat that has none
+MAX_HANDS_PAGE = 100  # Maximum number of hands returned by get_hands
+MAX_ELIMINATIONS_PAGE = 100  # Maximum number of eliminations returned by get_all_eliminations
+HAND_CATEGORIES = [
+    "High Card",
+    "Pair",
+    "Two Pair",
+    "Three of a Kind",
+    "Straight",
+    "Flush",
+    "Full House",
+    "Four of a Kind",
+    "Straight Flush",
+]  # Hand category names, indexed by category strength
+STATE_FIELDS = [
+    "player_balances",
+    "player_addresses",
+    "player_hands",
+    "board_cards",
+    "pot",
+    "hand_winner_index",
+    "tie_players",
+    "is_tie",
+    "last_pot_distribution",
+    "tournament_finished",
+    "tournament_winner_index",
+    "set_players_done",
+]  # Fields returned by get_state, in order
 
 
 class PokerTournament(gl.Contract):
@@ -25,17 +75,27 @@ class PokerTournament(gl.Contract):
         Address
     ]  # Array of player addresses (indexed by player position)
     player_hands: DynArray[str]  # Array of all player hands
+    player_seats: TreeMap[
+        Address, u256
+    ]  # Map of player address -> seat index in the player arrays
     player_eliminations: TreeMap[
         Address, PlayerElimination
     ]  # Map of player eliminations by address
+    elimination_order: DynArray[Address]  # Eliminated player addresses in bust-out order
     board_cards: str
     pot: u256  # Total pot amount
     hand_winner_index: u256  # Index of the winner of the last hand/round
     tie_players: DynArray[u256]  # Array of player indices in case of tie
     last_pot_distribution: DynArray[u256]  # Last pot distribution per player
+    last_hand_seats: DynArray[u256]  # Seats of the last hand, whose player_hands/last_pot_distribution slots are set
     tournament_finished: bool  # Whether the tournament has ended
     tournament_winner_index: u256  # Index of the tournament winner
     set_players_done: bool  # Whether players have been set (can only be set once)
+    total_chips: u256  # Sum of all player balances, maintained on every balance update
+    active_players: u256  # Number of players with balance > 0, maintained on every balance update
+    last_survivor_index: u256  # Index of the most recently seen player with balance > 0
+    hand_history: DynArray[HandRecord]  # Append-only log of settled hands, hand number = index + 1
+    state_version: u256  # Incremented on every state-changing write
 
     def __init__(self):
         # DynArray are automatically initialized by GenLayer
@@ -45,39 +105,197 @@ class PokerTournament(gl.Contract):
         self.tournament_finished = False
         self.tournament_winner_index = u256(0)
         self.set_players_done = False
+        self.total_chips = u256(0)
+        self.active_players = u256(0)
+        self.last_survivor_index = u256(0)
+        self.state_version = u256(0)
 
     @gl.public.view
     def get_state(self) -> typing.Any:
         """
         Returns the current state of the tournament contract.
         """
-        tie_players_list = []
-        for i in range(len(self.tie_players)):
-            tie_players_list.append(int(self.tie_players[i]))
+        return self._build_state(STATE_FIELDS)
 
-        balances_list = []
-        for i in range(len(self.player_balances)):
-            balances_list.append(int(self.player_balances[i]))
+    @gl.public.view
+    def get_state_if_changed(
+        self, since_version: int, fields: DynArray[str]
+    ) -> typing.Any:
+        """
+        Returns the selected state fields only if the state changed after since_version.
+        Intended for cheap polling: an unchanged state returns None without reading any arrays.
 
-        last_distribution_list = []
-        for i in range(len(self.last_pot_distribution)):
-            last_distribution_list.append(int(self.last_pot_distribution[i]))
+        Args:
+            since_version: state_version the caller last saw (-1 to always get the state)
+            fields: Names of the get_state fields to return (empty for all fields)
+        """
+        if int(self.state_version) <= since_version:
+            return None
+
+        selected_fields = list(fields) if len(fields) > 0 else STATE_FIELDS
+        return self._build_state(selected_fields)
+
+    def _build_state(self, fields: list[str]) -> dict:
+        """
+        Build the state dict for the given field names, reading only the storage they need.
+        """
+        state = {"state_version": int(self.state_version)}
+        for field in fields:
+            if field == "player_balances":
+                state[field] = [int(b) for b in self.player_balances]
+            elif field == "player_addresses":
+                state[field] = list(self.player_addresses)
+            elif field == "player_hands":
+                state[field] = list(self.player_hands)
+            elif field == "board_cards":
+                state[field] = self.board_cards
+            elif field == "pot":
+                state[field] = int(self.pot)
+            elif field == "hand_winner_index":
+                state[field] = int(self.hand_winner_index)
+            elif field == "tie_players":
+                state[field] = [int(idx) for idx in self.tie_players]
+            elif field == "is_tie":
+                state[field] = int(self.hand_winner_index) == 999999
+            elif field == "last_pot_distribution":
+                state[field] = [int(amount) for amount in self.last_pot_distribution]
+            elif field == "tournament_finished":
+                state[field] = self.tournament_finished
+            elif field == "tournament_winner_index":
+                state[field] = int(self.tournament_winner_index)
+            elif field == "set_players_done":
+                state[field] = self.set_players_done
+            else:
+                raise Exception(f"Unknown state field: {field}")
+        return state
+
+    @gl.public.view
+    def get_stack_summary(self) -> typing.Any:
+        """
+        Returns aggregate chip information without reading the player arrays.
+        Intended for cross-contract callers that only need totals.
+        """
+        player_count = len(self.player_balances)
+        total_chips = int(self.total_chips)
 
         return {
-            "player_balances": balances_list,
-            "player_addresses": list(self.player_addresses),
-            "player_hands": list(self.player_hands),
-            "board_cards": self.board_cards,
-            "pot": int(self.pot),
-            "hand_winner_index": int(self.hand_winner_index),
-            "tie_players": tie_players_list,
-            "is_tie": int(self.hand_winner_index) == 999999,
-            "last_pot_distribution": last_distribution_list,
+            "player_count": player_count,
+            "total_chips": total_chips,
+            "active_players": int(self.active_players),
+            "average_stack": total_chips // player_count if player_count > 0 else 0,
+        }
+
+    @gl.public.view
+    def get_status(self) -> typing.Any:
+        """
+        Returns the tournament status without reading the player arrays.
+        """
+        return {
             "tournament_finished": self.tournament_finished,
-            "tournament_winner_index": int(self.tournament_winner_index),
+            "tournament_winner_index": (
+                int(self.tournament_winner_index) if self.tournament_finished else -1
+            ),
+            "active_players": int(self.active_players),
             "set_players_done": self.set_players_done,
         }
 
+    @gl.public.view
+    def get_player_seat(self, player_address: str) -> int:
+        """
+        Get the seat index of a player by address, or -1 if the player is not seated.
+        """
+        return self._get_seat(Address(player_address))
+
+    @gl.public.view
+    def get_player_by_address(self, player_address: str) -> typing.Any:
+        """
+        Get the seat, balance and last hand of a player by address.
+        """
+        player_addr = Address(player_address)
+        seat = self._get_seat(player_addr)
+
+        if seat < 0:
+            return {
+                "seat_index": -1,
+                "balance": 0,
+                "player_hand": "",
+                "last_pot_share": 0,
+                "is_eliminated": False,
+            }
+
+        return {
+            "seat_index": seat,
+            "balance": (
+                int(self.player_balances[seat]) if seat < len(self.player_balances) else 0
+            ),
+            "player_hand": self.player_hands[seat] if seat < len(self.player_hands) else "",
+            "last_pot_share": (
+                int(self.last_pot_distribution[seat])
+                if seat < len(self.last_pot_distribution)
+                else 0
+            ),
+            "is_eliminated": player_addr in self.player_eliminations,
+        }
+
+    @gl.public.view
+    def get_hand_count(self) -> int:
+        """
+        Returns the number of settled hands (the hand number of the latest hand).
+        """
+        return len(self.hand_history)
+
+    @gl.public.view
+    def get_hands(self, from_hand: int, limit: int) -> typing.Any:
+        """
+        Returns a page of the hand history, starting at hand number from_hand (1-based).
+
+        Args:
+            from_hand: Hand number of the first hand to return
+            limit: Maximum number of hands to return (capped at MAX_HANDS_PAGE)
+        """
+        if from_hand < 1:
+            raise Exception("from_hand must be at least 1")
+        if limit < 0:
+            raise Exception("limit cannot be negative")
+
+        end_hand = min(from_hand + min(limit, MAX_HANDS_PAGE), len(self.hand_history) + 1)
+
+        hands = []
+        for hand_number in range(from_hand, end_hand):
+            record = self.hand_history[hand_number - 1]
+            seats = self._decode_ints(bytes(record.seats))
+            position_count = len(seats)
+            cards = bytes(record.cards)
+            addresses = bytes(record.addresses)
+
+            hands.append(
+                {
+                    "hand_number": hand_number,
+                    "seats": seats,
+                    "player_hands": [
+                        ""
+                        if cards[2 * i] == UNKNOWN_CARD and cards[2 * i + 1] == UNKNOWN_CARD
+                        else self._format_cards(cards[2 * i : 2 * i + 2])
+                        for i in range(position_count)
+                    ],  # "" for a player who folded
+                    "board_cards": self._format_cards(cards[2 * position_count :]),
+                    "winner_positions": self._decode_ints(bytes(record.winners)),
+                    "pot": int(record.pot),
+                    "deltas": self._decode_ints(bytes(record.deltas)),
+                    "player_addresses": [
+                        ""
+                        if addresses[20 * i : 20 * i + 20] == ADDRESS_PADDING
+                        else Address(addresses[20 * i : 20 * i + 20]).as_hex
+                        for i in range(position_count)
+                    ],  # "" for a seat that had no address
+                }
+            )
+
+        return {
+            "hands": hands,
+            "hand_count": len(self.hand_history),
+        }
+
     @gl.public.view
     def get_player_elimination(self, player_address: str) -> typing.Any:
         """
@@ -87,14 +305,7 @@ class PokerTournament(gl.Contract):
 
         # Access TreeMap by key directly
         if player_addr in self.player_eliminations:
-            elimination = self.player_eliminations[player_addr]
-            return {
-                "player_index": int(elimination.player_index),
-                "player_address": elimination.player_address.as_hex,
-                "player_hand": elimination.player_hand,
-                "opponent_hand": elimination.opponent_hand,
-                "board_cards": elimination.board_cards,
-            }
+            return self._elimination_to_dict(self.player_eliminations[player_addr])
 
         return {
             "player_index": -1,
@@ -102,6 +313,68 @@ class PokerTournament(gl.Contract):
             "player_hand": "",
             "opponent_hand": "",
             "board_cards": "",
+            "is_cooler": False,
+            "hand_rank_player": "",
+            "hand_rank_opponent": "",
+            "finish_position": 0,
+            "hand_number": 0,
+        }
+
+    @gl.public.view
+    def get_player_eliminations(self, player_address: str) -> typing.Any:
+        """
+        Get the elimination records of a player as a list (empty if the player was not eliminated).
+        """
+        player_addr = Address(player_address)
+        if player_addr in self.player_eliminations:
+            return [self._elimination_to_dict(self.player_eliminations[player_addr])]
+        return []
+
+    @gl.public.view
+    def get_all_eliminations(self, cursor: int = 0, limit: int = MAX_ELIMINATIONS_PAGE) -> typing.Any:
+        """
+        Get eliminations in bust-out order, starting at position cursor (0-based).
+        The next page starts at cursor + len(result); get_elimination_count gives the total.
+
+        Args:
+            cursor: Position in the bust-out order of the first elimination to return
+            limit: Maximum number of eliminations to return (capped at MAX_ELIMINATIONS_PAGE)
+        """
+        if cursor < 0:
+            raise Exception("cursor cannot be negative")
+        if limit < 0:
+            raise Exception("limit cannot be negative")
+
+        end = min(cursor + min(limit, MAX_ELIMINATIONS_PAGE), len(self.elimination_order))
+
+        eliminations = []
+        for i in range(cursor, end):
+            player_addr = self.elimination_order[i]
+            eliminations.append(self._elimination_to_dict(self.player_eliminations[player_addr]))
+        return eliminations
+
+    @gl.public.view
+    def get_elimination_count(self) -> int:
+        """
+        Returns the number of eliminated players.
+        """
+        return len(self.elimination_order)
+
+    def _elimination_to_dict(self, elimination: PlayerElimination) -> dict:
+        """
+        Convert an elimination record into its view representation.
+        """
+        return {
+            "player_index": int(elimination.player_index),
+            "player_address": elimination.player_address.as_hex,
+            "player_hand": elimination.player_hand,
+            "opponent_hand": elimination.opponent_hand,
+            "board_cards": elimination.board_cards,
+            "is_cooler": elimination.is_cooler,
+            "hand_rank_player": elimination.hand_rank_player,
+            "hand_rank_opponent": elimination.hand_rank_opponent,
+            "finish_position": int(elimination.finish_position),
+            "hand_number": int(elimination.hand_number),
         }
 
     @gl.public.view
@@ -177,6 +450,363 @@ class PokerTournament(gl.Contract):
             "tournament_finished": True,
         }
 
+    def _replace_array(self, array: typing.Any, values: list) -> None:
+        """
+        Replace the contents of a storage array in place.
+        Only slots whose value changed are written, and the length is only
+        adjusted by the difference between the old and new sizes.
+        """
+        common_length = min(len(array), len(values))
+        for i in range(common_length):
+            if array[i] != values[i]:
+                array[i] = values[i]
+
+        for _ in range(len(array) - len(values)):
+            array.pop()
+
+        for i in range(common_length, len(values)):
+            array.append(values[i])
+
+    def _write_last_hand(
+        self, seats: list[int], players: DynArray[str], distribution: list[int]
+    ) -> None:
+        """
+        Record the hands and pot distribution of the last hand in the seat-indexed
+        player_hands and last_pot_distribution arrays. Only the previous hand's
+        seats are cleared and this hand's seats set. set_players sizes the
+        arrays to the table and they never shrink, so a hand at a large table
+        writes a number of slots proportional to its own size.
+
+        Args:
+            seats: Seat of each hand position
+            players: Hand of each hand position
+            distribution: Pot share of each hand position
+        """
+        new_seats = set(seats)
+        for seat in self.last_hand_seats:
+            seat = int(seat)
+            if seat in new_seats:
+                continue
+            if self.player_hands[seat] != "":
+                self.player_hands[seat] = ""
+            if int(self.last_pot_distribution[seat]) != 0:
+                self.last_pot_distribution[seat] = u256(0)
+
+        # Only seats beyond those sized by set_players need new slots
+        seat_count = max(seats) + 1
+        while len(self.player_hands) < seat_count:
+            self.player_hands.append("")
+        while len(self.last_pot_distribution) < seat_count:
+            self.last_pot_distribution.append(u256(0))
+
+        for i, seat in enumerate(seats):
+            if self.player_hands[seat] != players[i]:
+                self.player_hands[seat] = players[i]
+            if int(self.last_pot_distribution[seat]) != distribution[i]:
+                self.last_pot_distribution[seat] = u256(distribution[i])
+
+        self._replace_array(self.last_hand_seats, [u256(seat) for seat in seats])
+
+    def _parse_cards(self, cards_str: str) -> list[int]:
+        """
+        Parse a card string (suit symbol followed by rank, e.g. "♠A♥10") into card codes.
+        A card code is suit_index * 13 + rank_index; unparseable ranks map to UNKNOWN_CARD.
+        """
+        codes = []
+        if not cards_str:
+            return codes
+
+        suit_index = -1
+        rank = ""
+        for char in cards_str + SUIT_SYMBOLS[0]:
+            if char in SUIT_SYMBOLS:
+                if suit_index >= 0:
+                    rank = "10" if rank == "T" else rank
+                    if rank in CARD_RANKS:
+                        codes.append(suit_index * 13 + CARD_RANKS.index(rank))
+                    else:
+                        codes.append(UNKNOWN_CARD)
+                suit_index = SUIT_SYMBOLS.index(char)
+                rank = ""
+            elif not char.isspace():
+                rank += char.upper()
+        return codes
+
+    def _is_folded(self, player_hand: str) -> bool:
+        """
+        A player who folded (or is no longer in the game) is sent with an empty hand.
+        """
+        return not player_hand or not player_hand.strip()
+
+    def _validate_cards(
+        self,
+        players: list[str],
+        board_cards: str,
+        player_bets: list[int],
+        error_prefix: str = "",
+    ) -> None:
+        """
+        Reject a hand whose cards could not have been dealt from a single deck.
+        Every player still in the hand must hold exactly 2 known cards, every board
+        card must be known, and no card may appear twice. All hole and board cards
+        are folded into a 52-bit mask in one pass, so a repeated card costs a single
+        bit test. A folded player (empty hand) holds no cards and must bet 0.
+
+        Args:
+            players: Array of player hands (each player has 2 cards, or "" if folded)
+            board_cards: The community cards (or empty string for pre-flop)
+            player_bets: Array of bets made by each player
+            error_prefix: Prepended to error messages (e.g. "Hand 3: " in a batch)
+        """
+        live_players = 0
+        seen_cards = 0
+        for i in range(len(players) + 1):
+            cards_str = players[i] if i < len(players) else board_cards
+            if i < len(players) and self._is_folded(cards_str):
+                if int(player_bets[i]) != 0:
+                    raise Exception(f"{error_prefix}Folded player {i} must have a bet of 0")
+                continue
+            if i < len(players):
+                live_players += 1
+
+            codes = self._parse_cards(cards_str)
+            if i < len(players) and len(codes) != 2:
+                raise Exception(
+                    f"{error_prefix}Player {i} must have exactly 2 cards. Found {len(codes)} cards."
+                )
+
+            for code in codes:
+                if code == UNKNOWN_CARD:
+                    raise Exception(f"{error_prefix}Unrecognized card in '{cards_str}'")
+                card_bit = 1 << code
+                if seen_cards & card_bit:
+                    raise Exception(
+                        f"{error_prefix}Card {self._format_cards(bytes([code]))} is dealt more than once"
+                    )
+                seen_cards |= card_bit
+
+        if live_players == 0:
+            raise Exception(f"{error_prefix}At least one player must still be in the hand")
+
+    def _format_cards(self, codes: bytes) -> str:
+        """
+        Format card codes back into the suit-symbol card notation.
+        """
+        cards = []
+        for code in codes:
+            if code == UNKNOWN_CARD:
+                cards.append("?")
+            else:
+                cards.append(SUIT_SYMBOLS[code // 13] + CARD_RANKS[code % 13])
+        return "".join(cards)
+
+    def _score_hand(self, codes: list[int]) -> tuple:
+        """
+        Score the best 5-card hand that can be made from the given card codes.
+        Scores compare as tuples: (category, tiebreak ranks...). With fewer than
+        5 cards (pre-flop) only pairs, trips and quads are considered.
+        """
+        if len(codes) <= 5:
+            return self._score_cards(codes)
+
+        best_score = None
+        for combination in itertools.combinations(codes, 5):
+            score = self._score_cards(list(combination))
+            if best_score is None or score > best_score:
+                best_score = score
+        return best_score
+
+    def _score_cards(self, codes: list[int]) -> tuple:
+        """
+        Score a hand of at most 5 card codes. See _score_hand.
+        """
+        ranks = sorted([code % 13 for code in codes], reverse=True)
+        rank_counts = {}
+        for rank in ranks:
+            rank_counts[rank] = rank_counts.get(rank, 0) + 1
+        # Groups ordered by size, then by rank: e.g. full house -> [(3, r1), (2, r2)]
+        groups = sorted([(count, rank) for rank, count in rank_counts.items()], reverse=True)
+        grouped_ranks = [rank for _, rank in groups]
+
+        straight_high = -1
+        is_flush = False
+        if len(codes) == 5:
+            is_flush = len(set(code // 13 for code in codes)) == 1
+            if len(rank_counts) == 5:
+                if ranks[0] - ranks[4] == 4:
+                    straight_high = ranks[0]
+                elif ranks == [12, 3, 2, 1, 0]:
+                    straight_high = 3  # Wheel: A-2-3-4-5
+
+        if straight_high >= 0 and is_flush:
+            return (8, straight_high)
+        if groups[0][0] == 4:
+            return (7, *grouped_ranks)
+        if groups[0][0] == 3 and len(groups) > 1 and groups[1][0] == 2:
+            return (6, *grouped_ranks)
+        if is_flush:
+            return (5, *ranks)
+        if straight_high >= 0:
+            return (4, straight_high)
+        if groups[0][0] == 3:
+            return (3, *grouped_ranks)
+        if groups[0][0] == 2 and len(groups) > 1 and groups[1][0] == 2:
+            return (2, *grouped_ranks)
+        if groups[0][0] == 2:
+            return (1, *grouped_ranks)
+        return (0, *ranks)
+
+    def _classify_elimination(
+        self, player_hand: str, opponent_hand: str, board_cards: str
+    ) -> dict:
+        """
+        Deterministically rank the eliminated player's and the winner's hands and
+        decide whether the bust-out was a cooler: the player lost holding three of a
+        kind or better that their hole cards improved over the board (or, pre-flop,
+        pocket queens or better / ace-king) to a stronger hand.
+        """
+        player_codes = self._parse_cards(player_hand)
+        opponent_codes = self._parse_cards(opponent_hand)
+        board_codes = self._parse_cards(board_cards)
+
+        all_codes = player_codes + opponent_codes + board_codes
+        if len(player_codes) != 2 or len(opponent_codes) != 2 or UNKNOWN_CARD in all_codes:
+            return {
+                "is_cooler": False,
+                "hand_rank_player": "Unknown",
+                "hand_rank_opponent": "Unknown",
+            }
+
+        player_score = self._score_hand(player_codes + board_codes)
+        opponent_score = self._score_hand(opponent_codes + board_codes)
+
+        if len(board_codes) == 0:
+            hole_ranks = sorted([code % 13 for code in player_codes], reverse=True)
+            is_strong = (hole_ranks[0] == hole_ranks[1] and hole_ranks[0] >= 10) or hole_ranks == [12, 11]
+        else:
+            is_strong = player_score[0] >= 3 and player_score > self._score_hand(board_codes)
+
+        return {
+            "is_cooler": is_strong and opponent_score > player_score,
+            "hand_rank_player": HAND_CATEGORIES[player_score[0]],
+            "hand_rank_opponent": HAND_CATEGORIES[opponent_score[0]],
+        }
+
+    def _record_eliminations(
+        self,
+        busted: list[tuple[int, str]],
+        opponent_hand: str,
+        board_cards: str,
+        worst_position: int,
+        hand_number: int,
+    ) -> None:
+        """
+        Record the players who busted in one hand, in bust-out order.
+
+        Args:
+            busted: (seat, player_hand) of each busted player, worst finish first
+            opponent_hand: Hand of the (first) winner of the hand
+            board_cards: Board of the hand
+            worst_position: Finish position of the first busted player
+            hand_number: Hand number the players busted in
+        """
+        # Pre-create zero address to avoid creating it multiple times in the loop
+        zero_address = Address("0x0000000000000000000000000000000000000000")
+
+        for order, (seat, player_hand) in enumerate(busted):
+            # Get player address - reuse existing or use pre-created zero address
+            if seat < len(self.player_addresses):
+                player_address = self.player_addresses[seat]
+            else:
+                player_address = zero_address
+
+            # Create elimination record (only if player hasn't been eliminated before)
+            if player_address in self.player_eliminations:
+                continue
+
+            classification = self._classify_elimination(
+                player_hand, opponent_hand, board_cards
+            )
+            self.player_eliminations[player_address] = PlayerElimination(
+                player_index=u256(seat),
+                player_address=player_address,
+                player_hand=player_hand,
+                opponent_hand=opponent_hand,
+                board_cards=board_cards,
+                is_cooler=classification["is_cooler"],
+                hand_rank_player=classification["hand_rank_player"],
+                hand_rank_opponent=classification["hand_rank_opponent"],
+                finish_position=u256(worst_position - order),
+                hand_number=u256(hand_number),
+            )
+            self.elimination_order.append(player_address)
+
+    def _append_hand_record(
+        self,
+        seats: list[int],
+        players: DynArray[str],
+        board_cards: str,
+        winner_positions: list[int],
+        pot_amount: int,
+        deltas: list[int],
+    ) -> int:
+        """
+        Append a compact record of a settled hand to the hand history.
+
+        Returns:
+            The hand number of the new record
+        """
+        cards = bytearray()
+        for i in range(len(players)):
+            hole_codes = (self._parse_cards(players[i]) + [UNKNOWN_CARD, UNKNOWN_CARD])[:2]
+            cards.extend(hole_codes)
+        cards.extend(self._parse_cards(board_cards))
+
+        # Keep who held each seat, as set_players may reseat addresses later
+        addresses = bytearray()
+        for seat in seats:
+            if seat < len(self.player_addresses):
+                addresses.extend(self.player_addresses[seat].as_bytes)
+            else:
+                addresses.extend(ADDRESS_PADDING)
+
+        self.hand_history.append(
+            HandRecord(
+                seats=self._encode_ints(seats),
+                cards=bytes(cards),
+                winners=self._encode_ints(sorted(winner_positions)),
+                pot=u256(pot_amount),
+                deltas=self._encode_ints(deltas),
+                addresses=bytes(addresses),
+            )
+        )
+        return len(self.hand_history)
+
+    def _encode_ints(self, values: list[int]) -> bytes:
+        """
+        Encode integers of any size as a length byte followed by the minimal
+        signed big-endian bytes of each value, so seats and chip changes of
+        u256 balances never overflow a fixed-width field.
+        """
+        encoded = bytearray()
+        for value in values:
+            length = value.bit_length() // 8 + 1  # One spare bit for the sign
+            encoded.append(length)
+            encoded.extend(value.to_bytes(length, "big", signed=True))
+        return bytes(encoded)
+
+    def _decode_ints(self, data: bytes) -> list[int]:
+        """
+        Decode integers written by _encode_ints.
+        """
+        values = []
+        offset = 0
+        while offset < len(data):
+            length = data[offset]
+            values.append(int.from_bytes(data[offset + 1 : offset + 1 + length], "big", signed=True))
+            offset += 1 + length
+        return values
+
     def _count_cards(self, cards_str: str) -> int:
         """
         Count the number of cards in a string representation.
@@ -194,22 +824,19 @@ class PokerTournament(gl.Contract):
     def _check_tournament_finished(self) -> None:
         """
         Check if the tournament has finished (only one player has balance > 0).
+        Uses the incrementally maintained active_players counter instead of scanning balances.
         Tournament is only finished if there are at least 2 players registered and only one has balance.
         If so, set tournament_finished to True and tournament_winner_index to that player's index.
         If there are multiple players with balance, reset tournament_finished to False.
         """
-        players_with_balance = []
-        for i in range(len(self.player_balances)):
-            if int(self.player_balances[i]) > 0:
-                players_with_balance.append(i)
-
         total_players = len(self.player_balances)
+        active_players = int(self.active_players)
 
-        if len(players_with_balance) == 1 and total_players >= 2:
+        if active_players == 1 and total_players >= 2:
             # Tournament finished: at least 2 players were registered, only one has balance
             self.tournament_finished = True
-            self.tournament_winner_index = u256(players_with_balance[0])
-        elif len(players_with_balance) == 0:
+            self.tournament_winner_index = u256(self._find_survivor_index())
+        elif active_players == 0:
             # Edge case: all players have 0 balance (shouldn't happen, but handle it)
             self.tournament_finished = True
             self.tournament_winner_index = u256(999999)  # No winner
@@ -217,6 +844,25 @@ class PokerTournament(gl.Contract):
             # Multiple players with balance, or only one player registered (tournament not started)
             self.tournament_finished = False
 
+    def _find_survivor_index(self) -> int:
+        """
+        Get the index of the only player with balance > 0.
+        last_survivor_index is kept up to date by every balance update, so the scan
+        below only runs if the survivor was not touched by the last update.
+        """
+        survivor_index = int(self.last_survivor_index)
+        if (
+            survivor_index < len(self.player_balances)
+            and int(self.player_balances[survivor_index]) > 0
+        ):
+            return survivor_index
+
+        for i in range(len(self.player_balances)):
+            if int(self.player_balances[i]) > 0:
+                self.last_survivor_index = u256(i)
+                return i
+        return 999999
+
     @gl.public.write
     def set_players(
         self, balances: DynArray[int], addresses: DynArray[str]
@@ -232,23 +878,48 @@ class PokerTournament(gl.Contract):
             if balance < 0:
                 raise Exception(f"Balance for player {i} cannot be negative")
 
-        # Clear existing balances
-        while len(self.player_balances) > 0:
-            self.player_balances.pop()
-
-        # Set new balances
-        for balance in balances:
-            self.player_balances.append(u256(balance))
-
-        while len(self.player_addresses) > 0:
-            self.player_addresses.pop()
+        # Recompute the aggregate counters from the new balances
+        total_chips = 0
+        active_players = 0
+        survivor_index = 0
+        for i, balance in enumerate(balances):
+            total_chips += int(balance)
+            if int(balance) > 0:
+                active_players += 1
+                survivor_index = i
+        self.total_chips = u256(total_chips)
+        self.active_players = u256(active_players)
+        self.last_survivor_index = u256(survivor_index)
+
+        new_addresses = [Address(a) for a in addresses]
+        new_address_set = set(new_addresses)
+        if len(new_address_set) != len(new_addresses):
+            raise Exception("Player addresses must be unique")
+
+        # Drop seat entries of addresses that are no longer seated
+        for old_address in self.player_addresses:
+            if old_address not in new_address_set and old_address in self.player_seats:
+                del self.player_seats[old_address]
+
+        # Overwrite balances and addresses in place, touching only changed slots
+        self._replace_array(self.player_balances, [u256(b) for b in balances])
+        self._replace_array(self.player_addresses, new_addresses)
+
+        # Size the last-hand arrays with the table, so hands never need to grow them
+        while len(self.player_hands) < len(balances):
+            self.player_hands.append("")
+        while len(self.last_pot_distribution) < len(balances):
+            self.last_pot_distribution.append(u256(0))
 
-        for address in addresses:
-            self.player_addresses.append(Address(address))
+        # Index seats by address, writing only entries that moved
+        for i, address in enumerate(new_addresses):
+            if self.player_seats.get(address, None) != u256(i):
+                self.player_seats[address] = u256(i)
 
         # Check if tournament has finished after balance update
         self._check_tournament_finished()
         self.set_players_done = True
+        self.state_version += u256(1)
 
         return {
             "player_balances": [int(b) for b in self.player_balances],
@@ -294,6 +965,295 @@ class PokerTournament(gl.Contract):
                 f"player_bets length ({len(player_bets)}) must match players length ({len(players)})"
             )
 
+        return self._play_hand(
+            list(range(len(players))), players, board_cards, player_bets
+        )
+
+    @gl.public.write
+    def calculate_winners_by_address(
+        self,
+        player_addresses: DynArray[str],
+        players: DynArray[str],
+        board_cards: str,
+        player_bets: DynArray[int],
+    ) -> typing.Any:
+        """
+        Same as calculate_winners, but the players in the hand are identified by address
+        instead of by position. Only the seats of the listed players are read and updated.
+
+        Args:
+            player_addresses: Addresses of the players in the hand (must have been set with set_players)
+            players: Array of player hands, in the same order as player_addresses
+            board_cards: The 5 community cards (or empty string for pre-flop)
+            player_bets: Array of bets made by each player, in the same order as player_addresses
+        """
+        if board_cards is None:
+            board_cards = ""
+
+        card_count = self._count_cards(board_cards)
+        if card_count != 0 and card_count != 5:
+            raise Exception(
+                f"Board cards must have exactly 5 cards or be empty (pre-flop). Found {card_count} cards."
+            )
+
+        if len(players) < 2:
+            raise Exception("At least 2 players are required")
+
+        if len(player_addresses) != len(players):
+            raise Exception(
+                f"player_addresses length ({len(player_addresses)}) must match players length ({len(players)})"
+            )
+
+        if len(player_bets) != len(players):
+            raise Exception(
+                f"player_bets length ({len(player_bets)}) must match players length ({len(players)})"
+            )
+
+        seats = []
+        for player_address in player_addresses:
+            seat = self._get_seat(Address(player_address))
+            if seat < 0:
+                raise Exception(f"Player {player_address} is not seated in this tournament")
+            if seat in seats:
+                raise Exception(f"Player {player_address} appears more than once in the hand")
+            seats.append(seat)
+
+        return self._play_hand(seats, players, board_cards, player_bets)
+
+    @gl.public.write
+    def calculate_winners_batch(self, hands: list[typing.Any]) -> typing.Any:
+        """
+        Settle several hands, in order, in a single transaction.
+        Hands are judged in one deterministic pass with the built-in hand evaluator
+        instead of one LLM round per hand. Balances are tracked in memory across the
+        batch and each changed seat, the last-hand state and the finish state are
+        written once at the end.
+
+        Args:
+            hands: Array of hands, each a dict with:
+                - players: Array of player hands (each player has 2 cards)
+                - board_cards: The 5 community cards (or empty string for pre-flop)
+                - player_bets: Array of bets made by each player
+                - player_addresses: Optional addresses of the players; when omitted
+                  player i of the hand sits at seat i, as in calculate_winners
+        """
+        if len(hands) == 0:
+            raise Exception("At least one hand is required")
+
+        if self.tournament_finished:
+            raise Exception("Tournament has already finished")
+
+        balances = {}  # seat -> balance, loaded lazily and written back at the end
+        starting_balances = {}
+        active_players = int(self.active_players)
+        survivor_index = -1
+        results = []
+
+        for hand_index, hand in enumerate(hands):
+            players = list(hand.get("players", []))
+            board_cards = hand.get("board_cards", "") or ""
+            player_bets = [int(bet) for bet in hand.get("player_bets", [])]
+
+            card_count = self._count_cards(board_cards)
+            if card_count != 0 and card_count != 5:
+                raise Exception(
+                    f"Hand {hand_index}: board cards must have exactly 5 cards or be empty (pre-flop). Found {card_count} cards."
+                )
+
+            if len(players) < 2:
+                raise Exception(f"Hand {hand_index}: at least 2 players are required")
+
+            if len(player_bets) != len(players):
+                raise Exception(
+                    f"Hand {hand_index}: player_bets length ({len(player_bets)}) must match players length ({len(players)})"
+                )
+
+            if active_players <= 1 and len(self.player_balances) >= 2:
+                raise Exception(f"Hand {hand_index}: tournament has already finished")
+
+            if "player_addresses" in hand:
+                player_addresses = list(hand["player_addresses"])
+                if len(player_addresses) != len(players):
+                    raise Exception(
+                        f"Hand {hand_index}: player_addresses length ({len(player_addresses)}) must match players length ({len(players)})"
+                    )
+                seats = []
+                for player_address in player_addresses:
+                    seat = self._get_seat(Address(player_address))
+                    if seat < 0 or seat in seats:
+                        raise Exception(
+                            f"Hand {hand_index}: player {player_address} is not seated or appears twice"
+                        )
+                    seats.append(seat)
+            else:
+                seats = list(range(len(players)))
+
+            # Load balances of seats seen for the first time in this batch
+            while len(self.player_balances) <= max(seats):
+                self.player_balances.append(u256(0))
+            for seat in seats:
+                if seat not in balances:
+                    balances[seat] = int(self.player_balances[seat])
+                    starting_balances[seat] = balances[seat]
+
+            previous_balances = [balances[seat] for seat in seats]
+            pot_amount = 0
+            for i in range(len(players)):
+                if player_bets[i] < 0:
+                    raise Exception(f"Hand {hand_index}: player bet cannot be negative")
+                if previous_balances[i] < player_bets[i]:
+                    raise Exception(
+                        f"Hand {hand_index}: player {seats[i]} has insufficient balance ({previous_balances[i]}) for bet ({player_bets[i]})"
+                    )
+                pot_amount += player_bets[i]
+
+            self._validate_cards(players, board_cards, player_bets, f"Hand {hand_index}: ")
+            winner_positions = self._judge_hand(players, board_cards, hand_index)
+
+            # Settle the hand in memory
+            new_balances = [previous_balances[i] - player_bets[i] for i in range(len(players))]
+            distribution = [0] * len(players)
+            pot_per_player = pot_amount // len(winner_positions)
+            remainder = pot_amount % len(winner_positions)
+            for order, position in enumerate(winner_positions):
+                amount = pot_per_player + (1 if order < remainder else 0)
+                new_balances[position] += amount
+                distribution[position] = amount
+
+            busted_positions = []
+            for i in range(len(players)):
+                balances[seats[i]] = new_balances[i]
+                if previous_balances[i] == 0 and new_balances[i] > 0:
+                    active_players += 1
+                if new_balances[i] > 0:
+                    survivor_index = seats[i]
+                if previous_balances[i] > 0 and new_balances[i] == 0:
+                    active_players -= 1
+                    busted_positions.append(i)
+
+            hand_number = self._append_hand_record(
+                seats,
+                players,
+                board_cards,
+                winner_positions,
+                pot_amount,
+                [new_balances[i] - previous_balances[i] for i in range(len(players))],
+            )
+
+            busted_positions.sort(key=lambda position: previous_balances[position])
+            self._record_eliminations(
+                [(seats[i], players[i]) for i in busted_positions],
+                players[winner_positions[0]],
+                board_cards,
+                active_players + len(busted_positions),
+                hand_number,
+            )
+
+            results.append(
+                {
+                    "hand_number": hand_number,
+                    "winner_seats": [seats[position] for position in winner_positions],
+                    "pot_distributed": pot_amount,
+                }
+            )
+
+            # Keep the last hand's details for the single end-of-batch write below
+            last_seats = seats
+            last_players = players
+            last_board_cards = board_cards
+            last_pot = pot_amount
+            last_winner_positions = winner_positions
+            last_distribution = distribution
+
+        # Write each changed seat once
+        for seat, balance in balances.items():
+            if balance != starting_balances[seat]:
+                self.player_balances[seat] = u256(balance)
+
+        # Every pot goes to at least one winner, so total_chips is unchanged
+        self.active_players = u256(active_players)
+        if survivor_index >= 0:
+            self.last_survivor_index = u256(survivor_index)
+
+        # Last-hand state reflects the final hand of the batch
+        if len(last_winner_positions) == 1:
+            self.hand_winner_index = u256(last_seats[last_winner_positions[0]])
+            tie_seats = []
+        else:
+            self.hand_winner_index = u256(999999)
+            tie_seats = [last_seats[position] for position in last_winner_positions]
+        self._replace_array(self.tie_players, [u256(seat) for seat in tie_seats])
+        self._write_last_hand(last_seats, last_players, last_distribution)
+        self.board_cards = last_board_cards
+        self.pot = u256(last_pot)
+
+        self._check_tournament_finished()
+        self.state_version += u256(1)
+
+        return {
+            "hands": results,
+            "player_balances": [int(b) for b in self.player_balances],
+            "tournament_finished": self.tournament_finished,
+            "tournament_winner_index": (
+                int(self.tournament_winner_index) if self.tournament_finished else -1
+            ),
+        }
+
+    def _judge_hand(
+        self, players: list[str], board_cards: str, hand_index: int = 0
+    ) -> list[int]:
+        """
+        Deterministically determine the winning hand position(s) with the hand evaluator.
+
+        Folded players (empty hands) are left out.
+
+        Returns:
+            Positions of the players with the best hand (more than one on a tie)
+        """
+        board_codes = self._parse_cards(board_cards)
+        if UNKNOWN_CARD in board_codes:
+            raise Exception(f"Hand {hand_index}: board cards could not be parsed")
+
+        best_score = None
+        winner_positions = []
+        for i in range(len(players)):
+            if self._is_folded(players[i]):
+                continue
+
+            hole_codes = self._parse_cards(players[i])
+            if len(hole_codes) != 2 or UNKNOWN_CARD in hole_codes:
+                raise Exception(f"Hand {hand_index}: hand of player {i} could not be parsed")
+
+            score = self._score_hand(hole_codes + board_codes)
+            if best_score is None or score > best_score:
+                best_score = score
+                winner_positions = [i]
+            elif score == best_score:
+                winner_positions.append(i)
+        return winner_positions
+
+    def _get_seat(self, player_addr: Address) -> int:
+        """
+        Get the seat index of a player, or -1 if the address is not seated.
+        """
+        if player_addr in self.player_seats:
+            return int(self.player_seats[player_addr])
+        return -1
+
+    def _play_hand(
+        self,
+        seats: list[int],
+        players: DynArray[str],
+        board_cards: str,
+        player_bets: DynArray[int],
+    ) -> typing.Any:
+        """
+        Judge a hand and settle it. Hand position i belongs to seat seats[i];
+        only those seats are read and written.
+        """
+        # Reject duplicate or malformed cards before any state is touched or the judge runs
+        self._validate_cards(players, board_cards, player_bets)
+
         # Calculate pot amount as sum of all bets
         pot_amount = 0
         for bet in player_bets:
@@ -302,28 +1262,28 @@ class PokerTournament(gl.Contract):
             pot_amount += int(bet)
 
         # Ensure player_balances array is large enough
-        while len(self.player_balances) < len(players):
+        seat_count = max(seats) + 1
+        while len(self.player_balances) < seat_count:
             self.player_balances.append(u256(0))
 
         # Save previous balances BEFORE deducting bets (to detect eliminations)
         previous_balances = []
         for i in range(len(players)):
-            previous_balances.append(int(self.player_balances[i]))
+            previous_balances.append(int(self.player_balances[seats[i]]))
 
         # Validate that each player has sufficient balance for their bet
         for i in range(len(players)):
-            current_balance = int(self.player_balances[i])
+            current_balance = previous_balances[i]
             bet_amount = int(player_bets[i])
             if current_balance < bet_amount:
                 raise Exception(
-                    f"Player {i} has insufficient balance ({current_balance}) for bet ({bet_amount})"
+                    f"Player {seats[i]} has insufficient balance ({current_balance}) for bet ({bet_amount})"
                 )
 
-        # Deduct bets from player balances
+        # Deduct bets locally; balances are written once, after the pot is distributed
+        new_balances = []
         for i in range(len(players)):
-            current_balance = int(self.player_balances[i])
-            bet_amount = int(player_bets[i])
-            self.player_balances[i] = u256(current_balance - bet_amount)
+            new_balances.append(previous_balances[i] - int(player_bets[i]))
 
         # Build input and call the same internal prompt
         hands_list = []
@@ -405,42 +1365,30 @@ CRITICAL REQUIREMENTS:
         if not isinstance(tie_players, list):
             tie_players = []
 
+        # Hand positions returned by the judge are mapped back to seats
         if winner_index >= 0:
-            self.hand_winner_index = u256(winner_index)
+            winner_seat = seats[winner_index]
+            self.hand_winner_index = u256(winner_seat)
         else:
+            winner_seat = -1
             self.hand_winner_index = u256(999999)
+        tie_seats = [seats[idx] for idx in tie_players]
 
-        # Reset tie_players storage array
-        while len(self.tie_players) > 0:
-            self.tie_players.pop()
-        for idx in tie_players:
-            self.tie_players.append(u256(idx))
-
-        # Replace stored player_hands with provided players
-        # Clear existing player_hands first
-        while len(self.player_hands) > 0:
-            self.player_hands.pop()
-        # Add new player hands - iterate by index to handle DynArray correctly
-        for i in range(len(players)):
-            self.player_hands.append(players[i])
+        # Overwrite tie_players in place, touching only changed slots
+        self._replace_array(self.tie_players, [u256(seat) for seat in tie_seats])
 
         self.board_cards = board_cards
         self.pot = u256(pot_amount)
 
         # Distribute pot and update balances
-        # Reset last_pot_distribution
-        while len(self.last_pot_distribution) > 0:
-            self.last_pot_distribution.pop()
-
-        # Initialize distribution array to match player count
-        for i in range(len(players)):
-            self.last_pot_distribution.append(u256(0))
+        distribution = [0] * len(players)
 
+        distributed_amount = 0
         if winner_index >= 0:
             # Single winner gets the entire pot
-            current_balance = int(self.player_balances[winner_index])
-            self.player_balances[winner_index] = u256(current_balance + pot_amount)
-            self.last_pot_distribution[winner_index] = u256(pot_amount)
+            new_balances[winner_index] += pot_amount
+            distribution[winner_index] = pot_amount
+            distributed_amount = pot_amount
         elif len(tie_players) > 0:
             # Split pot equally among tied players
             pot_per_player = pot_amount // len(tie_players)
@@ -448,54 +1396,80 @@ CRITICAL REQUIREMENTS:
 
             # Distribute pot equally
             for i, tied_idx in enumerate(tie_players):
-                current_balance = int(self.player_balances[tied_idx])
                 # Give remainder to first player(s) if pot doesn't divide evenly
                 amount = pot_per_player + (1 if i < remainder else 0)
-                self.player_balances[tied_idx] = u256(current_balance + amount)
-                self.last_pot_distribution[tied_idx] = u256(amount)
+                new_balances[tied_idx] += amount
+                distribution[tied_idx] = amount
+                distributed_amount += amount
 
-        # Pre-create zero address to avoid creating it multiple times in the loop
-        zero_address = Address("0x0000000000000000000000000000000000000000")
+        # Write back only the seats whose balance actually changed
+        for i in range(len(players)):
+            if new_balances[i] != previous_balances[i]:
+                self.player_balances[seats[i]] = u256(new_balances[i])
+        self._write_last_hand(seats, players, distribution)
+
+        # Bets left the balances and the distributed pot came back in
+        self.total_chips = u256(int(self.total_chips) - pot_amount + distributed_amount)
+
+        if winner_index >= 0:
+            winner_positions = [winner_index]
+        else:
+            winner_positions = list(tie_players)
+        hand_number = self._append_hand_record(
+            seats,
+            players,
+            board_cards,
+            winner_positions,
+            pot_amount,
+            [new_balances[i] - previous_balances[i] for i in range(len(players))],
+        )
 
         # Track player eliminations (balance went from > 0 to == 0)
+        survivor_index = -1
+        busted_positions = []
         for i in range(len(players)):
             previous_balance = previous_balances[i]
-            current_balance = int(self.player_balances[i])
+            current_balance = new_balances[i]
+
+            # Keep the active player counter in step with seats crossing zero
+            if previous_balance == 0 and current_balance > 0:
+                self.active_players = u256(int(self.active_players) + 1)
+            if current_balance > 0:
+                survivor_index = seats[i]
 
             # Player was eliminated if they had balance before and now have 0
             if previous_balance > 0 and current_balance == 0:
-                # Player was eliminated in this hand
-                # Get player address - reuse existing or use pre-created zero address
-                if i < len(self.player_addresses):
-                    player_address = self.player_addresses[i]
-                else:
-                    player_address = zero_address
-
-                # Determine opponent hand(s) - the winner(s)
-                if winner_index >= 0:
-                    opponent_hand = players[winner_index]
-                elif len(tie_players) > 0:
-                    opponent_hand = players[tie_players[0]]
-                else:
-                    opponent_hand = ""
-
-                # Create elimination record (only if player hasn't been eliminated before)
-                if player_address not in self.player_eliminations:
-                    elimination = PlayerElimination(
-                        player_index=u256(i),
-                        player_address=player_address,
-                        player_hand=players[i],
-                        opponent_hand=opponent_hand,
-                        board_cards=board_cards,
-                    )
-                    self.player_eliminations[player_address] = elimination
+                self.active_players = u256(int(self.active_players) - 1)
+                busted_positions.append(i)
+
+        if survivor_index >= 0:
+            self.last_survivor_index = u256(survivor_index)
+
+        # Determine opponent hand(s) - the winner(s)
+        if len(winner_positions) > 0:
+            opponent_hand = players[winner_positions[0]]
+        else:
+            opponent_hand = ""
+
+        # Players busting in the same hand finish in order of their starting stacks:
+        # the smallest stack takes the worst remaining position
+        busted_positions.sort(key=lambda position: previous_balances[position])
+        self._record_eliminations(
+            [(seats[i], players[i]) for i in busted_positions],
+            opponent_hand,
+            board_cards,
+            int(self.active_players) + len(busted_positions),
+            hand_number,
+        )
 
         # Check if tournament has finished after pot distribution
         self._check_tournament_finished()
+        self.state_version += u256(1)
 
         return {
-            "hand_winner_index": winner_index,
-            "tie_players": tie_players,
+            "hand_number": hand_number,
+            "hand_winner_index": winner_seat,
+            "tie_players": tie_seats,
             "is_tie": winner_index < 0,
             "pot_distributed": pot_amount,
             "player_balances": [int(b) for b in self.player_balances],
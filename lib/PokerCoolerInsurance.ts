@@ -76,6 +76,27 @@ export class PokerCoolerInsurance {
     return txHash;
   }
 
+  async purchaseInsuranceBatch(
+    tournamentAddress: string,
+    registrationDate: string,
+    playerAddresses: string[]
+  ): Promise<string> {
+    const client = this.getClient();
+    const txHash = await client.writeContract({
+      address: this.contractAddress as Address,
+      functionName: "purchase_insurance_batch",
+      args: [tournamentAddress, registrationDate, playerAddresses],
+      value: BigInt(0),
+    });
+    await client.waitForTransactionReceipt({
+      hash: txHash,
+      status: TransactionStatus.FINALIZED,
+      interval: 10000,
+      retries: 20,
+    });
+    return txHash;
+  }
+
   async getTournamentInfo(tournamentUrl: string): Promise<TournamentInfo> {
     const client = this.getClient();
     const result = await client.readContract({
@@ -16,8 +16,11 @@ export interface TournamentState {
   last_pot_distribution: number[];
   tournament_finished: boolean;
   tournament_winner_index: number;
+  state_version?: number;
 }
 
+export type TournamentStateField = Exclude<keyof TournamentState, "state_version">;
+
 export interface LastWinnerInfo {
   player_hands: string[];
   board_cards: string;
@@ -291,6 +294,28 @@ export class PokerTournament {
     };
   }
 
+  async getStateIfChanged(
+    sinceVersion: number,
+    fields: TournamentStateField[] = []
+  ): Promise<Partial<TournamentState> | null> {
+    if (!this.contractAddress) {
+      throw new Error("Contract address is required. Please deploy the contract first.");
+    }
+
+    const client = this.getClient();
+    const result = await client.readContract({
+      address: this.contractAddress as Address,
+      functionName: "get_state_if_changed",
+      args: [sinceVersion, fields],
+    });
+
+    // null means nothing changed since sinceVersion
+    if (result === null || result === undefined) {
+      return null;
+    }
+    return result as unknown as Partial<TournamentState>;
+  }
+
   async getLastWinner(): Promise<LastWinnerInfo> {
     if (!this.contractAddress) {
       throw new Error("Contract address is required. Please deploy the contract first.");
@@ -0,0 +1,48 @@
+"""
+Benchmarks for the ICM engine at typical final-table and field sizes.
+
+Run with:
+    python -m test.benchmark_icm
+"""
+
+import time
+
+from contracts.icm import icm_equities
+
+
+def make_stacks(player_count: int) -> list[int]:
+    """Uneven but deterministic stacks, from short stack to chip leader."""
+    return [1000 + (i * 7919) % 20000 for i in range(player_count)]
+
+
+def make_payouts(paid_places: int) -> list[int]:
+    """A top-heavy payout table."""
+    return [10000 // (place + 1) for place in range(paid_places)]
+
+
+BENCHMARKS = [
+    # (label, players, paid places)
+    ("10-player final table, 10 paid (exact)", 10, 10),
+    ("20-player field, 3 paid (exact)", 20, 3),
+    ("20-player field, 9 paid (exact)", 20, 9),
+    ("20-player field, 20 paid (exact, worst case)", 20, 20),
+    ("200-player field, 20 paid (Monte Carlo)", 200, 20),
+]
+
+
+def main() -> None:
+    for label, player_count, paid_places in BENCHMARKS:
+        stacks = make_stacks(player_count)
+        payouts = make_payouts(paid_places)
+
+        start = time.perf_counter()
+        equities = icm_equities(stacks, payouts)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"{label:45s} {elapsed * 1000:10.1f} ms   pool check {sum(equities):.1f} / {sum(payouts)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from gltest import get_contract_factory, default_account
+from gltest.helpers import load_fixture
+import gltest.assertions
+import gltest.glchain.contract
+from test.assertions_fix import (
+    tx_execution_succeeded,
+    tx_execution_failed as fixed_tx_execution_failed,
+)
+
+# Patch the assertions to handle leader_receipt as list (can be list or dict)
+gltest.assertions.tx_execution_succeeded = tx_execution_succeeded
+gltest.assertions.tx_execution_failed = fixed_tx_execution_failed
+# Also patch in the contract module since it imports the function directly
+gltest.glchain.contract.tx_execution_failed = fixed_tx_execution_failed
+
+# Create alias for easier use in tests
+tx_execution_failed = fixed_tx_execution_failed
+
+HOLDER_A = "0x2000000000000000000000000000000000000001"
+HOLDER_B = "0x2000000000000000000000000000000000000002"
+HOLDER_C = "0x2000000000000000000000000000000000000003"
+
+
+def deploy_contract():
+    """Deploy the LlmErc20 contract with 1000 coins for the deployer and verify initial state."""
+    factory = get_contract_factory("LlmErc20")
+    contract = factory.deploy(args=[1000])
+
+    assert contract.get_total_supply(args=[]) == 1000
+    assert contract.get_holder_count(args=[]) == 1
+    assert contract.get_balance_of(args=[default_account().address]) == 1000
+
+    return contract
+
+
+def test_mint_updates_supply_and_holders():
+    """Test that minting to a new address grows both the supply and the holder count."""
+    contract = load_fixture(deploy_contract)
+
+    result = contract.mint(args=[500, HOLDER_A])
+    assert tx_execution_succeeded(result)
+
+    assert contract.get_total_supply(args=[]) == 1500
+    assert contract.get_holder_count(args=[]) == 2
+    assert contract.get_balance_of(args=[HOLDER_A]) == 500
+
+
+def test_transfer_batch_updates_holders():
+    """Test that a batch transfer conserves supply and the sender drops out when emptied."""
+    contract = load_fixture(deploy_contract)
+    owner = default_account().address
+
+    result = contract.transfer_batch(args=[[300, 200, 500], [HOLDER_B, HOLDER_C, HOLDER_B]])
+    assert tx_execution_succeeded(result)
+
+    assert contract.get_balance_of(args=[HOLDER_B]) == 800
+    assert contract.get_balance_of(args=[HOLDER_C]) == 200
+    assert contract.get_balance_of(args=[owner]) == 0
+
+    # The owner's balance went to zero, so the holders are now B and C
+    assert contract.get_total_supply(args=[]) == 1000
+    assert contract.get_holder_count(args=[]) == 2
+
+
+def test_transfer_batch_rejects_over_balance():
+    """Test that a batch whose total exceeds the sender's balance moves nothing."""
+    contract = load_fixture(deploy_contract)
+    owner = default_account().address
+
+    # Each transfer fits on its own, but together they exceed the balance
+    result = contract.transfer_batch(args=[[600, 600], [HOLDER_B, HOLDER_C]])
+    assert tx_execution_failed(result)
+
+    assert contract.get_balance_of(args=[owner]) == 1000
+    assert contract.get_balance_of(args=[HOLDER_B]) == 0
+    assert contract.get_holder_count(args=[]) == 1
+
+
+def test_get_events_paging():
+    """Test that balance changes are appended to the event feed and can be paged."""
+    contract = load_fixture(deploy_contract)
+    owner = default_account().address
+
+    assert tx_execution_succeeded(contract.mint(args=[500, HOLDER_A]))
+    assert tx_execution_succeeded(contract.transfer_batch(args=[[1000], [HOLDER_B]]))
+
+    # Deployment mint, mint to A, then the batch: B receives and the owner is emptied
+    first_page = contract.get_events(args=[1, 2])
+    assert first_page["event_count"] == 4
+    assert [event["seq"] for event in first_page["events"]] == [1, 2]
+    assert [event["kind"] for event in first_page["events"]] == ["mint", "mint"]
+    assert first_page["events"][1]["account"] == HOLDER_A
+    assert first_page["events"][1]["balance"] == 500
+
+    second_page = contract.get_events(args=[3, 2])
+    assert [event["kind"] for event in second_page["events"]] == ["transfer", "transfer"]
+    balances = {event["account"]: event["balance"] for event in second_page["events"]}
+    assert balances == {HOLDER_B: 1000, owner: 0}
+
+    # Polling past the end returns no events
+    assert contract.get_events(args=[5, 10])["events"] == []
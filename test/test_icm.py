@@ -0,0 +1,106 @@
+import itertools
+
+import pytest
+
+from contracts import icm
+from contracts.icm import (
+    EXACT_ICM_MAX_PLAYERS,
+    icm_equities,
+    icm_exact,
+    icm_monte_carlo,
+)
+
+
+def brute_force_icm(stacks, payouts):
+    """Reference ICM that enumerates every finishing order."""
+    equities = [0.0] * len(stacks)
+    for order in itertools.permutations(range(len(stacks))):
+        probability = 1.0
+        remaining_chips = sum(stacks)
+        for i in order:
+            probability *= stacks[i] / remaining_chips
+            remaining_chips -= stacks[i]
+        for place, i in enumerate(order[: len(payouts)]):
+            equities[i] += probability * payouts[place]
+    return equities
+
+
+def test_icm_exact_matches_brute_force():
+    """Test that the bitmask DP gives the same equities as enumerating every order."""
+    stacks = [5000, 3000, 1500, 800, 200, 1200]
+    payouts = [500, 300, 150, 50]
+
+    assert icm_exact(stacks, payouts) == pytest.approx(brute_force_icm(stacks, payouts))
+
+
+def test_icm_exact_conserves_prize_pool():
+    """Test that equities sum to the paid prize pool."""
+    stacks = [1000 * (i + 1) for i in range(12)]
+    payouts = [600, 300, 100]
+
+    assert sum(icm_exact(stacks, payouts)) == pytest.approx(1000)
+
+
+def test_icm_equal_stacks_split_evenly():
+    """Test that equal stacks have equal equity."""
+    equities = icm_exact([1000, 1000, 1000, 1000], [50, 30, 20])
+
+    assert equities == pytest.approx([25, 25, 25, 25])
+
+
+def test_icm_equities_busted_players_get_nothing():
+    """Test that players without chips get no equity and do not take paid places."""
+    equities = icm_equities([0, 1000, 3000, 0], [70, 30])
+
+    assert equities[0] == 0
+    assert equities[3] == 0
+    assert equities[1] + equities[2] == pytest.approx(100)
+    assert equities[2] > equities[1]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def monte_carlo_backend(request, monkeypatch):
+    """Run a test against the vectorized numpy estimator and the pure-Python fallback."""
+    if request.param == "numpy":
+        numpy = pytest.importorskip("numpy")
+        monkeypatch.setattr(icm, "np", numpy)
+    else:
+        monkeypatch.setattr(icm, "np", None)
+    return request.param
+
+
+def test_icm_monte_carlo_close_to_exact(monte_carlo_backend):
+    """Test that the Monte Carlo estimator converges to the exact equities."""
+    stacks = [5000, 3000, 1500, 800, 200, 1200]
+    payouts = [500, 300, 150, 50]
+
+    estimate = icm_monte_carlo(stacks, payouts, trials=40000, seed=7)
+
+    assert estimate == pytest.approx(icm_exact(stacks, payouts), abs=10)
+
+
+def test_icm_monte_carlo_is_reproducible(monte_carlo_backend):
+    """Test that the same seed gives the same estimate."""
+    stacks = [300, 200, 100]
+    payouts = [60, 40]
+
+    assert icm_monte_carlo(stacks, payouts, trials=1000, seed=3) == icm_monte_carlo(
+        stacks, payouts, trials=1000, seed=3
+    )
+
+
+def test_icm_equities_switches_to_monte_carlo_for_large_fields():
+    """Test that fields above the exact limit are still priced and conserve the pool."""
+    stacks = [100 + i for i in range(EXACT_ICM_MAX_PLAYERS + 5)]
+    payouts = [500, 300, 200]
+
+    equities = icm_equities(stacks, payouts, trials=2000)
+
+    assert len(equities) == len(stacks)
+    assert sum(equities) == pytest.approx(1000)
+
+
+def test_icm_rejects_negative_stacks():
+    """Test that negative stacks are rejected."""
+    with pytest.raises(ValueError):
+        icm_equities([100, -1], [10])
@@ -204,6 +204,25 @@ def test_mint_validation():
     assert tx_execution_failed(result)
 
 
+
+def test_mint_rejects_values_too_large_to_pack():
+    """Test that pot sizes and opponent counts beyond the packed storage fields are rejected."""
+    contract = load_fixture(deploy_contract)
+    account = default_account()
+
+    def mint(pot_size, opponents_count):
+        return contract.mint(
+            args=[account.address, "Big Pot", "Description", 1, 5, 5, 5, 5, False, pot_size, opponents_count]
+        )
+
+    # The largest pot that fits above the token ID in a leaderboard entry
+    assert tx_execution_succeeded(mint(2**192 - 1, 1))
+    assert contract.get_metadata(args=[0])["pot_size"] == 2**192 - 1
+
+    assert tx_execution_failed(mint(2**192, 1))
+    assert tx_execution_failed(mint(100, 2**239))
+    assert contract.total_supply_count(args=[]) == 1
+
 def test_transfer_validation():
     """Test that transfer validates ownership."""
     contract = load_fixture(deploy_contract)
@@ -226,3 +245,375 @@ def test_transfer_validation():
 
     # Note: Testing transfer from wrong owner would require calling from a different account context
     # which depends on how gltest handles account switching
+
+
+def test_tokens_of_owner_after_transfers():
+    """Test that the owner index stays consistent when tokens leave the middle of a wallet."""
+    contract = load_fixture(deploy_contract)
+    account1 = default_account()
+    account2 = default_account(1)
+
+    for i in range(4):
+        result = contract.mint(
+            args=[
+                account1.address,
+                f"Trophy #{i}",
+                f"Hand winner trophy {i}",
+                30000 + i,  # block_number
+                5,  # lucky
+                5,  # skill
+                5,  # value_extraction
+            ]
+        )
+        assert tx_execution_succeeded(result)
+
+    # Move tokens 1 and 3 out; token 3 is swapped into the slot freed by token 1
+    assert tx_execution_succeeded(contract.transfer(args=[account2.address, 1]))
+    assert tx_execution_succeeded(contract.transfer(args=[account2.address, 3]))
+
+    assert contract.tokens_of_owner(args=[account1.address]) == [0, 2]
+    assert contract.tokens_of_owner(args=[account2.address]) == [1, 3]
+    assert contract.balance_of(args=[account1.address]) == 2
+    assert contract.balance_of(args=[account2.address]) == 2
+
+
+def test_mint_batch():
+    """Test minting several NFTs in one transaction with contiguous token IDs."""
+    contract = load_fixture(deploy_contract)
+    account1 = default_account()
+    account2 = default_account(1)
+
+    entries = [
+        {
+            "to_address": address,
+            "name": f"Trophy #{i}",
+            "description": f"Hand winner trophy {i}",
+            "block_number": 40000 + i,
+            "lucky": 7,
+            "skill": 6,
+            "value_extraction": 5,
+            "pot_size": 100 * (i + 1),
+        }
+        for i, address in enumerate([account1.address, account2.address, account1.address])
+    ]
+    result = contract.mint_batch(args=[entries])
+    assert tx_execution_succeeded(result)
+
+    assert contract.total_supply_count(args=[]) == 3
+    assert contract.tokens_of_owner(args=[account1.address]) == [0, 2]
+    assert contract.tokens_of_owner(args=[account2.address]) == [1]
+    assert contract.get_metadata(args=[2])["pot_size"] == 300
+
+    # One invalid entry rejects the whole batch
+    entries[1]["lucky"] = 11
+    result = contract.mint_batch(args=[entries])
+    assert tx_execution_failed(result)
+    assert contract.total_supply_count(args=[]) == 3
+
+
+def test_packed_scores_round_trip():
+    """Test that the poker scores read back unchanged from the packed storage field."""
+    contract = load_fixture(deploy_contract)
+    account = default_account()
+
+    result = contract.mint(
+        args=[
+            account.address,
+            "Royal Flush",
+            "Rivered a royal flush",
+            50000,  # block_number
+            10,  # lucky
+            3,  # skill
+            7,  # value_extraction
+            10,  # hand_strength
+            True,  # bluff_success
+            2500,  # pot_size
+            5,  # opponents_count
+        ]
+    )
+    assert tx_execution_succeeded(result)
+
+    metadata = contract.get_metadata(args=[0])
+    assert metadata["lucky"] == 10
+    assert metadata["skill"] == 3
+    assert metadata["value_extraction"] == 7
+    assert metadata["hand_strength"] == 10
+    assert metadata["bluff_success"] == True
+    assert metadata["pot_size"] == 2500
+    assert metadata["opponents_count"] == 5
+
+    token = contract.get_all_tokens(args=[])["0"]
+    assert token["skill"] == 3
+    assert token["opponents_count"] == 5
+
+
+def test_query_tokens_by_attribute():
+    """Test that attribute queries intersect the score buckets and page with a cursor."""
+    contract = load_fixture(deploy_contract)
+    account = default_account()
+
+    # (lucky, bluff_success, pot_size) of each trophy
+    trophies = [(10, False, 500), (10, True, 2000), (4, True, 3000), (10, True, 800), (10, True, 5000)]
+    entries = [
+        {
+            "to_address": account.address,
+            "name": f"Trophy #{i}",
+            "description": "Hand winner trophy",
+            "block_number": 60000 + i,
+            "lucky": lucky,
+            "skill": 5,
+            "value_extraction": 5,
+            "bluff_success": bluff_success,
+            "pot_size": pot_size,
+        }
+        for i, (lucky, bluff_success, pot_size) in enumerate(trophies)
+    ]
+    assert tx_execution_succeeded(contract.mint_batch(args=[entries]))
+
+    result = contract.query_tokens(args=[{"lucky": 10}, 0, 100])
+    assert result["token_ids"] == [0, 1, 3, 4]
+    assert result["next_cursor"] == -1
+
+    result = contract.query_tokens(args=[{"bluff_success": True, "min_pot_size": 1000}, 0, 100])
+    assert result["token_ids"] == [1, 2, 4]
+
+    # Page through royal-flush-level bluffs two at a time
+    first_page = contract.query_tokens(args=[{"lucky": 10, "bluff_success": True}, 0, 2])
+    assert first_page["token_ids"] == [1, 3]
+    second_page = contract.query_tokens(
+        args=[{"lucky": 10, "bluff_success": True}, first_page["next_cursor"], 2]
+    )
+    assert second_page["token_ids"] == [4]
+    assert second_page["next_cursor"] == -1
+
+    assert contract.query_tokens(args=[{"skill": 0}, 0, 100])["token_ids"] == []
+
+
+def test_get_leaderboard():
+    """Test that leaderboards are served best first with ties ranked by mint order."""
+    contract = load_fixture(deploy_contract)
+    account = default_account()
+
+    # (skill, pot_size) of each trophy
+    trophies = [(6, 300), (9, 100), (6, 900), (2, 900)]
+    entries = [
+        {
+            "to_address": account.address,
+            "name": f"Trophy #{i}",
+            "description": "Hand winner trophy",
+            "block_number": 70000 + i,
+            "lucky": 5,
+            "skill": skill,
+            "value_extraction": 5,
+            "pot_size": pot_size,
+        }
+        for i, (skill, pot_size) in enumerate(trophies)
+    ]
+    assert tx_execution_succeeded(contract.mint_batch(args=[entries]))
+
+    skill_board = contract.get_leaderboard(args=["skill", 3])
+    assert [entry["token_id"] for entry in skill_board] == [1, 0, 2]
+    assert [entry["value"] for entry in skill_board] == [9, 6, 6]
+    assert skill_board[0]["rank"] == 1
+    assert skill_board[0]["owner"] == account.address
+
+    pot_board = contract.get_leaderboard(args=["pot_size", 10])
+    assert [entry["token_id"] for entry in pot_board] == [2, 3, 0, 1]
+
+
+def test_interned_attributes():
+    """Test that tokens minted with the same attributes share one stored blob."""
+    contract = load_fixture(deploy_contract)
+    account = default_account()
+
+    series_attributes = '{"series": "Sunday Major", "season": 3}'
+    for i in range(2):
+        result = contract.mint(
+            args=[
+                account.address,
+                f"Trophy #{i}",
+                "Hand winner trophy",
+                80000 + i,  # block_number
+                5,  # lucky
+                5,  # skill
+                5,  # value_extraction
+                0,  # hand_strength
+                False,  # bluff_success
+                0,  # pot_size
+                0,  # opponents_count
+                series_attributes,
+            ]
+        )
+        assert tx_execution_succeeded(result)
+
+    first = contract.get_metadata(args=[0])
+    second = contract.get_metadata(args=[1])
+    assert first["attributes"] == series_attributes
+    assert first["attributes_hash"] == second["attributes_hash"]
+    assert contract.get_attributes(args=[first["attributes_hash"]]) == series_attributes
+
+
+def test_get_events():
+    """Test that mints and transfers are appended to the event feed in order."""
+    contract = load_fixture(deploy_contract)
+    account1 = default_account()
+    account2 = default_account(1)
+
+    for i in range(2):
+        result = contract.mint(
+            args=[
+                account1.address,
+                f"Trophy #{i}",
+                "Hand winner trophy",
+                90000 + i,  # block_number
+                5,  # lucky
+                5,  # skill
+                5,  # value_extraction
+            ]
+        )
+        assert tx_execution_succeeded(result)
+    assert tx_execution_succeeded(contract.transfer(args=[account2.address, 1]))
+
+    feed = contract.get_events(args=[1, 100])
+    assert feed["event_count"] == 3
+    assert [event["kind"] for event in feed["events"]] == ["mint", "mint", "transfer"]
+    assert [event["seq"] for event in feed["events"]] == [1, 2, 3]
+
+    # Polling from the last seen sequence number + 1 returns only new events
+    new_events = contract.get_events(args=[3, 100])["events"]
+    assert len(new_events) == 1
+    assert new_events[0]["token_id"] == 1
+    assert new_events[0]["from"] == account1.address
+    assert new_events[0]["to"] == account2.address
+
+
+def test_transfer_batch():
+    """Test transferring several NFTs at once and rejecting batches with tokens not owned."""
+    contract = load_fixture(deploy_contract)
+    account1 = default_account()
+    account2 = default_account(1)
+
+    for i in range(3):
+        result = contract.mint(
+            args=[
+                account1.address,
+                f"Trophy #{i}",
+                "Hand winner trophy",
+                95000 + i,  # block_number
+                5,  # lucky
+                5,  # skill
+                5,  # value_extraction
+            ]
+        )
+        assert tx_execution_succeeded(result)
+
+    result = contract.transfer_batch(args=[[account2.address, account2.address], [0, 2]])
+    assert tx_execution_succeeded(result)
+
+    assert contract.tokens_of_owner(args=[account1.address]) == [1]
+    assert contract.tokens_of_owner(args=[account2.address]) == [0, 2]
+
+    # Token 0 is no longer owned by the sender, so nothing in the batch moves
+    result = contract.transfer_batch(args=[[account2.address, account2.address], [1, 0]])
+    assert tx_execution_failed(result)
+    assert contract.owner_of(args=[1]) == account1.address
+
+
+def test_mint_tournament_trophies():
+    """Test minting trophies straight from a tournament's hand history."""
+    contract = load_fixture(deploy_contract)
+    account1 = default_account()
+    account2 = default_account(1)
+
+    tournament = get_contract_factory("PokerTournament").deploy()
+    tournament.set_players(args=[[1000, 1000], [account1.address, account2.address]])
+    hands = [
+        {
+            # Player 0 makes a royal flush
+            "players": ["♠A♠K", "♦2♣7"],
+            "board_cards": "♠Q♠J♠10♦3♥4",
+            "player_bets": [200, 200],
+        },
+        {
+            # Player 1 was behind with the hole cards and hits a straight
+            "players": ["♠A♣A", "♦9♣8"],
+            "board_cards": "♥10♦7♣6♠2♥3",
+            "player_bets": [50, 50],
+        },
+        {
+            # Split pot, no trophy
+            "players": ["♠A♣A", "♥A♦A"],
+            "board_cards": "♥10♦7♣6♠2♥3",
+            "player_bets": [10, 10],
+        },
+    ]
+    assert tx_execution_succeeded(tournament.calculate_winners_batch(args=[hands]))
+
+    result = contract.mint_tournament_trophies(args=[tournament.address, 1, 3])
+    assert tx_execution_succeeded(result)
+
+    assert contract.total_supply_count(args=[]) == 2
+    royal_flush = contract.get_metadata(args=[0])
+    assert royal_flush["owner"] == account1.address
+    assert royal_flush["lucky"] == 10
+    assert royal_flush["hand_strength"] == 10
+    assert royal_flush["pot_size"] == 400
+
+    straight = contract.get_metadata(args=[1])
+    assert straight["owner"] == account2.address
+    assert straight["hand_strength"] == 5
+    assert straight["lucky"] == 6
+
+    # Hands that already have a trophy are skipped
+    result = contract.mint_tournament_trophies(args=[tournament.address, 1, 3])
+    assert tx_execution_succeeded(result)
+    assert contract.total_supply_count(args=[]) == 2
+
+
+def test_mint_tournament_trophies_after_reseating():
+    """Test that trophies go to the address seated when the hand was played, and folded hands are ignored."""
+    contract = load_fixture(deploy_contract)
+    account1 = default_account()
+    account2 = default_account(1)
+    account3 = default_account(2)
+
+    tournament = get_contract_factory("PokerTournament").deploy()
+    tournament.set_players(
+        args=[[1000, 1000, 1000], [account1.address, account2.address, account3.address]]
+    )
+    hands = [
+        {
+            # Player 2 folds, player 0 wins with a flush
+            "players": ["♥A♥K", "♦9♣8", ""],
+            "board_cards": "♥Q♥7♥3♠2♣J",
+            "player_bets": [100, 100, 0],
+        },
+        {
+            # Everyone else folds to player 1's seven-high
+            "players": ["", "♦2♣7", ""],
+            "board_cards": "♥K♦9♣J♠3♥4",
+            "player_bets": [0, 100, 0],
+        },
+    ]
+    assert tx_execution_succeeded(tournament.calculate_winners_batch(args=[hands]))
+
+    # The seats change hands before the trophies are minted
+    tournament.set_players(
+        args=[[1100, 900, 1000], [account2.address, account3.address, account1.address]]
+    )
+
+    result = contract.mint_tournament_trophies(args=[tournament.address, 1, 2])
+    assert tx_execution_succeeded(result)
+
+    assert contract.total_supply_count(args=[]) == 2
+    flush = contract.get_metadata(args=[0])
+    assert flush["owner"] == account1.address
+    assert flush["hand_strength"] == 6
+    assert flush["pot_size"] == 200
+    assert flush["opponents_count"] == 1
+    assert flush["bluff_success"] == False
+
+    uncontested = contract.get_metadata(args=[1])
+    assert uncontested["owner"] == account2.address
+    assert uncontested["opponents_count"] == 0
+    assert uncontested["bluff_success"] == True
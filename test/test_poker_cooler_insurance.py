@@ -406,3 +406,207 @@ def test_contract_balance_calculation():
 
     total_payouts = contract.get_total_payouts(args=[])
     assert total_payouts == 100
+
+
+def test_tournament_buy_in_snapshot_reused():
+    """Test that the buy-in is snapshotted on first real pricing and reused for later purchases."""
+    contract = load_fixture(deploy_contract)
+
+    tournament = get_contract_factory("PokerTournament").deploy()
+    tournament_address = tournament.address
+    player_addresses = [
+        "0x2222222222222222222222222222222222222222",
+        "0x3333333333333333333333333333333333333333",
+        "0x4444444444444444444444444444444444444444",
+    ]
+
+    def purchase(player_address):
+        result = contract.purchase_insurance(
+            args=[tournament_address, "2024-01-15", player_address],
+            wait_interval=10000,
+            wait_retries=15,
+        )
+        assert tx_execution_succeeded(result)
+        policy = contract.get_policy(args=[tournament_address, "2024-01-15", player_address])
+        return policy["tournament_buy_in"]
+
+    # No players registered yet: priced at the default, which is not snapshotted
+    assert purchase(player_addresses[0]) == 10000
+
+    # The first purchase with registered chips takes the snapshot
+    tournament.set_players(args=[[1000, 1000], [player_addresses[1], player_addresses[2]]])
+    assert purchase(player_addresses[1]) == 1000
+
+    # Stacks change, but later purchases keep the snapshot
+    tournament.set_players(args=[[3000, 3000], [player_addresses[1], player_addresses[2]]])
+    assert purchase(player_addresses[2]) == 1000
+
+    # Refreshing takes a new snapshot from the tournament
+    refresh_result = contract.refresh_tournament_buy_in(
+        args=[tournament_address],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(refresh_result)
+    assert contract.get_tournament_info(args=[tournament_address])["tournament_buy_in"] == 3000
+
+
+def test_book_stats_after_purchase():
+    """Test that book statistics are updated when a policy is purchased."""
+    contract = load_fixture(deploy_contract)
+
+    initial_stats = contract.get_book_stats(args=[])
+    assert initial_stats["open_policies"] == 0
+    assert initial_stats["claimed_policies"] == 0
+    assert initial_stats["paid_policies"] == 0
+    assert initial_stats["total_exposure"] == 0
+    assert initial_stats["loss_ratio"] == 0
+
+    tournament_address = "0x1111111111111111111111111111111111111111"
+    purchase_result = contract.purchase_insurance(
+        args=[
+            tournament_address,
+            "2024-01-15",
+            "0x2222222222222222222222222222222222222222",
+        ],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(purchase_result)
+
+    tournament_info = contract.get_tournament_info(args=[tournament_address])
+    stats = contract.get_book_stats(args=[])
+    assert stats["open_policies"] == 1
+    assert stats["total_exposure"] == tournament_info["payout_amount"]
+    assert (
+        contract.get_tournament_exposure(args=[tournament_address])
+        == tournament_info["payout_amount"]
+    )
+
+
+def test_purchase_insurance_batch():
+    """Test purchasing insurance for several players of one tournament in one transaction."""
+    contract = load_fixture(deploy_contract)
+
+    tournament_address = "0x1111111111111111111111111111111111111111"
+    player_addresses = [
+        "0x2222222222222222222222222222222222222222",
+        "0x3333333333333333333333333333333333333333",
+        "0x4444444444444444444444444444444444444444",
+    ]
+
+    batch_result = contract.purchase_insurance_batch(
+        args=[tournament_address, "2024-01-15", player_addresses],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(batch_result)
+
+    tournament_info = contract.get_tournament_info(args=[tournament_address])
+    for player_address in player_addresses:
+        policy = contract.get_policy(args=[tournament_address, "2024-01-15", player_address])
+        assert policy["tournament_buy_in"] == tournament_info["tournament_buy_in"]
+        assert policy["has_claimed"] == False
+
+    stats = contract.get_book_stats(args=[])
+    assert stats["open_policies"] == 3
+    assert stats["total_premiums"] == 3 * tournament_info["insurance_premium"]
+
+
+def test_purchase_insurance_batch_duplicate_player():
+    """Test that a batch with a repeated player address is rejected."""
+    contract = load_fixture(deploy_contract)
+
+    batch_result = contract.purchase_insurance_batch(
+        args=[
+            "0x1111111111111111111111111111111111111111",
+            "2024-01-15",
+            [
+                "0x2222222222222222222222222222222222222222",
+                "0x2222222222222222222222222222222222222222",
+            ],
+        ],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert fixed_tx_execution_failed(batch_result)
+
+    stats = contract.get_book_stats(args=[])
+    assert stats["open_policies"] == 0
+
+
+def test_archive_keeps_open_policies_hot():
+    """Test that archiving only moves resolved policies and leaves open ones readable."""
+    contract = load_fixture(deploy_contract)
+
+    tournament_address = "0x1111111111111111111111111111111111111111"
+    player_address = "0x2222222222222222222222222222222222222222"
+    purchase_result = contract.purchase_insurance(
+        args=[tournament_address, "2024-01-15", player_address],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(purchase_result)
+
+    archive_result = contract.archive_resolved_policies(
+        args=["2099-01-01"],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(archive_result)
+
+    # The open policy was not archived and is still served from the hot map
+    policy = contract.get_policy(args=[tournament_address, "2024-01-15", player_address])
+    assert policy["claim_resolved"] == False
+    assert len(contract.get_player_policies(args=[player_address])) == 1
+
+
+def test_archive_resolved_policy_reads_back_unchanged():
+    """Test that a resolved policy moves to the archive and reads back the same through the views."""
+    contract = load_fixture(deploy_contract)
+
+    player_address = "0x2222222222222222222222222222222222222222"
+    tournament = get_contract_factory("PokerTournament").deploy()
+    tournament.set_players(
+        args=[[1000, 1000], [player_address, "0x3333333333333333333333333333333333333333"]]
+    )
+    tournament_address = tournament.address
+
+    purchase_result = contract.purchase_insurance(
+        args=[tournament_address, "2024-01-15", player_address],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(purchase_result)
+
+    # The player was never eliminated, so the claim resolves without a payout
+    claim_result = contract.file_claim_by_params(
+        args=[tournament_address, player_address, "2024-01-15"],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(claim_result)
+
+    hot_policy = contract.get_policy(args=[tournament_address, "2024-01-15", player_address])
+    hot_player_policies = contract.get_player_policies(args=[player_address])
+    assert hot_policy["claim_resolved"] == True
+    assert hot_policy["tournament_buy_in"] == 1000
+
+    archive_result = contract.archive_resolved_policies(
+        args=["2099-01-01"],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(archive_result)
+
+    # Served from the archive with the same fields as before
+    assert contract.get_policy(args=[tournament_address, "2024-01-15", player_address]) == hot_policy
+    assert contract.get_player_policies(args=[player_address]) == hot_player_policies
+
+    # An archived policy cannot be claimed again
+    claim_result = contract.file_claim_by_params(
+        args=[tournament_address, player_address, "2024-01-15"],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert fixed_tx_execution_failed(claim_result)
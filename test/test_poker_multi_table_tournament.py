@@ -0,0 +1,174 @@
+from gltest import get_contract_factory, default_account
+from gltest.helpers import load_fixture
+import gltest.assertions
+import gltest.glchain.contract
+from test.assertions_fix import (
+    tx_execution_succeeded,
+    tx_execution_failed as fixed_tx_execution_failed,
+)
+
+# Patch the assertions to handle leader_receipt as list (can be list or dict)
+gltest.assertions.tx_execution_succeeded = tx_execution_succeeded
+gltest.assertions.tx_execution_failed = fixed_tx_execution_failed
+# Also patch in the contract module since it imports the function directly
+gltest.glchain.contract.tx_execution_failed = fixed_tx_execution_failed
+
+# Create alias for easier use in tests
+tx_execution_failed = fixed_tx_execution_failed
+
+PLAYER_ADDRESSES = [
+    "0x1000000000000000000000000000000000000001",
+    "0x1000000000000000000000000000000000000002",
+    "0x1000000000000000000000000000000000000003",
+    "0x1000000000000000000000000000000000000004",
+]
+
+
+def deploy_contract():
+    """Deploy the PokerMultiTableTournament contract with two tables of two players."""
+    factory = get_contract_factory("PokerMultiTableTournament")
+    contract = factory.deploy()
+
+    status = contract.get_tournament_status(args=[])
+    assert status["table_count"] == 0
+    assert status["player_count"] == 0
+    assert status["tournament_finished"] == False
+
+    contract.create_table(args=[1])
+    contract.create_table(args=[2])
+    contract.register_players(args=[1, [1000, 1000], PLAYER_ADDRESSES[:2]])
+    contract.register_players(args=[2, [1000, 1000], PLAYER_ADDRESSES[2:]])
+
+    return contract
+
+
+def test_register_players():
+    """Test that players are seated at their tables and share one chip ledger."""
+    contract = load_fixture(deploy_contract)
+
+    status = contract.get_tournament_status(args=[])
+    assert status["table_count"] == 2
+    assert status["player_count"] == 4
+    assert status["active_players"] == 4
+    assert status["total_chips"] == 4000
+
+    table = contract.get_table(args=[1])
+    assert [seat["player_address"] for seat in table["seats"]] == PLAYER_ADDRESSES[:2]
+
+    player = contract.get_player(args=[PLAYER_ADDRESSES[2]])
+    assert player["table_id"] == 2
+    assert player["seat_index"] == 0
+    assert player["chips"] == 1000
+
+
+def test_duplicate_registration():
+    """Test that a player cannot be registered twice."""
+    contract = load_fixture(deploy_contract)
+
+    result = contract.register_players(args=[2, [1000], [PLAYER_ADDRESSES[0]]])
+    assert tx_execution_failed(result)
+
+
+def test_balance_tables():
+    """Test that players can be moved between tables in one write."""
+    contract = load_fixture(deploy_contract)
+
+    result = contract.balance_tables(args=[[PLAYER_ADDRESSES[0]], [2]])
+    assert tx_execution_succeeded(result)
+
+    table_1 = contract.get_table(args=[1])
+    assert [seat["player_address"] for seat in table_1["seats"]] == [PLAYER_ADDRESSES[1]]
+
+    table_2 = contract.get_table(args=[2])
+    assert len(table_2["seats"]) == 3
+
+    player = contract.get_player(args=[PLAYER_ADDRESSES[0]])
+    assert player["table_id"] == 2
+    assert player["seat_index"] == 2
+
+    moved_into_seat = contract.get_player(args=[PLAYER_ADDRESSES[1]])
+    assert moved_into_seat["seat_index"] == 0
+
+
+def test_calculate_winners_eliminates_player():
+    """Test that a busted player leaves the table and gets a finish position."""
+    contract = load_fixture(deploy_contract)
+
+    result = contract.calculate_winners(
+        args=[
+            1,
+            PLAYER_ADDRESSES[:2],
+            ["♦Q♥Q", "♠K♣K"],
+            "♥K♦7♣J♠2♥3",
+            [1000, 1000],
+        ],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    busted = contract.get_player(args=[PLAYER_ADDRESSES[0]])
+    assert busted["is_active"] == False
+    assert busted["finish_position"] == 4
+
+    winner = contract.get_player(args=[PLAYER_ADDRESSES[1]])
+    assert winner["chips"] == 2000
+
+    table = contract.get_table(args=[1])
+    assert [seat["player_address"] for seat in table["seats"]] == [PLAYER_ADDRESSES[1]]
+    assert table["hand_count"] == 1
+
+    status = contract.get_tournament_status(args=[])
+    assert status["active_players"] == 3
+    assert status["total_chips"] == 4000
+
+
+def test_calculate_winners_rejects_duplicate_cards():
+    """Test that a deal which could not come from one deck is rejected before judging."""
+    contract = load_fixture(deploy_contract)
+
+    # ♦K is both in player 1's hand and on the board
+    result = contract.calculate_winners(
+        args=[
+            1,
+            PLAYER_ADDRESSES[:2],
+            ["♦Q♥Q", "♠K♦K"],
+            "♥K♦7♣J♠2♦K",
+            [100, 100],
+        ],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_failed(result)
+
+    assert contract.get_player(args=[PLAYER_ADDRESSES[0]])["chips"] == 1000
+    assert contract.get_table(args=[1])["hand_count"] == 0
+
+
+def test_simultaneous_eliminations_ordered_by_stack():
+    """Test that players busting in the same hand finish in order of starting stack."""
+    contract = load_fixture(deploy_contract)
+
+    short_stack = "0x1000000000000000000000000000000000000005"
+    mid_stack = "0x1000000000000000000000000000000000000006"
+    big_stack = "0x1000000000000000000000000000000000000007"
+    contract.create_table(args=[3])
+    contract.register_players(args=[3, [100, 150, 2000], [short_stack, mid_stack, big_stack]])
+
+    # The mid stack is listed first; the big stack's set of aces busts both others
+    result = contract.calculate_winners(
+        args=[
+            3,
+            [mid_stack, short_stack, big_stack],
+            ["♠Q♥Q", "♦K♥K", "♠A♦A"],
+            "♣A♥J♦9♣4♠2",
+            [150, 100, 200],
+        ],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    # 7 players were active: the short stack finishes 7th, the mid stack 6th
+    assert contract.get_player(args=[short_stack])["finish_position"] == 7
+    assert contract.get_player(args=[mid_stack])["finish_position"] == 6
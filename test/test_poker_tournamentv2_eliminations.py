@@ -82,11 +82,11 @@ def test_single_player_elimination():
     addresses = get_test_addresses(2)
     contract.set_players(args=[[100, 1000], addresses])
 
-    # Player 0: Pair of Kings (K♦K♥ with board)
-    # Player 1: Three Kings (K♠K♦ with board K♠K♦Q♥J♣2♠)
+    # Player 0: Pair of Queens (Q♦Q♥ with board)
+    # Player 1: Three Kings (K♠K♣ with board K♥7♦J♣2♠3♥)
     # Player 1 wins, Player 0 loses and gets eliminated (bets all 100)
-    players = ["♦K♥K", "♠K♦K"]
-    board_cards = "♠K♥Q♦K♣J♠2"
+    players = ["♦Q♥Q", "♠K♣K"]
+    board_cards = "♥K♦7♣J♠2♥3"
     player_bets = [100, 100]  # Player 0 bets all their balance
 
     result = contract.calculate_winners(
@@ -107,8 +107,8 @@ def test_single_player_elimination():
 
     elimination = all_eliminations[0]
     assert elimination["player_index"] == 0
-    assert elimination["player_hand"] == "♦K♥K"
-    assert elimination["opponent_hand"] == "♠K♦K"
+    assert elimination["player_hand"] == "♦Q♥Q"
+    assert elimination["opponent_hand"] == "♠K♣K"
     assert elimination["board_cards"] == board_cards
     assert "is_cooler" in elimination
     assert "hand_rank_player" in elimination
@@ -134,8 +134,8 @@ def test_no_elimination_when_player_already_at_zero():
     addresses = get_test_addresses(2)
     contract.set_players(args=[[0, 1000], addresses])
 
-    players = ["♦K♥K", "♠K♦K"]
-    board_cards = "♠K♥Q♦K♣J♠2"
+    players = ["♦Q♥Q", "♠K♣K"]
+    board_cards = "♥K♦7♣J♠2♥3"
     player_bets = [0, 100]  # Player 0 bets 0 (already eliminated)
 
     result = contract.calculate_winners(
@@ -159,8 +159,8 @@ def test_no_elimination_when_player_still_has_balance():
     contract.set_players(args=[[500, 1000], addresses])
 
     # Player 0 loses but still has balance after the hand
-    players = ["♦K♥K", "♠K♦K"]
-    board_cards = "♠K♥Q♦K♣J♠2"
+    players = ["♦Q♥Q", "♠K♣K"]
+    board_cards = "♥K♦7♣J♠2♥3"
     player_bets = [100, 100]  # Player 0 bets 100, loses, but still has 400
 
     result = contract.calculate_winners(
@@ -190,7 +190,7 @@ def test_multiple_eliminations_same_hand():
     # Player 2 wins (has best hand)
     # Players 0 and 1 both lose and get eliminated
     players = ["♦K♥K", "♠Q♥Q", "♠A♦A"]
-    board_cards = "♠K♥Q♦K♣J♠2"
+    board_cards = "♣A♥A♦7♣3♠2"
     player_bets = [100, 150, 200]  # Players 0 and 1 bet all their balance
 
     result = contract.calculate_winners(
@@ -237,8 +237,8 @@ def test_elimination_across_multiple_hands():
     contract.set_players(args=[[200, 1000, 1000], addresses])
 
     # First hand: Player 0 loses and gets eliminated
-    players_hand1 = ["♦K♥K", "♠K♦K", "♠A♦A"]
-    board_cards_hand1 = "♠K♥Q♦K♣J♠2"
+    players_hand1 = ["♦Q♥Q", "♠K♣K", "♠A♦A"]
+    board_cards_hand1 = "♥K♦7♣J♠2♥3"
     player_bets_hand1 = [200, 100, 100]  # Player 0 bets all
 
     result1 = contract.calculate_winners(
@@ -258,7 +258,7 @@ def test_elimination_across_multiple_hands():
     contract.set_players(args=[[0, 900, 1000], addresses])
 
     players_hand2 = ["♦K♥K", "♠Q♥Q", "♠A♦A"]
-    board_cards_hand2 = "♠A♥Q♦A♣J♠2"
+    board_cards_hand2 = "♣A♥A♦7♣3♠2"
     player_bets_hand2 = [0, 900, 100]  # Player 1 bets all
 
     result2 = contract.calculate_winners(
@@ -295,8 +295,8 @@ def test_elimination_with_tie():
     contract.set_players(args=[[100, 1000, 1000], addresses])
 
     # Players 1 and 2 tie, Player 0 loses and gets eliminated
-    players = ["♦K♥K", "♠K♣K", "♠K♥K"]
-    board_cards = "♠K♠Q♠J♠10♠9"  # All spades - flush for all
+    players = ["♣Q♠J", "♠A♣K", "♥A♦K"]
+    board_cards = "♥9♦8♣5♠4♥2"  # Players 1 and 2 both play ace-king high
     player_bets = [100, 100, 100]  # Player 0 bets all
 
     result = contract.calculate_winners(
@@ -320,7 +320,7 @@ def test_elimination_with_tie():
 
     # In case of tie, opponent_hand should be from one of the tied players
     elimination = all_eliminations[0]
-    assert elimination["opponent_hand"] in ["♠K♣K", "♠K♥K"]
+    assert elimination["opponent_hand"] in ["♠A♣K", "♥A♦K"]
 
 
 def test_elimination_record_fields():
@@ -332,7 +332,7 @@ def test_elimination_record_fields():
     contract.set_players(args=[[100, 1000], addresses])
 
     players = ["♦K♥K", "♠A♦A"]
-    board_cards = "♠K♥Q♦K♣J♠2"
+    board_cards = "♣A♥7♦4♣9♠2"
     player_bets = [100, 100]
 
     result = contract.calculate_winners(
@@ -512,7 +512,7 @@ def test_calculate_winners_fails_when_tournament_finished():
 
     # Play a hand that finishes the tournament (player 0 gets eliminated)
     players = ["♦K♥K", "♠A♦A"]
-    board_cards = "♠K♥Q♦K♣J♠2"
+    board_cards = "♣A♥7♦4♣9♠2"
     player_bets = [100, 100]
 
     result1 = contract.calculate_winners(
@@ -528,7 +528,7 @@ def test_calculate_winners_fails_when_tournament_finished():
 
     # Try to calculate winners again - should fail
     players2 = ["♦K♥K", "♠A♦A"]
-    board_cards2 = "♠K♥Q♦K♣J♠2"
+    board_cards2 = "♣A♥7♦4♣9♠2"
     player_bets2 = [0, 100]
 
     result2 = contract.calculate_winners(
@@ -537,3 +537,371 @@ def test_calculate_winners_fails_when_tournament_finished():
         wait_retries=15,
     )
     assert tx_execution_failed(result2)
+
+
+def test_stack_summary_and_status_views():
+    """Test that the aggregate views track chips and active players across hands."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(3)
+    contract.set_players(args=[[100, 1000, 500], addresses])
+
+    summary = contract.get_stack_summary(args=[])
+    assert summary["player_count"] == 3
+    assert summary["total_chips"] == 1600
+    assert summary["active_players"] == 3
+
+    # Player 0 goes all in and loses
+    players = ["♦Q♥Q", "♠K♣K", "♣5♥4"]
+    board_cards = "♥K♦7♣J♠2♥3"
+    result = contract.calculate_winners(
+        args=[players, board_cards, [100, 100, 0]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    summary = contract.get_stack_summary(args=[])
+    assert summary["total_chips"] == 1600
+    assert summary["active_players"] == 2
+
+    status = contract.get_status(args=[])
+    assert status["tournament_finished"] == False
+    assert status["tournament_winner_index"] == -1
+    assert status["active_players"] == 2
+
+
+def test_calculate_winners_by_address():
+    """Test that a hand can be submitted by player address and only touches those seats."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(3)
+    contract.set_players(args=[[1000, 100, 1000], addresses])
+
+    assert contract.get_player_seat(args=[addresses[2]]) == 2
+
+    # Seats 2 and 1 play the hand; seat 0 sits out
+    result = contract.calculate_winners_by_address(
+        args=[
+            [addresses[2], addresses[1]],
+            ["♠K♣K", "♦Q♥Q"],
+            "♥K♦7♣J♠2♥3",
+            [100, 100],
+        ],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    state = contract.get_state(args=[])
+    assert state["player_balances"] == [1000, 0, 1100]
+    assert state["hand_winner_index"] == 2
+
+    player = contract.get_player_by_address(args=[addresses[1]])
+    assert player["seat_index"] == 1
+    assert player["balance"] == 0
+    assert player["is_eliminated"] == True
+
+    elimination = contract.get_player_elimination(args=[addresses[1]])
+    assert elimination["player_index"] == 1
+
+
+def test_hand_history_paging():
+    """Test that settled hands are appended to the hand history and can be paged."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(2)
+    contract.set_players(args=[[1000, 1000], addresses])
+
+    assert contract.get_hand_count(args=[]) == 0
+
+    for _ in range(2):
+        result = contract.calculate_winners(
+            args=[["♦Q♥Q", "♠K♣K"], "♥K♦7♣J♠2♥3", [100, 100]],
+            wait_interval=10000,
+            wait_retries=15,
+        )
+        assert tx_execution_succeeded(result)
+
+    page = contract.get_hands(args=[1, 10])
+    assert page["hand_count"] == 2
+    assert [hand["hand_number"] for hand in page["hands"]] == [1, 2]
+
+    first_hand = page["hands"][0]
+    assert first_hand["seats"] == [0, 1]
+    assert first_hand["player_hands"] == ["♦Q♥Q", "♠K♣K"]
+    assert first_hand["board_cards"] == "♥K♦7♣J♠2♥3"
+    assert first_hand["pot"] == 200
+    assert sum(first_hand["deltas"]) == 0
+    assert [a.lower() for a in first_hand["player_addresses"]] == [a.lower() for a in addresses]
+
+    second_page = contract.get_hands(args=[2, 10])
+    assert [hand["hand_number"] for hand in second_page["hands"]] == [2]
+
+
+
+def test_hand_history_records_winner_past_position_255():
+    """Test that a win at a hand position above 255 is recorded and read back."""
+    contract = load_fixture(deploy_contract)
+
+    seat_count = 300
+    addresses = [f"0x{i + 1:040x}" for i in range(seat_count)]
+    contract.set_players(args=[[1000] * seat_count, addresses])
+
+    # Everyone folds except the first and last seats; the last seat has the better hand
+    players = [""] * seat_count
+    players[0] = "♦2♣7"
+    players[seat_count - 1] = "♠A♣A"
+    player_bets = [0] * seat_count
+    player_bets[0] = 100
+    player_bets[seat_count - 1] = 100
+
+    # The batch is judged deterministically, so no 300-player prompt is sent
+    hands = [{"players": players, "board_cards": "♥K♦9♣J♠3♥4", "player_bets": player_bets}]
+    result = contract.calculate_winners_batch(args=[hands])
+    assert tx_execution_succeeded(result)
+
+    hand = contract.get_hands(args=[1, 1])["hands"][0]
+    assert hand["winner_positions"] == [seat_count - 1]
+    assert hand["deltas"][seat_count - 1] == 100
+    assert hand["deltas"][0] == -100
+
+def test_get_state_if_changed():
+    """Test that polling with the current state version returns nothing."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(2)
+    contract.set_players(args=[[1000, 1000], addresses])
+
+    state = contract.get_state_if_changed(args=[-1, ["player_balances", "pot"]])
+    assert state["player_balances"] == [1000, 1000]
+    assert state["pot"] == 0
+    assert "player_hands" not in state
+
+    version = state["state_version"]
+    assert contract.get_state_if_changed(args=[version, []]) is None
+
+    result = contract.calculate_winners(
+        args=[["♦Q♥Q", "♠K♣K"], "♥K♦7♣J♠2♥3", [100, 100]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    state = contract.get_state_if_changed(args=[version, ["pot"]])
+    assert state["state_version"] > version
+    assert state["pot"] == 200
+
+
+def test_eliminations_paged_with_finish_positions():
+    """Test that eliminations are kept in bust-out order with finish positions and can be paged."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(3)
+    contract.set_players(args=[[150, 100, 2000], addresses])
+
+    # Player 2 makes a set of aces; players 0 and 1 bust in the same hand
+    # and the smaller stack finishes last
+    result = contract.calculate_winners(
+        args=[["♦K♥K", "♠Q♥Q", "♠A♦A"], "♣A♥J♦9♣4♠2", [150, 100, 200]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    assert contract.get_elimination_count(args=[]) == 2
+
+    first_page = contract.get_all_eliminations(args=[0, 1])
+    assert len(first_page) == 1
+    assert first_page[0]["player_index"] == 1
+    assert first_page[0]["finish_position"] == 3
+    assert first_page[0]["hand_number"] == 1
+
+    second_page = contract.get_all_eliminations(args=[1, 1])
+    assert len(second_page) == 1
+    assert second_page[0]["player_index"] == 0
+    assert second_page[0]["finish_position"] == 2
+
+
+def test_calculate_winners_batch():
+    """Test that several hands are settled in order within one transaction."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(3)
+    contract.set_players(args=[[100, 150, 2000], addresses])
+
+    hands = [
+        {
+            "players": ["♦K♥K", "♠Q♥Q", "♠A♦A"],
+            "board_cards": "♣K♥J♦9♣4♠2",
+            "player_bets": [50, 50, 50],
+        },
+        {
+            "players": ["♦K♥K", "♠Q♥Q", "♠A♦A"],
+            "board_cards": "♣K♥J♦9♣4♠2",
+            "player_bets": [50, 100, 100],
+        },
+    ]
+    result = contract.calculate_winners_batch(
+        args=[hands],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    # Player 0 makes a set of kings and wins both hands; player 1 busts in the second
+    state = contract.get_state(args=[])
+    assert state["player_balances"] == [400, 0, 1850]
+    assert state["pot"] == 250
+
+    assert contract.get_hand_count(args=[]) == 2
+    all_eliminations = contract.get_all_eliminations(args=[])
+    assert len(all_eliminations) == 1
+    assert all_eliminations[0]["player_index"] == 1
+    assert all_eliminations[0]["hand_number"] == 2
+
+
+def test_calculate_winners_rejects_duplicate_and_malformed_cards():
+    """Test that hands which could not come from a single deck are rejected before judging."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(2)
+    contract.set_players(args=[[1000, 1000], addresses])
+
+    # ♦K is both in player 1's hand and on the board
+    result = contract.calculate_winners(
+        args=[["♦Q♥Q", "♠K♦K"], "♥K♦7♣J♠2♦K", [100, 100]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_failed(result)
+
+    # Unknown rank
+    result = contract.calculate_winners(
+        args=[["♦Q♥Q", "♠K♣X"], "♥K♦7♣J♠2♥3", [100, 100]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_failed(result)
+
+    # Duplicate card in the second hand of a batch rejects the whole batch
+    hands = [
+        {
+            "players": ["♦Q♥Q", "♠K♣K"],
+            "board_cards": "♥K♦7♣J♠2♥3",
+            "player_bets": [100, 100],
+        },
+        {
+            "players": ["♦Q♥Q", "♦Q♣K"],
+            "board_cards": "♥K♦7♣J♠2♥3",
+            "player_bets": [100, 100],
+        },
+    ]
+    result = contract.calculate_winners_batch(
+        args=[hands],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_failed(result)
+
+    state = contract.get_state(args=[])
+    assert state["player_balances"] == [1000, 1000]
+    assert contract.get_hand_count(args=[]) == 0
+
+
+def test_calculate_winners_with_folded_player():
+    """Test that a folded player (empty hand, bet 0) is skipped instead of rejected."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = get_test_addresses(3)
+    contract.set_players(args=[[1000, 1000, 1000], addresses])
+
+    # Player 1 folded; player 2's set of kings beats player 0's queens
+    result = contract.calculate_winners(
+        args=[["♦Q♥Q", "", "♠K♣K"], "♥K♦7♣J♠2♥3", [100, 0, 100]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    state = contract.get_state(args=[])
+    assert state["player_balances"] == [900, 1000, 1100]
+
+    # Folded player 0 in a batch
+    hands = [
+        {
+            "players": ["", "♦Q♥Q", "♠K♣K"],
+            "board_cards": "♥K♦7♣J♠2♥3",
+            "player_bets": [0, 100, 100],
+        },
+    ]
+    result = contract.calculate_winners_batch(
+        args=[hands],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    state = contract.get_state(args=[])
+    assert state["player_balances"] == [900, 900, 1200]
+    assert contract.get_hands(args=[2, 1])["hands"][0]["player_hands"] == ["", "♦Q♥Q", "♠K♣K"]
+
+    # A folded player cannot have chips in the pot
+    result = contract.calculate_winners(
+        args=[["♦Q♥Q", "", "♠K♣K"], "♥K♦7♣J♠2♥3", [100, 50, 100]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_failed(result)
+
+
+
+def test_last_hand_state_by_address():
+    """Test that a hand by address clears only the previous hand's seats and keeps the table-sized arrays."""
+    contract = load_fixture(deploy_contract)
+
+    addresses = [f"0x{i + 1:040x}" for i in range(4)]
+    contract.set_players(args=[[1000, 1000, 1000, 1000], addresses])
+
+    result = contract.calculate_winners_by_address(
+        args=[addresses[:3], ["♦Q♥Q", "♠K♣K", "♣5♥4"], "♥K♦7♣J♠2♥3", [100, 100, 100]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    # Seats 1 and 3 play next; seat 1's kings beat seat 3's queens
+    hands = [
+        {
+            "player_addresses": [addresses[1], addresses[3]],
+            "players": ["♠K♣K", "♠Q♣Q"],
+            "board_cards": "♥K♦7♣J♠2♥3",
+            "player_bets": [50, 50],
+        },
+    ]
+    result = contract.calculate_winners_batch(args=[hands])
+    assert tx_execution_succeeded(result)
+
+    state = contract.get_state(args=[])
+    assert state["player_hands"] == ["", "♠K♣K", "", "♠Q♣Q"]
+    assert state["last_pot_distribution"] == [0, 100, 0, 0]
+
+def test_hand_history_records_large_chip_changes():
+    """Test that chip changes beyond 64 bits are recorded and read back exactly."""
+    contract = load_fixture(deploy_contract)
+
+    big_stack = 2**70
+    addresses = get_test_addresses(2)
+    contract.set_players(args=[[big_stack, big_stack], addresses])
+
+    result = contract.calculate_winners(
+        args=[["♦Q♥Q", "♠K♣K"], "♥K♦7♣J♠2♥3", [big_stack, big_stack]],
+        wait_interval=10000,
+        wait_retries=15,
+    )
+    assert tx_execution_succeeded(result)
+
+    hand = contract.get_hands(args=[1, 1])["hands"][0]
+    assert hand["seats"] == [0, 1]
+    assert hand["deltas"] == [-big_stack, big_stack]
+    assert hand["pot"] == 2 * big_stack